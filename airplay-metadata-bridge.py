@@ -8,18 +8,32 @@ import os
 import sys
 import json
 import time
-import struct
+import select
 import tempfile
-import shutil
 from pathlib import Path
 from datetime import datetime
 
+# orjson serializes these small state dicts 5-6x faster than stdlib json;
+# fall back to stdlib if it isn't installed
+try:
+    import orjson
+
+    def _json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_dumps(data):
+        return json.dumps(data, indent=2).encode('utf-8')
+
 # Configuration
 PIPE_PATH = "/tmp/shairport-sync-metadata"
 STATE_FILE = "/home/admin/wallclock/airplay_now_playing.json"
 ARTWORK_FILE = "/home/admin/wallclock/airplay_artwork.jpg"
 STALE_TIMEOUT = 10  # seconds before marking as inactive
 
+# Output directories are created once here, not on every write
+Path(STATE_FILE).parent.mkdir(parents=True, exist_ok=True)
+Path(ARTWORK_FILE).parent.mkdir(parents=True, exist_ok=True)
+
 # Current state
 state = {
     "active": False,
@@ -32,123 +46,214 @@ state = {
 }
 
 last_update = 0
+last_activity = 0.0  # time of the last record read off the pipe
+state_dirty = False  # set when decode_metadata_item changes state
+_last_payload = b''
 
 def write_state_atomic(data):
     """Write state file atomically using temp file + rename"""
-    global last_update
+    global last_update, _last_payload
+
+    # Serialize once (without the timestamp) and skip the disk write +
+    # rename entirely when the payload is byte-identical to the last one
+    payload = _json_dumps({k: v for k, v in data.items() if k != "updated_at"})
+    if payload == _last_payload:
+        return
+    _last_payload = payload
+
     data["updated_at"] = datetime.now().isoformat()
-    
+
     state_path = Path(STATE_FILE)
-    state_path.parent.mkdir(parents=True, exist_ok=True)
-    
+
     # Write to temp file then rename (atomic on POSIX)
-    temp_path = state_path.with_suffix('.tmp')
-    with open(temp_path, 'w') as f:
-        json.dump(data, f, indent=2)
-    shutil.move(str(temp_path), str(state_path))
+    temp_path = str(state_path.with_suffix('.tmp'))
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, _json_dumps(data))
+    finally:
+        os.close(fd)
+    os.replace(temp_path, str(state_path))
     last_update = time.time()
 
-def save_artwork(data):
-    """Save artwork to file"""
+def save_artwork(pipe_fd, length):
+    """Stream artwork from the pipe straight to the artwork file.
+
+    Uses os.splice (zero-copy in the kernel, Linux) when available so a
+    multi-MB JPEG never materializes as a Python bytes object.
+    """
+    global state_dirty
     artwork_path = Path(ARTWORK_FILE)
-    artwork_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    temp_path = artwork_path.with_suffix('.tmp')
-    with open(temp_path, 'wb') as f:
-        f.write(data)
-    shutil.move(str(temp_path), str(artwork_path))
+    temp_path = str(artwork_path.with_suffix('.tmp'))
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        remaining = length
+        if hasattr(os, 'splice'):
+            while remaining > 0:
+                moved = os.splice(pipe_fd, fd, remaining)
+                if moved == 0:
+                    break
+                remaining -= moved
+        else:
+            while remaining > 0:
+                chunk = os.read(pipe_fd, min(remaining, 65536))
+                if not chunk:
+                    break
+                os.write(fd, chunk)
+                remaining -= len(chunk)
+        # Make sure the bytes are durable before the rename publishes them
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(temp_path, str(artwork_path))
     state["has_artwork"] = True
+    state_dirty = True
 
-def clear_artwork():
+def clear_artwork(force=False):
     """Remove artwork file"""
+    # Skip the unlink syscall when there is already no artwork
+    # (common on repeated pend events)
+    if not force and not state["has_artwork"]:
+        return
     try:
         Path(ARTWORK_FILE).unlink(missing_ok=True)
     except:
         pass
     state["has_artwork"] = False
 
+def _set_field(field):
+    """Handler that decodes the payload into a state field"""
+    def handler(data):
+        state[field] = data.decode('utf-8', errors='replace')
+    return handler
+
+def _on_pbeg(data):  # Playback begin
+    state["active"] = True
+    clear_artwork()  # Clear old artwork on new track (no-op if none)
+
+def _on_pend(data):  # Playback end
+    state["active"] = False
+    state["title"] = ""
+    state["artist"] = ""
+    state["album"] = ""
+    clear_artwork()
+
+def _on_prsm(data):  # Playback resume
+    state["active"] = True
+
+# O(1) dispatch on (type, code) - 'core' is basic metadata, 'ssnc' is
+# shairport-sync specific. Handlers decode payloads only when they need to;
+# PICT is streamed to disk in read_metadata_pipe and never reaches here.
+# pfls (pause/flush) is intentionally absent: don't clear state on pause.
+_HANDLERS = {
+    (b'core', b'asal'): _set_field("album"),
+    (b'core', b'asar'): _set_field("artist"),
+    (b'core', b'minm'): _set_field("title"),
+    (b'ssnc', b'snua'): _set_field("source"),
+    (b'ssnc', b'pbeg'): _on_pbeg,
+    (b'ssnc', b'pend'): _on_pend,
+    (b'ssnc', b'prsm'): _on_prsm,
+}
+
 def decode_metadata_item(type_code, code, data):
     """Decode a metadata item from shairport-sync"""
-    global state
-    
-    # Type codes: 'core' for basic metadata, 'ssnc' for shairport-sync specific
-    type_str = type_code.decode('ascii', errors='ignore')
-    code_str = code.decode('ascii', errors='ignore')
-    
+    global state_dirty
+
+    handler = _HANDLERS.get((type_code, code))
+    if handler is None:
+        return
     try:
-        if type_str == 'core':
-            if code_str == 'asal':  # Album
-                state["album"] = data.decode('utf-8', errors='ignore')
-            elif code_str == 'asar':  # Artist
-                state["artist"] = data.decode('utf-8', errors='ignore')
-            elif code_str == 'minm':  # Title/Name
-                state["title"] = data.decode('utf-8', errors='ignore')
-                
-        elif type_str == 'ssnc':
-            if code_str == 'PICT':  # Picture/Artwork
-                if len(data) > 100:  # Sanity check - artwork should be substantial
-                    save_artwork(data)
-            elif code_str == 'snua':  # Source name/user agent
-                state["source"] = data.decode('utf-8', errors='ignore')
-            elif code_str == 'pbeg':  # Playback begin
-                state["active"] = True
-                clear_artwork()  # Clear old artwork on new track
-            elif code_str == 'pend':  # Playback end
-                state["active"] = False
-                state["title"] = ""
-                state["artist"] = ""
-                state["album"] = ""
-                clear_artwork()
-            elif code_str == 'prsm':  # Playback resume
-                state["active"] = True
-            elif code_str == 'pfls':  # Playback flush (pause/stop)
-                pass  # Don't clear state on pause
-                
+        handler(data)
+        state_dirty = True
     except Exception as e:
-        print(f"Error decoding {type_str}/{code_str}: {e}", file=sys.stderr)
+        print(f"Error decoding {type_code}/{code}: {e}", file=sys.stderr)
+
+def _read_exact_into(fd, buf, length):
+    """Fill buf[:length] from fd; returns the number of bytes actually read"""
+    mv = memoryview(buf)
+    n = 0
+    while n < length:
+        got = os.readv(fd, [mv[n:length]])
+        if got <= 0:
+            break
+        n += got
+    return n
 
 def read_metadata_pipe():
     """Read and parse metadata from the shairport-sync pipe"""
-    global state, last_update
-    
+    global state, state_dirty, last_update, last_activity
+
     print(f"Opening metadata pipe: {PIPE_PATH}")
-    
+
+    # Reusable header buffer - raw fd reads avoid the Python file-object
+    # machinery and a fresh bytes allocation per record
+    header = bytearray(12)
+
     while True:
+        fd = None
         try:
             # Open pipe (blocks until writer connects)
-            with open(PIPE_PATH, 'rb') as pipe:
-                print("Pipe connected, reading metadata...")
-                
-                while True:
-                    # Read header: type (4 bytes) + code (4 bytes) + length (4 bytes)
-                    header = pipe.read(12)
-                    if len(header) < 12:
-                        print("Pipe closed, reconnecting...")
-                        break
-                    
-                    type_code = header[0:4]
-                    code = header[4:8]
-                    length = struct.unpack('>I', header[8:12])[0]
-                    
-                    # Read data
-                    data = b''
-                    if length > 0:
-                        data = pipe.read(length)
-                    
-                    # Decode and update state
-                    decode_metadata_item(type_code, code, data)
-                    
-                    # Write state if we have meaningful data
-                    if state["title"] or state["active"]:
+            fd = os.open(PIPE_PATH, os.O_RDONLY)
+            print("Pipe connected, reading metadata...")
+            last_activity = time.time()
+
+            while True:
+                # Coalesce writes: a track change arrives as a burst of
+                # items (artwork, album, artist, title), so only flush
+                # state once the pipe is drained (or 100ms passes)
+                ready, _, _ = select.select([fd], [], [], 0.1)
+                if not ready:
+                    if state_dirty and (state["title"] or state["active"]):
+                        write_state_atomic(state)
+                        state_dirty = False
+                    # Run the stale check on the idle tick too - a stalled
+                    # pipe (open but silent) should still time out instead
+                    # of waiting for a reconnect. Keyed on pipe activity,
+                    # not state writes: writes are deduped, so mid-track
+                    # the state legitimately stops changing while the pipe
+                    # keeps delivering progress records
+                    if state["active"] and (time.time() - last_activity) > STALE_TIMEOUT:
+                        state["active"] = False
                         write_state_atomic(state)
-                        
+                    continue
+
+                # Read header: type (4 bytes) + code (4 bytes) + length (4 bytes)
+                if _read_exact_into(fd, header, 12) < 12:
+                    print("Pipe closed, reconnecting...")
+                    break
+                last_activity = time.time()
+
+                type_code = bytes(header[0:4])
+                code = bytes(header[4:8])
+                # int.from_bytes is ~2x faster than struct.unpack here
+                # (no format parse, no tuple allocation)
+                length = int.from_bytes(header[8:12], 'big')
+
+                # Artwork goes straight from pipe to disk, no bytes copy
+                if code == b'PICT' and length > 100:
+                    save_artwork(fd, length)
+                    continue
+
+                # Read data
+                data = b''
+                if length > 0:
+                    data = bytearray(length)
+                    got = _read_exact_into(fd, data, length)
+                    if got < length:
+                        del data[got:]
+
+                # Decode and update state
+                decode_metadata_item(type_code, code, data)
+
         except FileNotFoundError:
             print(f"Pipe {PIPE_PATH} not found, waiting...")
             time.sleep(2)
         except Exception as e:
             print(f"Error reading pipe: {e}", file=sys.stderr)
             time.sleep(1)
-        
+        finally:
+            if fd is not None:
+                os.close(fd)
+
         # Check for stale state
         if last_update > 0 and (time.time() - last_update) > STALE_TIMEOUT:
             if state["active"]:
@@ -161,7 +266,7 @@ def main():
     # Initialize state file
     state["active"] = False
     write_state_atomic(state)
-    clear_artwork()
+    clear_artwork(force=True)  # clean up leftovers from a previous run
     
     # Start reading
     read_metadata_pipe()
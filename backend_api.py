@@ -4,84 +4,156 @@ FastAPI Backend for Wall Clock
 Separates data logic from UI rendering
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, Form, HTTPException, UploadFile, File
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, Response, Form, HTTPException, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
+import os
 import shutil
+import gzip
 import uuid
 from PIL import Image, ImageOps
 import io
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import logging.handlers
+import queue
+from datetime import datetime, timedelta, date as date_type
 from pathlib import Path
 import json
+import time
 import secrets
+import hmac
+import zlib
+import functools
+from html import escape as html_escape
 import urllib.parse
 import base64
 
 # Import your existing data modules
-import requests
+import httpx
+import aiofiles
 import math
+import bisect
+from operator import itemgetter
 from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+
+# CalDAV stack is optional - the backend runs without calendar support.
+# Imported once here instead of inside the fetch hot path.
+try:
+    import caldav
+    from caldav.elements import dav
+    from icalendar import Calendar
+    import recurring_ical_events
+    # When lxml is installed, caldav parses server XML with libxml2 (C)
+    # instead of ElementTree - a big win on large calendar responses
+    try:
+        import lxml.etree  # noqa: F401
+    except ImportError:
+        pass
+except ImportError:
+    caldav = None
+
+# orjson is 5-6x faster at serializing and ~2x at parsing than stdlib json;
+# fall back to stdlib if it isn't installed
+try:
+    import orjson
+    _HAS_ORJSON = True
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    _HAS_ORJSON = False
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
+
+    def _json_loads(data):
+        return json.loads(data)
 
 # ============================================================================
 # CONFIGURATION (from your existing Config class)
 # ============================================================================
 
-class Config:
-    """Configuration settings"""
+@dataclass(slots=True)
+class _Config:
+    """Configuration settings
+
+    A slots-backed singleton (bound as the module-level ``Config``):
+    attribute reads are fixed-offset slot loads instead of class-dict
+    lookups, which matters for the persistence and API paths that read
+    dozens of fields per call.
+    """
     # Weather Settings - loaded from config.json
-    WEATHER_API_KEY = ""  # Set via config.json
-    WEATHER_CITY = "Phoenix"
-    WEATHER_STATE = "AZ"
-    WEATHER_COUNTRY = "US"
-    WEATHER_UNITS = "imperial"
-    WEATHER_UPDATE_INTERVAL = 600  # 10 minutes
+    WEATHER_API_KEY: str = ""  # Set via config.json
+    WEATHER_CITY: str = "Phoenix"
+    WEATHER_STATE: str = "AZ"
+    WEATHER_COUNTRY: str = "US"
+    WEATHER_UNITS: str = "imperial"
+    WEATHER_UPDATE_INTERVAL: int = 600  # 10 minutes
 
     # Calendar Settings - loaded from config.json
-    CALDAV_ACCOUNTS = []  # Set via config.json
-    CALENDAR_UPDATE_INTERVAL = 300  # 5 minutes
-    MAX_EVENTS_DISPLAY = 500
+    CALDAV_ACCOUNTS: list = field(default_factory=list)  # Set via config.json
+    CALENDAR_UPDATE_INTERVAL: int = 300  # 5 minutes
+    MAX_EVENTS_DISPLAY: int = 500
 
     # Sticky Note Settings
-    STICKY_NOTE_FILE_PATH = Path("/home/admin/ClockNotes/ClockNote.txt")
-    STICKY_NOTE_UPDATE_INTERVAL = 60  # 1 minute
+    STICKY_NOTE_FILE_PATH: Path = Path("/home/admin/ClockNotes/ClockNote.txt")
+    STICKY_NOTE_UPDATE_INTERVAL: int = 60  # 1 minute
 
     # Spotify Settings
-    SPOTIFY_CLIENT_ID = ""  # Set via config.json or env
-    SPOTIFY_CLIENT_SECRET = ""  # Set via config.json or env
-    SPOTIFY_REDIRECT_URI = "http://localhost:8000/api/spotify/callback"  # Update for your setup
+    SPOTIFY_CLIENT_ID: str = ""  # Set via config.json or env
+    SPOTIFY_CLIENT_SECRET: str = ""  # Set via config.json or env
+    SPOTIFY_REDIRECT_URI: str = "http://localhost:8000/api/spotify/callback"  # Update for your setup
     # Scopes: streaming = Web Playback SDK, user-read-email = user profile, playback-state = see what's playing
-    SPOTIFY_SCOPES = "streaming user-read-email user-read-private user-read-playback-state user-modify-playback-state user-read-currently-playing"
-    
+    SPOTIFY_SCOPES: str = "streaming user-read-email user-read-private user-read-playback-state user-modify-playback-state user-read-currently-playing"
+
     # Spotify tokens (stored in config.json, loaded at runtime)
-    SPOTIFY_ACCESS_TOKEN = ""
-    SPOTIFY_REFRESH_TOKEN = ""
-    SPOTIFY_TOKEN_EXPIRES_AT = 0
-    SPOTIFY_USER_ID = ""
-    SPOTIFY_CONNECTED = False
+    SPOTIFY_ACCESS_TOKEN: str = ""
+    SPOTIFY_REFRESH_TOKEN: str = ""
+    SPOTIFY_TOKEN_EXPIRES_AT: float = 0
+    SPOTIFY_USER_ID: str = ""
+    SPOTIFY_CONNECTED: bool = False
 
     # Google Nest (SDM API) Settings
-    NEST_PROJECT_ID = ""  # Device Access Project ID from Google Cloud
-    NEST_CLIENT_ID = ""  # OAuth Client ID
-    NEST_CLIENT_SECRET = ""  # OAuth Client Secret
-    NEST_REDIRECT_URI = "http://127.0.0.1:8000/api/integrations/nest/callback"
-    NEST_ACCESS_TOKEN = ""
-    NEST_REFRESH_TOKEN = ""
-    NEST_TOKEN_EXPIRES_AT = 0
-    NEST_CONNECTED = False
-    NEST_LAST_SYNC = None
+    NEST_PROJECT_ID: str = ""  # Device Access Project ID from Google Cloud
+    NEST_CLIENT_ID: str = ""  # OAuth Client ID
+    NEST_CLIENT_SECRET: str = ""  # OAuth Client Secret
+    NEST_REDIRECT_URI: str = "http://127.0.0.1:8000/api/integrations/nest/callback"
+    NEST_ACCESS_TOKEN: str = ""
+    NEST_REFRESH_TOKEN: str = ""
+    NEST_TOKEN_EXPIRES_AT: float = 0
+    NEST_CONNECTED: bool = False
+    NEST_LAST_SYNC: Optional[str] = None
+
+    # Config persistence: when True, fdatasync config.json before the
+    # atomic rename. Off by default - every stored field (tokens, sync
+    # timestamps) is recoverable by re-authenticating, and skipping the
+    # sync keeps the debounced flush off the disk's critical path.
+    CONFIG_DURABLE: bool = False
+
+    # Origins allowed by CORS. The dashboard is served by this app, so
+    # these only matter when developing the frontend from another host.
+    FRONTEND_ORIGINS: list = field(default_factory=lambda: [
+        "http://localhost:8000",
+        "http://127.0.0.1:8000",
+    ])
 
     # Logging
-    LOG_LEVEL = logging.INFO
-    
+    LOG_LEVEL: int = logging.INFO
+
     # Jarvis AI Agent Settings
-    JARVIS_ENABLED = True
-    JARVIS_UPDATE_INTERVAL = 1800  # 30 minutes
-    FERRETBOX_API_URL = "http://192.168.0.82:8000"
-    JARVIS_MODEL = "gpt-oss:20b"  # Default model to use
+    JARVIS_ENABLED: bool = True
+    JARVIS_UPDATE_INTERVAL: int = 1800  # 30 minutes
+    FERRETBOX_API_URL: str = "http://192.168.0.82:8000"
+    JARVIS_MODEL: str = "gpt-oss:20b"  # Default model to use
+
+# Singleton kept under the old name so call sites stay Config.FIELD
+Config = _Config()
 
 # ============================================================================
 # LOGGING
@@ -91,12 +163,99 @@ logging.basicConfig(
     level=Config.LOG_LEVEL,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+
+# Route records through a queue: emit() on the request path becomes an
+# enqueue, and a listener thread does the actual stream write
+_log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_root_logger.handlers, respect_handler_level=True
+)
+_root_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener.start()
+
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# SHARED HTTP CLIENT
+# ============================================================================
+
+# Shared async HTTP client: async fetches yield to the event loop instead of
+# blocking it, and connections are reused across refresh cycles
+http_client = httpx.AsyncClient(
+    timeout=10.0,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+
+# Jarvis talks to a local LLM that can take minutes to answer; it gets its
+# own client so the generous read timeout never leaks into other calls.
+# Keep-alive matters here too: FerretBox is on the LAN, so the TCP
+# handshake is a measurable share of the status check's cost.
+jarvis_http_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(5.0, read=300.0),
+    limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+)
+
+# Transient upstream statuses worth retrying (Nest's SDM API in particular
+# is prone to intermittent 500s)
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+# Bound client verbs for O(1) command dispatch in the managers'
+# _api_request (GETs take the retrying path below instead); callers pass
+# the method name uppercase
+_COMMAND_METHODS = {
+    'PUT': http_client.put,
+    'POST': http_client.post,
+}
+
+async def _get_with_retries(url: str, headers: Dict, attempts: int = 3,
+                            timeout: float = 5.0, backoff: float = 0.3):
+    """GET with a tight timeout and exponential backoff on transient failures.
+
+    Poll GETs are idempotent, so retrying is safe; commands (PUT/POST)
+    must never run twice and go out without retries. The final attempt's
+    response or exception propagates to the caller."""
+    for attempt in range(attempts):
+        last = attempt == attempts - 1
+        try:
+            response = await http_client.get(url, headers=headers, timeout=timeout)
+        except httpx.TimeoutException:
+            if last:
+                raise
+        else:
+            if last or response.status_code not in _RETRY_STATUSES:
+                return response
+        await asyncio.sleep(backoff * (2 ** attempt))
+
 # ============================================================================
 # DATA FETCHERS (Refactored from your existing code)
 # ============================================================================
 
+# Weather-id dispatch tables: OpenWeatherMap groups conditions by hundreds,
+# with a few specific overrides (cloud codes 80x, freezing rain 511)
+_ICON_BY_GROUP = {2: "⛈️", 3: "🌦️", 5: "🌧️", 6: "❄️", 7: "🌫️"}
+_ICON_OVERRIDES = {802: "⛅", 803: "☁️", 804: "☁️", 511: "🌨️"}
+_EFFECT_BY_GROUP = {2: "storm", 3: "drizzle", 5: "rain", 6: "snow", 7: "fog"}
+
+# Moon phase lookup: boundaries are fractions of the ~29.53-day lunar cycle,
+# anchored to a known new moon (Jan 6, 2000)
+_KNOWN_NEW_MOON = datetime(2000, 1, 6, 18, 14)
+_LUNAR_CYCLE = 29.53058867
+_PHASE_BOUNDS = (0.0625, 0.1875, 0.3125, 0.4375, 0.5625, 0.6875, 0.8125, 0.9375)
+_PHASES = (
+    ('New Moon', '🌑', 0),
+    ('Waxing Crescent', '🌒', 25),
+    ('First Quarter', '🌓', 50),
+    ('Waxing Gibbous', '🌔', 75),
+    ('Full Moon', '🌕', 100),
+    ('Waning Gibbous', '🌖', 75),
+    ('Last Quarter', '🌗', 50),
+    ('Waning Crescent', '🌘', 25),
+    ('New Moon', '🌑', 0),
+)
+
+
 class WeatherFetcher:
     """Fetch weather data from OpenWeatherMap API"""
 
@@ -113,84 +272,68 @@ class WeatherFetcher:
         self.cache = None
         self.last_fetch = None
 
+    def reload_config(self):
+        """Re-read settings from Config in place and drop the cache"""
+        self.api_key = Config.WEATHER_API_KEY
+        self.location = f"{Config.WEATHER_CITY},{Config.WEATHER_STATE},{Config.WEATHER_COUNTRY}"
+        state_names = {"AZ": "Arizona", "IL": "Illinois", "IA": "Iowa", "CA": "California", "TX": "Texas", "NY": "New York", "FL": "Florida"}
+        display_state = state_names.get(Config.WEATHER_STATE, Config.WEATHER_STATE)
+        self.display_location = f"{Config.WEATHER_CITY}, {display_state}"
+        self.units = Config.WEATHER_UNITS
+        self.cache = None
+        self.last_fetch = None
+
     def get_moon_phase(self) -> dict:
         """Calculate current moon phase"""
-        from datetime import datetime
-        import math
-        
-        # Known new moon date (Jan 6, 2000)
-        known_new_moon = datetime(2000, 1, 6, 18, 14)
-        now = datetime.now()
-        
-        # Lunar cycle is ~29.53 days
-        lunar_cycle = 29.53058867
-        days_since = (now - known_new_moon).total_seconds() / 86400
-        current_cycle = days_since % lunar_cycle
-        phase_percent = current_cycle / lunar_cycle
-        
-        # Determine phase name and emoji
-        if phase_percent < 0.0625:
-            return {'name': 'New Moon', 'emoji': '🌑', 'illumination': 0}
-        elif phase_percent < 0.1875:
-            return {'name': 'Waxing Crescent', 'emoji': '🌒', 'illumination': 25}
-        elif phase_percent < 0.3125:
-            return {'name': 'First Quarter', 'emoji': '🌓', 'illumination': 50}
-        elif phase_percent < 0.4375:
-            return {'name': 'Waxing Gibbous', 'emoji': '🌔', 'illumination': 75}
-        elif phase_percent < 0.5625:
-            return {'name': 'Full Moon', 'emoji': '🌕', 'illumination': 100}
-        elif phase_percent < 0.6875:
-            return {'name': 'Waning Gibbous', 'emoji': '🌖', 'illumination': 75}
-        elif phase_percent < 0.8125:
-            return {'name': 'Last Quarter', 'emoji': '🌗', 'illumination': 50}
-        elif phase_percent < 0.9375:
-            return {'name': 'Waning Crescent', 'emoji': '🌘', 'illumination': 25}
-        else:
-            return {'name': 'New Moon', 'emoji': '🌑', 'illumination': 0}
+        days_since = (datetime.now() - _KNOWN_NEW_MOON).total_seconds() / 86400
+        phase_percent = (days_since % _LUNAR_CYCLE) / _LUNAR_CYCLE
+
+        # Binary-search the phase boundaries instead of walking an elif chain
+        name, emoji, illumination = _PHASES[bisect.bisect_right(_PHASE_BOUNDS, phase_percent)]
+        return {'name': name, 'emoji': emoji, 'illumination': illumination}
 
     def get_weather_icon(self, weather_id: int, is_night: bool = False) -> str:
         """Get emoji icon for weather condition, with day/night awareness"""
-        # For clear skies, use sun/moon
+        # For clear/mostly-clear skies, use sun/moon
         if weather_id == 800:
             if is_night:
                 return self.get_moon_phase()['emoji']
             return "☀️"
-        elif weather_id == 801:
-            if is_night:
-                return "🌙"  # Moon behind small cloud
-            return "🌤️"
-        elif weather_id == 802:
-            return "⛅"
-        elif weather_id in [803, 804]:
-            return "☁️"
-        # Weather conditions (same day/night)
-        elif 200 <= weather_id < 300:
-            return "⛈️"
-        elif 300 <= weather_id < 400:
-            return "🌦️"
-        elif 500 <= weather_id < 600:
-            return "🌧️" if weather_id != 511 else "🌨️"
-        elif 600 <= weather_id < 700:
-            return "❄️"
-        elif 700 <= weather_id < 800:
-            return "🌫️"
-        return "🌡️"
-    
+        if weather_id == 801:
+            return "🌙" if is_night else "🌤️"  # Moon behind small cloud
+        icon = _ICON_OVERRIDES.get(weather_id)
+        if icon:
+            return icon
+        return _ICON_BY_GROUP.get(weather_id // 100, "🌡️")
+
+    # Memoized (weather_id, is_night, gusty) -> (icon, effect); the input
+    # space is tiny so this never grows past a few dozen entries
+    _classify_cache = {}
+
+    def classify_weather(self, weather_id: int, is_night: bool, wind_speed: float) -> tuple:
+        """Resolve (icon, effect) for a condition in one memoized lookup"""
+        # Clear night skies use the current moon phase emoji, which changes
+        # day to day - never cache that combination
+        if weather_id == 800 and is_night:
+            return (self.get_weather_icon(weather_id, is_night),
+                    self.get_weather_effect(weather_id, wind_speed))
+
+        key = (weather_id, is_night, wind_speed > 20)
+        cached = self._classify_cache.get(key)
+        if cached is None:
+            cached = (self.get_weather_icon(weather_id, is_night),
+                      self.get_weather_effect(weather_id, wind_speed))
+            self._classify_cache[key] = cached
+        return cached
+
     def get_weather_effect(self, weather_id: int, wind_speed: float = 0) -> str:
         """Determine what particle effect to show based on weather"""
-        if 200 <= weather_id < 300:
-            return "storm"  # Thunderstorm - rain + lightning
-        elif 300 <= weather_id < 400:
-            return "drizzle"  # Light rain
-        elif 500 <= weather_id < 600:
-            if weather_id == 511:
-                return "snow"  # Freezing rain shows as snow
-            return "rain"
-        elif 600 <= weather_id < 700:
-            return "snow"
-        elif 700 <= weather_id < 800:
-            return "fog"
-        elif wind_speed > 20:  # Strong wind
+        if weather_id == 511:
+            return "snow"  # Freezing rain shows as snow
+        effect = _EFFECT_BY_GROUP.get(weather_id // 100)
+        if effect:
+            return effect
+        if wind_speed > 20:  # Strong wind
             return "wind"
         return "none"
 
@@ -209,7 +352,7 @@ class WeatherFetcher:
                 'units': self.units
             }
 
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = await http_client.get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -239,14 +382,11 @@ class WeatherFetcher:
                 sunrise_time = "6:00 AM"
                 sunset_time = "6:00 PM"
             
-            # Get appropriate icon based on day/night
-            icon = self.get_weather_icon(weather_id, is_night)
-            
+            # Get icon (day/night aware) and particle effect in one pass
+            icon, weather_effect = self.classify_weather(weather_id, is_night, wind_speed)
+
             # Get moon phase for night display
             moon_phase = self.get_moon_phase()
-            
-            # Determine weather effect for particle system
-            weather_effect = self.get_weather_effect(weather_id, wind_speed)
 
             self.cache = {
                 'icon': icon,
@@ -288,6 +428,20 @@ class WeatherFetcher:
             }
 
 
+# Bytes stripped from event summaries (everything outside printable ASCII;
+# high bytes are already dropped by the ascii/ignore encode)
+_NON_PRINTABLE = bytes(b for b in range(256) if b < 32 or b >= 127)
+
+
+def _sanitize_summary(raw_summary: str) -> str:
+    """Reduce a summary to printable ASCII with collapsed whitespace.
+
+    encode/translate run at C level - far cheaper than filtering per char.
+    """
+    summary = raw_summary.encode('ascii', 'ignore').translate(None, _NON_PRINTABLE).decode('ascii')
+    return ' '.join(summary.split())
+
+
 class CalendarFetcher:
     """Fetch events from multiple Apple Calendar accounts using CalDAV"""
 
@@ -295,13 +449,28 @@ class CalendarFetcher:
         self.accounts = Config.CALDAV_ACCOUNTS
         self.cache = []
         self.last_fetch = None
+        # Per-calendar sync state: ctag (collection tag) + parsed events,
+        # keyed by calendar URL. An unchanged ctag means the server-side
+        # collection hasn't changed and the expensive date_search +
+        # recurring-event expansion can be skipped. _window_cache holds
+        # the end of the date range each cache entry was fetched with
+        self._ctag_cache = {}
+        self._event_cache = {}
+        self._window_cache = {}
+
+    def reload_config(self):
+        """Re-read accounts from Config in place and drop all caches"""
+        self.accounts = Config.CALDAV_ACCOUNTS
+        self.cache = []
+        self.last_fetch = None
+        # Credentials or accounts may have changed - cached ctags and
+        # events can belong to calendars we no longer have access to
+        self._ctag_cache = {}
+        self._event_cache = {}
+        self._window_cache = {}
 
     def _fetch_from_account(self, account: Dict, now: datetime, end_date: datetime) -> List[Dict]:
         """Fetch events from a single CalDAV account with proper recurring event expansion"""
-        import caldav
-        from icalendar import Calendar
-        import recurring_ical_events
-        
         events_list = []
         account_name = account.get('name', 'Unknown')
         
@@ -319,9 +488,46 @@ class CalendarFetcher:
             
             for calendar in calendars:
                 try:
+                    cal_url = str(calendar.url)
+
+                    # Skip unchanged calendars: the server bumps the ctag on
+                    # any change, so a matching ctag means our cached events
+                    # are still valid (just refresh the day-relative flags)
+                    ctag = None
+                    try:
+                        props = calendar.get_properties([dav.GetCTag()])
+                        ctag = props.get('{DAV:}getctag')
+                    except Exception:
+                        pass
+
+                    # The +365-day window drifts forward with every poll, so
+                    # allow a day of slack before forcing a re-fetch - at
+                    # worst an event a year out shows up a day late
+                    if (ctag and self._ctag_cache.get(cal_url) == ctag
+                            and cal_url in self._event_cache
+                            and self._window_cache.get(cal_url, datetime.min)
+                                >= end_date - timedelta(days=1)):
+                        # Refresh the day-relative flags and drop events
+                        # whose date has passed since the fetch - the ctag
+                        # doesn't change when time moves on
+                        today = now.date()
+                        kept = []
+                        for event in self._event_cache[cal_url]:
+                            event_date = datetime.fromtimestamp(event['_ts']).date()
+                            if event_date < today:
+                                continue
+                            event['is_today'] = event_date == today
+                            event['is_upcoming'] = event_date > today
+                            kept.append(event)
+                        self._event_cache[cal_url] = kept
+                        events_list.extend(kept)
+                        continue
+
+                    cal_events = []
+
                     # Fetch all events in the date range
                     events = calendar.date_search(start=now, end=end_date, expand=True)
-                    
+
                     for event in events:
                         try:
                             # Get raw ical data
@@ -341,12 +547,10 @@ class CalendarFetcher:
                                     else:
                                         raw_summary = "Untitled Event"
                                     
-                                    summary = ''.join(char for char in raw_summary
-                                                    if ord(char) < 128 and (char.isprintable() or char == ' '))
-                                    summary = ' '.join(summary.split())
+                                    summary = _sanitize_summary(raw_summary)
                                     if len(summary) < 3:
                                         continue
-                                    
+
                                     # Extract datetime - handle both dict-like and object-like access
                                     if hasattr(vevent, 'get') and vevent.get('DTSTART'):
                                         dtstart = vevent.get('DTSTART').dt
@@ -357,21 +561,21 @@ class CalendarFetcher:
                                     
                                     if hasattr(dtstart, 'strftime'):
                                         if not hasattr(dtstart, 'hour'):
-                                            from datetime import date as date_type
                                             if isinstance(dtstart, date_type):
                                                 dtstart = datetime.combine(dtstart, datetime.min.time())
                                         
                                         if hasattr(dtstart, 'tzinfo') and dtstart.tzinfo is not None:
                                             dtstart = dtstart.replace(tzinfo=None)
                                         
-                                        events_list.append({
+                                        cal_events.append({
                                             'title': summary,
                                             'datetime': dtstart.isoformat(),
                                             'date': dtstart.strftime("%b %d"),
                                             'time': dtstart.strftime("%I:%M %p"),
                                             'is_today': dtstart.date() == now.date(),
                                             'is_upcoming': dtstart.date() > now.date(),
-                                            'account': account_name
+                                            'account': account_name,
+                                            '_ts': int(dtstart.timestamp())
                                         })
                                 except Exception as e:
                                     logger.warning(f"Error parsing expanded event: {e}")
@@ -384,9 +588,7 @@ class CalendarFetcher:
                                 
                                 if hasattr(vevent, 'summary'):
                                     raw_summary = str(vevent.summary.value)
-                                    summary = ''.join(char for char in raw_summary
-                                                    if ord(char) < 128 and (char.isprintable() or char == ' '))
-                                    summary = ' '.join(summary.split())
+                                    summary = _sanitize_summary(raw_summary)
                                     if len(summary) < 3:
                                         continue
                                 else:
@@ -396,25 +598,32 @@ class CalendarFetcher:
                                 
                                 if hasattr(dtstart, 'strftime'):
                                     if not hasattr(dtstart, 'hour'):
-                                        from datetime import date as date_type
                                         if isinstance(dtstart, date_type):
                                             dtstart = datetime.combine(dtstart, datetime.min.time())
                                     
                                     if hasattr(dtstart, 'tzinfo') and dtstart.tzinfo is not None:
                                         dtstart = dtstart.replace(tzinfo=None)
                                     
-                                    events_list.append({
+                                    cal_events.append({
                                         'title': summary,
                                         'datetime': dtstart.isoformat(),
                                         'date': dtstart.strftime("%b %d"),
                                         'time': dtstart.strftime("%I:%M %p"),
                                         'is_today': dtstart.date() == now.date(),
                                         'is_upcoming': dtstart.date() > now.date(),
-                                        'account': account_name
+                                        'account': account_name,
+                                        '_ts': int(dtstart.timestamp())
                                     })
                             except Exception as e2:
                                 logger.warning(f"Error parsing event (fallback): {e2}")
                                 continue
+
+                    # Remember sync state so unchanged calendars are skipped next time
+                    if ctag:
+                        self._ctag_cache[cal_url] = ctag
+                        self._event_cache[cal_url] = cal_events
+                        self._window_cache[cal_url] = end_date
+                    events_list.extend(cal_events)
                 except Exception as e:
                     logger.warning(f"Error fetching from calendar: {e}")
                     continue
@@ -433,59 +642,71 @@ class CalendarFetcher:
             if (datetime.now() - self.last_fetch).seconds < Config.CALENDAR_UPDATE_INTERVAL:
                 return self.cache
 
+        if caldav is None:
+            logger.error("caldav module not installed")
+            return []
+
         try:
-            import caldav
-            
             all_events = []
             now = datetime.now()
             end_date = now + timedelta(days=365)
             
-            # Fetch from all configured accounts
-            for account in self.accounts:
-                if account.get('username') and account.get('password'):
-                    account_events = self._fetch_from_account(account, now, end_date)
-                    all_events.extend(account_events)
+            # Fetch from all configured accounts concurrently - each account
+            # gets its own caldav client in a worker thread, so total latency
+            # is the slowest account rather than the sum of all of them
+            tasks = [
+                asyncio.to_thread(self._fetch_from_account, account, now, end_date)
+                for account in self.accounts
+                if account.get('username') and account.get('password')
+            ]
+            if tasks:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, list):
+                        all_events.extend(result)
+                    else:
+                        logger.error(f"Calendar account fetch failed: {result}")
             
             # Merge local quick-add events
             try:
                 local_events_file = Path("/home/admin/ClockNotes/quick_events.json")
                 if local_events_file.exists():
-                    with open(local_events_file, 'r') as f:
-                        local_events = json.load(f)
+                    with open(local_events_file, 'rb') as f:
+                        local_events = _json_loads(f.read())
                         # Filter future/today events and add them
                         for event in local_events:
+                            # Parse the ISO string once; sort/compare use the epoch int
                             event_dt = datetime.fromisoformat(event['datetime'])
                             if event_dt.date() >= now.date():
                                 # Update is_today/is_upcoming flags
                                 event['is_today'] = event_dt.date() == now.date()
                                 event['is_upcoming'] = event_dt.date() > now.date()
+                                event['_ts'] = int(event_dt.timestamp())
                                 all_events.append(event)
                         logger.info(f"Merged {len(local_events)} local events")
             except Exception as e:
                 logger.warning(f"Error loading local events: {e}")
             
-            # Sort by datetime (unified view)
-            all_events.sort(key=lambda x: x['datetime'])
-            
-            # Remove duplicates (same title + same datetime)
-            seen = set()
-            unique_events = []
+            # De-duplicate (same title + same datetime) into a dict first so
+            # duplicates never reach the sort, then sort the survivors once
+            events_by_key = {}
             for event in all_events:
-                key = (event['title'], event['datetime'])
-                if key not in seen:
-                    seen.add(key)
-                    unique_events.append(event)
-            
-            # Limit events
-            self.cache = unique_events[:Config.MAX_EVENTS_DISPLAY]
+                events_by_key.setdefault((event['title'], event['datetime']), event)
+
+            # Integer sort keys compare much faster than ISO strings
+            unique_events = sorted(events_by_key.values(), key=itemgetter('_ts'))
+
+            # Limit events, dropping the internal sort key before the list
+            # is served to API clients
+            self.cache = [
+                {k: v for k, v in event.items() if k != '_ts'}
+                for event in unique_events[:Config.MAX_EVENTS_DISPLAY]
+            ]
             self.last_fetch = datetime.now()
             
             logger.info(f"Total unified events: {len(self.cache)}")
             return self.cache
 
-        except ImportError:
-            logger.error("caldav module not installed")
-            return []
         except Exception as e:
             logger.error(f"Calendar fetch error: {e}")
             return []
@@ -531,7 +752,7 @@ class StickyNoteFetcher:
     async def save_note(self, content: str) -> Dict:
         """Save sticky note to file"""
         try:
-            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Directory is created once in __init__
             with open(self.file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
             logger.info("Sticky note saved successfully")
@@ -551,16 +772,87 @@ class StickyNoteFetcher:
 # SPOTIFY INTEGRATION
 # ============================================================================
 
+# Tiny TTL cache for upstream API results. The dashboard polls some of
+# these every second; per-key locks coalesce concurrent pollers into a
+# single upstream request.
+_api_cache: Dict[str, tuple] = {}
+_api_cache_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def _cached(key: str, ttl: float, fn):
+    """Return the cached value for key, refreshing via fn() after ttl seconds"""
+    entry = _api_cache.get(key)
+    if entry and (time.monotonic() - entry[0]) < ttl:
+        return entry[1]
+
+    lock = _api_cache_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another poller may have refreshed while we waited for the lock
+        entry = _api_cache.get(key)
+        if entry and (time.monotonic() - entry[0]) < ttl:
+            return entry[1]
+        value = await fn()
+        _api_cache[key] = (time.monotonic(), value)
+        return value
+
+
+def _invalidate_cached(*keys):
+    """Drop cache entries (called after state-changing commands)"""
+    for key in keys:
+        _api_cache.pop(key, None)
+
+
+# Debounced config persistence. Token refreshes and the Nest sync timestamp
+# used to call save_config_to_file() on every successful API response - a
+# disk write per poll. Hot paths now mark the config dirty and a short-lived
+# task flushes once per window, collapsing thousands of writes/hour to a
+# handful per minute. One-time user actions (connect/disconnect) still save
+# synchronously.
+_CONFIG_FLUSH_DELAY = 5.0
+_config_flush_task = None
+
+def _mark_config_dirty():
+    """Schedule a debounced config save instead of writing immediately"""
+    global _config_flush_task
+    if _config_flush_task is None or _config_flush_task.done():
+        _config_flush_task = asyncio.create_task(_flush_config_after_delay())
+
+async def _flush_config_after_delay():
+    # Config state lives on the Config class, so every change made during
+    # the delay is captured by the single write at the end
+    await asyncio.sleep(_CONFIG_FLUSH_DELAY)
+    await asyncio.to_thread(save_config_to_file)
+
+
 class SpotifyManager:
     """Handle Spotify OAuth and API interactions"""
     
     SPOTIFY_AUTH_URL = "https://accounts.spotify.com/authorize"
     SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
     SPOTIFY_API_BASE = "https://api.spotify.com/v1"
-    
-    # OAuth state storage (simple in-memory for single-user device)
-    _oauth_state = None
-    
+
+    # Pre-joined URLs for hot endpoints, built once at class definition
+    # instead of an f-string concat on every poll
+    _NOW_PLAYING_URL = SPOTIFY_API_BASE + '/me/player/currently-playing'
+    _DEVICES_URL = SPOTIFY_API_BASE + '/me/player/devices'
+    _PLAYER_URL = SPOTIFY_API_BASE + '/me/player'
+    _PLAY_URL = SPOTIFY_API_BASE + '/me/player/play'
+    _PAUSE_URL = SPOTIFY_API_BASE + '/me/player/pause'
+    _NEXT_URL = SPOTIFY_API_BASE + '/me/player/next'
+    _PREV_URL = SPOTIFY_API_BASE + '/me/player/previous'
+
+    # Outstanding OAuth states -> expiry timestamp. A dict rather than a
+    # single slot so concurrent auth flows can't clobber each other;
+    # entries expire after 10 minutes and are pruned on insert.
+    _oauth_states: Dict[str, float] = {}
+    OAUTH_STATE_TTL = 600
+
+    # Cached static auth-URL prefix: ((client_id, redirect_uri, scope), prefix)
+    _auth_prefix_cache = None
+
+    # Background token-refresh task handle
+    _refresher_task = None
+
     # Error codes for consistent error handling
     ERROR_CODES = {
         'not_connected': {'code': 'not_connected', 'message': 'Spotify is not connected. Please connect your account in Settings.'},
@@ -587,41 +879,95 @@ class SpotifyManager:
         if not cls.is_configured():
             raise ValueError("Spotify client ID and secret must be configured")
         
-        # Generate secure state parameter
-        cls._oauth_state = secrets.token_urlsafe(32)
-        
-        params = {
-            'client_id': Config.SPOTIFY_CLIENT_ID,
-            'response_type': 'code',
-            'redirect_uri': Config.SPOTIFY_REDIRECT_URI,
-            'scope': Config.SPOTIFY_SCOPES,
-            'state': cls._oauth_state,
-            'show_dialog': 'true'  # Always show dialog for re-auth
-        }
-        
-        return f"{cls.SPOTIFY_AUTH_URL}?{urllib.parse.urlencode(params)}"
-    
+        # Generate secure state parameter and register it with an expiry,
+        # dropping any stale states while we're here
+        state = secrets.token_urlsafe(32)
+        now = time.time()
+        cls._oauth_states = {s: exp for s, exp in cls._oauth_states.items() if exp > now}
+        cls._oauth_states[state] = now + cls.OAUTH_STATE_TTL
+
+        # Only state changes between calls - urlencode the static params once
+        # and rebuild only when the underlying config changes
+        key = (Config.SPOTIFY_CLIENT_ID, Config.SPOTIFY_REDIRECT_URI, Config.SPOTIFY_SCOPES)
+        cached = cls._auth_prefix_cache
+        if cached and cached[0] == key:
+            prefix = cached[1]
+        else:
+            prefix = f"{cls.SPOTIFY_AUTH_URL}?" + urllib.parse.urlencode({
+                'client_id': Config.SPOTIFY_CLIENT_ID,
+                'response_type': 'code',
+                'redirect_uri': Config.SPOTIFY_REDIRECT_URI,
+                'scope': Config.SPOTIFY_SCOPES,
+                'show_dialog': 'true'  # Always show dialog for re-auth
+            })
+            cls._auth_prefix_cache = (key, prefix)
+
+        # token_urlsafe output needs no URL encoding
+        return f"{prefix}&state={state}"
+
     @classmethod
     def validate_state(cls, state: str) -> bool:
-        """Validate OAuth state parameter"""
-        if not cls._oauth_state or state != cls._oauth_state:
+        """Validate and consume an OAuth state parameter"""
+        if not state:
             return False
-        cls._oauth_state = None  # Clear after use
-        return True
-    
+        # Constant-time scan over the outstanding states so timing doesn't
+        # leak how much of a guessed state matched. Compare as bytes:
+        # compare_digest raises on non-ASCII str input, and state comes
+        # straight off the query string
+        state_b = state.encode()
+        matched = None
+        for issued in cls._oauth_states:
+            if hmac.compare_digest(state_b, issued.encode()):
+                matched = issued
+        if matched is None:
+            return False
+        expiry = cls._oauth_states.pop(matched)  # Single use
+        return time.time() < expiry
+
+
+    # Cached HTTP Basic auth header: (client_id, client_secret, header)
+    _basic_auth_cache = None
+
+    @classmethod
+    def _basic_auth(cls) -> str:
+        """Return the Basic auth header, rebuilt only when credentials change"""
+        cached = cls._basic_auth_cache
+        if cached and cached[0] == Config.SPOTIFY_CLIENT_ID and cached[1] == Config.SPOTIFY_CLIENT_SECRET:
+            return cached[2]
+        header = base64.b64encode(
+            f"{Config.SPOTIFY_CLIENT_ID}:{Config.SPOTIFY_CLIENT_SECRET}".encode()
+        ).decode()
+        cls._basic_auth_cache = (Config.SPOTIFY_CLIENT_ID, Config.SPOTIFY_CLIENT_SECRET, header)
+        return header
+
+    @classmethod
+    async def _token_refresher(cls):
+        """Background task: refresh the access token shortly before expiry
+        so user-facing requests never pay the token round-trip"""
+        while cls.is_connected():
+            wait = max(60, Config.SPOTIFY_TOKEN_EXPIRES_AT - time.time() - 300)
+            await asyncio.sleep(wait)
+            if not cls.is_connected():
+                break
+            await cls.refresh_token()
+
+    @classmethod
+    def start_token_refresher(cls):
+        """Launch the background refresher once"""
+        if cls._refresher_task is None or cls._refresher_task.done():
+            cls._refresher_task = asyncio.create_task(cls._token_refresher())
+
     @classmethod
     async def exchange_code(cls, code: str) -> Dict:
         """Exchange authorization code for tokens"""
         if not cls.is_configured():
             raise ValueError("Spotify client ID and secret must be configured")
         
-        # Prepare auth header
-        auth_header = base64.b64encode(
-            f"{Config.SPOTIFY_CLIENT_ID}:{Config.SPOTIFY_CLIENT_SECRET}".encode()
-        ).decode()
+        # Prepare auth header (cached across calls)
+        auth_header = cls._basic_auth()
         
         try:
-            response = requests.post(
+            response = await http_client.post(
                 cls.SPOTIFY_TOKEN_URL,
                 headers={
                     'Authorization': f'Basic {auth_header}',
@@ -639,23 +985,24 @@ class SpotifyManager:
                 logger.error(f"Spotify token exchange failed: {response.status_code}")
                 return {'error': 'token_exchange_failed', 'details': response.text}
             
-            token_data = response.json()
+            token_data = _json_loads(response.content)
             
             # Store tokens
             Config.SPOTIFY_ACCESS_TOKEN = token_data.get('access_token', '')
             Config.SPOTIFY_REFRESH_TOKEN = token_data.get('refresh_token', '')
-            Config.SPOTIFY_TOKEN_EXPIRES_AT = datetime.now().timestamp() + token_data.get('expires_in', 3600)
+            Config.SPOTIFY_TOKEN_EXPIRES_AT = time.time() + token_data.get('expires_in', 3600)
             Config.SPOTIFY_CONNECTED = True
             
             # Get user profile
-            user_profile = cls._get_user_profile()
+            user_profile = await cls._get_user_profile()
             if user_profile:
                 Config.SPOTIFY_USER_ID = user_profile.get('id', '')
             
-            # Save to config file
-            save_config_to_file()
+            # Save to config file (thread so the write doesn't block the loop)
+            await asyncio.to_thread(save_config_to_file)
             
             logger.info(f"Spotify connected: user {Config.SPOTIFY_USER_ID}")
+            cls.start_token_refresher()
             return {'success': True, 'user_id': Config.SPOTIFY_USER_ID}
             
         except Exception as e:
@@ -663,33 +1010,52 @@ class SpotifyManager:
             return {'error': 'token_exchange_error', 'details': str(e)}
     
     @classmethod
-    def _get_user_profile(cls) -> Optional[Dict]:
-        """Get current user's Spotify profile"""
+    async def _get_user_profile(cls) -> Optional[Dict]:
+        """Get current user's Spotify profile (cached - it almost never changes)"""
+        return await _cached('spotify:profile', 300, cls._fetch_user_profile)
+
+    @classmethod
+    async def _fetch_user_profile(cls) -> Optional[Dict]:
         try:
-            response = requests.get(
+            response = await http_client.get(
                 f"{cls.SPOTIFY_API_BASE}/me",
                 headers={'Authorization': f'Bearer {Config.SPOTIFY_ACCESS_TOKEN}'},
                 timeout=10
             )
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
         except Exception as e:
             logger.error(f"Error getting Spotify profile: {e}")
         return None
     
+    # In-flight refresh task shared by concurrent callers
+    _refresh_inflight = None
+
+    @classmethod
+    async def refresh_token(cls) -> bool:
+        """Refresh the access token using the refresh token.
+
+        Single-flight: concurrent callers (dashboard poll + now-playing +
+        devices all hitting a 401 at once) await the same in-flight refresh
+        instead of issuing parallel token requests. Safe without a lock -
+        there is no await between the check and the task creation.
+        """
+        task = cls._refresh_inflight
+        if task is None or task.done():
+            task = asyncio.create_task(cls._do_refresh_token())
+            cls._refresh_inflight = task
+        return await task
+
     @classmethod
-    def refresh_token(cls) -> bool:
-        """Refresh the access token using refresh token"""
+    async def _do_refresh_token(cls) -> bool:
         if not Config.SPOTIFY_REFRESH_TOKEN:
             logger.error("No refresh token available")
             return False
         
-        auth_header = base64.b64encode(
-            f"{Config.SPOTIFY_CLIENT_ID}:{Config.SPOTIFY_CLIENT_SECRET}".encode()
-        ).decode()
+        auth_header = cls._basic_auth()
         
         try:
-            response = requests.post(
+            response = await http_client.post(
                 cls.SPOTIFY_TOKEN_URL,
                 headers={
                     'Authorization': f'Basic {auth_header}',
@@ -706,15 +1072,15 @@ class SpotifyManager:
                 logger.error(f"Spotify token refresh failed: {response.status_code}")
                 return False
             
-            token_data = response.json()
+            token_data = _json_loads(response.content)
             Config.SPOTIFY_ACCESS_TOKEN = token_data.get('access_token', '')
-            Config.SPOTIFY_TOKEN_EXPIRES_AT = datetime.now().timestamp() + token_data.get('expires_in', 3600)
+            Config.SPOTIFY_TOKEN_EXPIRES_AT = time.time() + token_data.get('expires_in', 3600)
             
             # Some refreshes also return a new refresh token
             if 'refresh_token' in token_data:
                 Config.SPOTIFY_REFRESH_TOKEN = token_data['refresh_token']
-            
-            save_config_to_file()
+
+            _mark_config_dirty()
             logger.info("Spotify token refreshed")
             return True
             
@@ -723,42 +1089,42 @@ class SpotifyManager:
             return False
     
     @classmethod
-    def _ensure_valid_token(cls) -> bool:
+    async def _ensure_valid_token(cls) -> bool:
         """Ensure we have a valid access token, refreshing if needed"""
         if not cls.is_connected():
             return False
         
         # Check if token is expired or about to expire (5 min buffer)
-        if datetime.now().timestamp() >= Config.SPOTIFY_TOKEN_EXPIRES_AT - 300:
-            return cls.refresh_token()
+        if time.time() >= Config.SPOTIFY_TOKEN_EXPIRES_AT - 300:
+            return await cls.refresh_token()
         
         return True
     
     @classmethod
-    def _api_request(cls, method: str, endpoint: str, data: Dict = None, retry_on_401: bool = True) -> Dict:
+    async def _api_request(cls, method: str, endpoint: str, data: Dict = None, retry_on_401: bool = True) -> Dict:
         """Make an API request with automatic token refresh"""
-        if not cls._ensure_valid_token():
+        if not await cls._ensure_valid_token():
             return {'error': cls.ERROR_CODES['not_connected']}
         
         try:
-            url = f"{cls.SPOTIFY_API_BASE}{endpoint}"
+            # Hot callers pass pre-joined absolute URLs; relative endpoints
+            # still work for one-off requests
+            url = endpoint if endpoint.startswith('https:') else f"{cls.SPOTIFY_API_BASE}{endpoint}"
             headers = {'Authorization': f'Bearer {Config.SPOTIFY_ACCESS_TOKEN}'}
             
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, timeout=10)
-            elif method.upper() == 'PUT':
-                headers['Content-Type'] = 'application/json'
-                response = requests.put(url, headers=headers, json=data or {}, timeout=10)
-            elif method.upper() == 'POST':
-                headers['Content-Type'] = 'application/json'
-                response = requests.post(url, headers=headers, json=data or {}, timeout=10)
+            if method == 'GET':
+                response = await _get_with_retries(url, headers)
             else:
-                return {'error': 'invalid_method'}
+                send = _COMMAND_METHODS.get(method)
+                if send is None:
+                    return {'error': 'invalid_method'}
+                headers['Content-Type'] = 'application/json'
+                response = await send(url, headers=headers, json=data or {})
             
             # Handle 401 with token refresh retry
             if response.status_code == 401 and retry_on_401:
-                if cls.refresh_token():
-                    return cls._api_request(method, endpoint, data, retry_on_401=False)
+                if await cls.refresh_token():
+                    return await cls._api_request(method, endpoint, data, retry_on_401=False)
                 return {'error': cls.ERROR_CODES['needs_reauth']}
             
             # Handle 204 (no content - success for some endpoints)
@@ -776,18 +1142,26 @@ class SpotifyManager:
             if response.status_code >= 400:
                 return {'error': {'code': 'api_error', 'message': f'Spotify API error: {response.status_code}'}}
             
-            return response.json() if response.text else {'success': True}
+            return _json_loads(response.content) if response.content else {'success': True}
             
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             return {'error': {'code': 'timeout', 'message': 'Spotify request timed out'}}
         except Exception as e:
             logger.error(f"Spotify API error: {e}")
             return {'error': {'code': 'api_error', 'message': str(e)}}
-    
+
+
+    # Last now-playing output: ((track_id, device name, device type), dict)
+    _np_out_cache = None
+
     @classmethod
-    def get_now_playing(cls) -> Dict:
-        """Get currently playing track"""
-        result = cls._api_request('GET', '/me/player/currently-playing')
+    async def get_now_playing(cls) -> Dict:
+        """Get currently playing track (cached briefly to absorb 1s polling)"""
+        return await _cached('spotify:now_playing', 0.75, cls._fetch_now_playing)
+
+    @classmethod
+    async def _fetch_now_playing(cls) -> Dict:
+        result = await cls._api_request('GET', cls._NOW_PLAYING_URL)
         
         if 'error' in result:
             return result
@@ -800,31 +1174,54 @@ class SpotifyManager:
                 'device': None
             }
         
-        # Parse the response
+        # Parse the response. The poll runs at ~1Hz but the track changes
+        # every few minutes, so >99% of responses differ only in
+        # progress/playing/volume. When track and device are unchanged,
+        # patch those three fields on the cached output and return it by
+        # reference instead of rebuilding the nested dict.
         item = result.get('item', {})
-        return {
+        track_id = item.get('id', '')
+        device = result.get('device', {})
+        np_key = (track_id, device.get('name'), device.get('type'))
+
+        cached = cls._np_out_cache
+        if cached is not None and cached[0] == np_key:
+            out = cached[1]
+            out['is_playing'] = result.get('is_playing', False)
+            out['progress_ms'] = result.get('progress_ms', 0)
+            out['device']['volume'] = device.get('volume_percent', 0)
+            return out
+
+        album = item.get('album', {})
+        out = {
             'is_playing': result.get('is_playing', False),
             'track': {
                 'name': item.get('name', 'Unknown'),
                 'artist': ', '.join(a.get('name', '') for a in item.get('artists', [])),
-                'album': item.get('album', {}).get('name', ''),
-                'image': item.get('album', {}).get('images', [{}])[0].get('url', ''),
+                'album': album.get('name', ''),
+                'image': album.get('images', [{}])[0].get('url', ''),
                 'duration_ms': item.get('duration_ms', 0),
                 'uri': item.get('uri', ''),
-                'id': item.get('id', '')
+                'id': track_id
             },
             'progress_ms': result.get('progress_ms', 0),
             'device': {
-                'name': result.get('device', {}).get('name', 'Unknown'),
-                'type': result.get('device', {}).get('type', 'unknown'),
-                'volume': result.get('device', {}).get('volume_percent', 0)
+                'name': device.get('name', 'Unknown'),
+                'type': device.get('type', 'unknown'),
+                'volume': device.get('volume_percent', 0)
             }
         }
+        cls._np_out_cache = (np_key, out)
+        return out
     
     @classmethod
-    def get_devices(cls) -> Dict:
-        """Get available playback devices"""
-        result = cls._api_request('GET', '/me/player/devices')
+    async def get_devices(cls) -> Dict:
+        """Get available playback devices (cached - they rarely change)"""
+        return await _cached('spotify:devices', 30, cls._fetch_devices)
+
+    @classmethod
+    async def _fetch_devices(cls) -> Dict:
+        result = await cls._api_request('GET', cls._DEVICES_URL)
         
         if 'error' in result:
             return result
@@ -844,45 +1241,50 @@ class SpotifyManager:
         }
     
     @classmethod
-    def play(cls, device_id: str = None, uri: str = None, context_uri: str = None) -> Dict:
+    async def play(cls, device_id: str = None, uri: str = None, context_uri: str = None) -> Dict:
         """Start or resume playback"""
+        _invalidate_cached('spotify:now_playing', 'spotify:devices')
         data = {}
         if uri:
             data['uris'] = [uri]
         elif context_uri:
             data['context_uri'] = context_uri
         
-        endpoint = '/me/player/play'
+        endpoint = cls._PLAY_URL
         if device_id:
             endpoint += f'?device_id={device_id}'
         
-        return cls._api_request('PUT', endpoint, data if data else None)
+        return await cls._api_request('PUT', endpoint, data if data else None)
     
     @classmethod
-    def pause(cls) -> Dict:
+    async def pause(cls) -> Dict:
         """Pause playback"""
-        return cls._api_request('PUT', '/me/player/pause')
+        _invalidate_cached('spotify:now_playing', 'spotify:devices')
+        return await cls._api_request('PUT', cls._PAUSE_URL)
     
     @classmethod
-    def next_track(cls) -> Dict:
+    async def next_track(cls) -> Dict:
         """Skip to next track"""
-        return cls._api_request('POST', '/me/player/next')
+        _invalidate_cached('spotify:now_playing')
+        return await cls._api_request('POST', cls._NEXT_URL)
     
     @classmethod
-    def previous_track(cls) -> Dict:
+    async def previous_track(cls) -> Dict:
         """Skip to previous track"""
-        return cls._api_request('POST', '/me/player/previous')
+        _invalidate_cached('spotify:now_playing')
+        return await cls._api_request('POST', cls._PREV_URL)
     
     @classmethod
-    def transfer_playback(cls, device_id: str, play: bool = True) -> Dict:
+    async def transfer_playback(cls, device_id: str, play: bool = True) -> Dict:
         """Transfer playback to a specific device"""
-        return cls._api_request('PUT', '/me/player', {
+        _invalidate_cached('spotify:now_playing', 'spotify:devices')
+        return await cls._api_request('PUT', cls._PLAYER_URL, {
             'device_ids': [device_id],
             'play': play
         })
     
     @classmethod
-    def get_status(cls) -> Dict:
+    async def get_status(cls) -> Dict:
         """Get Spotify connection status"""
         if not cls.is_configured():
             return {
@@ -898,29 +1300,41 @@ class SpotifyManager:
                 'message': 'Spotify not connected. Click Connect to link your account.'
             }
         
-        # Get user profile
-        profile = cls._get_user_profile()
-        
-        # Safely get user image (might be empty array)
-        user_image = ''
-        if profile:
-            images = profile.get('images', [])
-            if images and len(images) > 0:
-                user_image = images[0].get('url', '')
-        
+        # Get user profile (TTL-cached, so this rarely hits /me)
+        profile = await cls._get_user_profile() or {}
+
+        # Safely get user image (might be an empty array)
+        images = profile.get('images') or ()
         return {
             'configured': True,
             'connected': True,
             'user': {
                 'id': Config.SPOTIFY_USER_ID,
-                'display_name': profile.get('display_name', '') if profile else '',
-                'image': user_image
+                'display_name': profile.get('display_name', ''),
+                'image': images[0].get('url', '') if images else ''
             }
         }
     
+    @classmethod
+    async def get_dashboard_bundle(cls) -> Dict:
+        """Fetch status, now-playing, and devices concurrently.
+
+        One poll cycle costs the slowest of the three requests instead of
+        their sum - they multiplex on the shared HTTP/2 connection.
+        """
+        status, now_playing, devices = await asyncio.gather(
+            cls.get_status(),
+            cls.get_now_playing(),
+            cls.get_devices()
+        )
+        return {'status': status, 'now_playing': now_playing, 'devices': devices}
+
     @classmethod
     def disconnect(cls):
         """Disconnect Spotify (clear tokens)"""
+        # Drop cached API responses - the profile cache lives 300s, long
+        # enough for a reconnect to pick up the previous account's identity
+        _invalidate_cached('spotify:profile', 'spotify:now_playing', 'spotify:devices')
         Config.SPOTIFY_ACCESS_TOKEN = ""
         Config.SPOTIFY_REFRESH_TOKEN = ""
         Config.SPOTIFY_TOKEN_EXPIRES_AT = 0
@@ -934,6 +1348,55 @@ class SpotifyManager:
 # GOOGLE NEST INTEGRATION (SDM API)
 # ============================================================================
 
+# Fully-qualified SDM trait keys, bound once at module level so the
+# per-poll lookups in _normalize_thermostat hash pre-built constants
+# instead of re-creating 30+ char literals, plus one shared empty-dict
+# default instead of a fresh {} allocation per missing trait (read-only:
+# .get() results are never mutated)
+_EMPTY: Dict = {}
+_T_INFO = 'sdm.devices.traits.Info'
+_T_TEMPERATURE = 'sdm.devices.traits.Temperature'
+_T_HUMIDITY = 'sdm.devices.traits.Humidity'
+_T_MODE = 'sdm.devices.traits.ThermostatMode'
+_T_HVAC = 'sdm.devices.traits.ThermostatHvac'
+_T_SETPOINT = 'sdm.devices.traits.ThermostatTemperatureSetpoint'
+_T_ECO = 'sdm.devices.traits.ThermostatEco'
+_T_FAN = 'sdm.devices.traits.Fan'
+_T_CONNECTIVITY = 'sdm.devices.traits.Connectivity'
+
+def _c_to_f(c):
+    """Celsius to Fahrenheit, passing None through.
+
+    The fused c*1.8 form is a single multiply instead of the div+mul
+    that (c * 9/5) compiles to."""
+    return None if c is None else round(c * 1.8 + 32.0, 1)
+
+
+@dataclass(slots=True)
+class ThermostatReading:
+    """Normalized SDM thermostat snapshot.
+
+    A slots dataclass is considerably smaller than the 17-key dict it
+    replaces and FastAPI serializes it to the same JSON shape, so the
+    API response is unchanged."""
+    device_id: str
+    display_name: str
+    ambient_temperature_f: Optional[float]
+    ambient_temperature_c: Optional[float]
+    humidity_percent: Optional[float]
+    hvac_mode: str
+    hvac_status: str
+    available_modes: List[str]
+    heat_setpoint_f: Optional[float]
+    cool_setpoint_f: Optional[float]
+    eco_mode: str
+    eco_heat_f: Optional[float]
+    eco_cool_f: Optional[float]
+    fan_status: str
+    connectivity: str
+    is_online: bool
+
+
 class NestManager:
     """Handle Google Nest Smart Device Management API interactions"""
     
@@ -941,9 +1404,21 @@ class NestManager:
     GOOGLE_TOKEN_URL = "https://www.googleapis.com/oauth2/v4/token"
     SDM_API_BASE = "https://smartdevicemanagement.googleapis.com/v1"
     
-    # OAuth state storage
-    _oauth_state = None
-    
+    # Outstanding OAuth states -> expiry timestamp (see SpotifyManager)
+    _oauth_states: Dict[str, float] = {}
+    OAUTH_STATE_TTL = 600
+
+    # Cached static auth-URL prefix: ((project_id, client_id, redirect_uri), prefix)
+    _auth_prefix_cache = None
+
+    # Keeps the fire-and-forget token-revoke task alive: the loop holds
+    # only a weak reference, so an unreferenced task can be collected
+    # before it runs
+    _revoke_task = None
+
+    # Background token-refresh task handle
+    _refresher_task = None
+
     # Error codes for consistent error handling
     ERROR_CODES = {
         'not_connected': {'code': 'not_connected', 'message': 'Nest is not connected. Please connect your account.'},
@@ -983,32 +1458,68 @@ class NestManager:
         if not cls.is_configured():
             raise ValueError("Nest credentials must be configured")
         
-        # Generate secure state parameter
-        cls._oauth_state = secrets.token_urlsafe(32)
-        
-        # Build the Nest partner connection auth URL
-        auth_url = cls.NEST_AUTH_URL.format(project_id=Config.NEST_PROJECT_ID)
-        
-        params = {
-            'redirect_uri': Config.NEST_REDIRECT_URI,
-            'access_type': 'offline',
-            'prompt': 'consent',
-            'client_id': Config.NEST_CLIENT_ID,
-            'response_type': 'code',
-            'scope': 'https://www.googleapis.com/auth/sdm.service',
-            'state': cls._oauth_state
-        }
-        
-        return f"{auth_url}?{urllib.parse.urlencode(params)}"
-    
+        # Generate secure state parameter and register it with an expiry,
+        # dropping any stale states while we're here
+        state = secrets.token_urlsafe(32)
+        now = time.time()
+        cls._oauth_states = {s: exp for s, exp in cls._oauth_states.items() if exp > now}
+        cls._oauth_states[state] = now + cls.OAUTH_STATE_TTL
+
+        # Only state changes between calls - build the partner connection URL
+        # and urlencode the static params once, rebuilding on config change
+        key = (Config.NEST_PROJECT_ID, Config.NEST_CLIENT_ID, Config.NEST_REDIRECT_URI)
+        cached = cls._auth_prefix_cache
+        if cached and cached[0] == key:
+            prefix = cached[1]
+        else:
+            auth_url = cls.NEST_AUTH_URL.format(project_id=Config.NEST_PROJECT_ID)
+            prefix = f"{auth_url}?" + urllib.parse.urlencode({
+                'redirect_uri': Config.NEST_REDIRECT_URI,
+                'access_type': 'offline',
+                'prompt': 'consent',
+                'client_id': Config.NEST_CLIENT_ID,
+                'response_type': 'code',
+                'scope': 'https://www.googleapis.com/auth/sdm.service'
+            })
+            cls._auth_prefix_cache = (key, prefix)
+
+        # token_urlsafe output needs no URL encoding
+        return f"{prefix}&state={state}"
+
     @classmethod
     def validate_state(cls, state: str) -> bool:
-        """Validate OAuth state parameter"""
-        if not cls._oauth_state or state != cls._oauth_state:
+        """Validate and consume an OAuth state parameter"""
+        if not state:
             return False
-        cls._oauth_state = None  # Clear after use
-        return True
+        # Bytes on both sides: compare_digest raises on non-ASCII str
+        state_b = state.encode()
+        matched = None
+        for issued in cls._oauth_states:
+            if hmac.compare_digest(state_b, issued.encode()):
+                matched = issued
+        if matched is None:
+            return False
+        expiry = cls._oauth_states.pop(matched)  # Single use
+        return time.time() < expiry
     
+
+    @classmethod
+    async def _token_refresher(cls):
+        """Background task: refresh the access token shortly before expiry
+        so user-facing requests never pay the token round-trip"""
+        while cls.is_connected():
+            wait = max(60, Config.NEST_TOKEN_EXPIRES_AT - time.time() - 300)
+            await asyncio.sleep(wait)
+            if not cls.is_connected():
+                break
+            await cls.refresh_token()
+
+    @classmethod
+    def start_token_refresher(cls):
+        """Launch the background refresher once"""
+        if cls._refresher_task is None or cls._refresher_task.done():
+            cls._refresher_task = asyncio.create_task(cls._token_refresher())
+
     @classmethod
     async def exchange_code(cls, code: str) -> dict:
         """Exchange authorization code for tokens"""
@@ -1016,7 +1527,7 @@ class NestManager:
             return {'error': cls.ERROR_CODES['not_configured']}
         
         try:
-            response = requests.post(
+            response = await http_client.post(
                 cls.GOOGLE_TOKEN_URL,
                 data={
                     'client_id': Config.NEST_CLIENT_ID,
@@ -1032,34 +1543,52 @@ class NestManager:
                 logger.error(f"Nest token exchange failed: {response.status_code} - {response.text}")
                 return {'error': 'token_exchange_failed', 'details': response.text}
             
-            token_data = response.json()
+            token_data = _json_loads(response.content)
             
             # Store tokens
             Config.NEST_ACCESS_TOKEN = token_data.get('access_token', '')
             Config.NEST_REFRESH_TOKEN = token_data.get('refresh_token', '')
-            Config.NEST_TOKEN_EXPIRES_AT = datetime.now().timestamp() + token_data.get('expires_in', 3600)
+            Config.NEST_TOKEN_EXPIRES_AT = time.time() + token_data.get('expires_in', 3600)
             Config.NEST_CONNECTED = True
             Config.NEST_LAST_SYNC = datetime.now().isoformat()
             
-            # Save to config file
-            save_config_to_file()
+            # Save to config file (thread so the write doesn't block the loop)
+            await asyncio.to_thread(save_config_to_file)
             
             logger.info("Nest connected successfully")
+            cls.start_token_refresher()
             return {'success': True}
             
         except Exception as e:
             logger.error(f"Nest token exchange error: {e}")
             return {'error': 'token_exchange_error', 'details': str(e)}
     
+    # In-flight refresh task shared by concurrent callers
+    _refresh_inflight = None
+
+    @classmethod
+    async def refresh_token(cls) -> bool:
+        """Refresh the access token using the refresh token.
+
+        Single-flight: concurrent callers (dashboard poll + now-playing +
+        devices all hitting a 401 at once) await the same in-flight refresh
+        instead of issuing parallel token requests. Safe without a lock -
+        there is no await between the check and the task creation.
+        """
+        task = cls._refresh_inflight
+        if task is None or task.done():
+            task = asyncio.create_task(cls._do_refresh_token())
+            cls._refresh_inflight = task
+        return await task
+
     @classmethod
-    def refresh_token(cls) -> bool:
-        """Refresh the access token using refresh token"""
+    async def _do_refresh_token(cls) -> bool:
         if not Config.NEST_REFRESH_TOKEN:
             logger.error("No Nest refresh token available")
             return False
         
         try:
-            response = requests.post(
+            response = await http_client.post(
                 cls.GOOGLE_TOKEN_URL,
                 data={
                     'client_id': Config.NEST_CLIENT_ID,
@@ -1074,15 +1603,15 @@ class NestManager:
                 logger.error(f"Nest token refresh failed: {response.status_code}")
                 return False
             
-            token_data = response.json()
+            token_data = _json_loads(response.content)
             Config.NEST_ACCESS_TOKEN = token_data.get('access_token', '')
-            Config.NEST_TOKEN_EXPIRES_AT = datetime.now().timestamp() + token_data.get('expires_in', 3600)
+            Config.NEST_TOKEN_EXPIRES_AT = time.time() + token_data.get('expires_in', 3600)
             
             # Google sometimes returns a new refresh token
             if 'refresh_token' in token_data:
                 Config.NEST_REFRESH_TOKEN = token_data['refresh_token']
-            
-            save_config_to_file()
+
+            _mark_config_dirty()
             logger.info("Nest token refreshed")
             return True
             
@@ -1091,47 +1620,47 @@ class NestManager:
             return False
     
     @classmethod
-    def _ensure_valid_token(cls) -> bool:
+    async def _ensure_valid_token(cls) -> bool:
         """Ensure we have a valid access token, refreshing if needed"""
         if not cls.is_connected():
             return False
         
         # Check if token is expired or about to expire (5 min buffer)
-        if datetime.now().timestamp() >= Config.NEST_TOKEN_EXPIRES_AT - 300:
-            return cls.refresh_token()
+        if time.time() >= Config.NEST_TOKEN_EXPIRES_AT - 300:
+            return await cls.refresh_token()
         
         return True
     
     @classmethod
-    def _api_request(cls, method: str, endpoint: str, retry_on_401: bool = True) -> dict:
+    async def _api_request(cls, method: str, endpoint: str, retry_on_401: bool = True) -> dict:
         """Make an SDM API request with automatic token refresh"""
-        if not cls._ensure_valid_token():
+        if not await cls._ensure_valid_token():
             return {'error': cls.ERROR_CODES['not_connected']}
         
         try:
             url = f"{cls.SDM_API_BASE}{endpoint}"
             headers = {'Authorization': f'Bearer {Config.NEST_ACCESS_TOKEN}'}
             
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, timeout=15)
+            if method == 'GET':
+                response = await _get_with_retries(url, headers)
             else:
-                response = requests.request(method, url, headers=headers, timeout=15)
+                response = await http_client.request(method, url, headers=headers)
             
             if response.status_code == 401 and retry_on_401:
                 # Try refreshing token
-                if cls.refresh_token():
-                    return cls._api_request(method, endpoint, retry_on_401=False)
+                if await cls.refresh_token():
+                    return await cls._api_request(method, endpoint, retry_on_401=False)
                 return {'error': cls.ERROR_CODES['needs_reauth']}
             
             if response.status_code == 200:
                 Config.NEST_LAST_SYNC = datetime.now().isoformat()
-                save_config_to_file()
-                return response.json()
+                _mark_config_dirty()
+                return _json_loads(response.content)
             else:
                 logger.error(f"Nest API error: {response.status_code} - {response.text}")
                 return {'error': cls.ERROR_CODES['api_error'], 'status_code': response.status_code}
                 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             logger.error("Nest API request timed out")
             return {'error': {'code': 'timeout', 'message': 'Request timed out'}}
         except Exception as e:
@@ -1139,20 +1668,25 @@ class NestManager:
             return {'error': cls.ERROR_CODES['api_error'], 'details': str(e)}
     
     @classmethod
-    def get_devices(cls) -> dict:
+    async def get_devices(cls) -> dict:
         """Get list of Nest devices"""
         if not cls.is_connected():
             return {'error': cls.ERROR_CODES['not_connected']}
-        
-        return cls._api_request('GET', f'/enterprises/{Config.NEST_PROJECT_ID}/devices')
+
+        return await cls._api_request('GET', f'/enterprises/{Config.NEST_PROJECT_ID}/devices')
     
     @classmethod
-    def get_thermostat_data(cls) -> dict:
+    async def get_thermostat_data(cls) -> dict:
+        """Get thermostat readings (cached to absorb dashboard polling)"""
+        return await _cached('nest:thermostats', 15, cls._fetch_thermostat_data)
+
+    @classmethod
+    async def _fetch_thermostat_data(cls) -> dict:
         """Get thermostat readings with normalized data structure"""
         if not cls.is_connected():
             return {'error': cls.ERROR_CODES['not_connected'], 'connected': False}
         
-        devices_response = cls.get_devices()
+        devices_response = await cls.get_devices()
         
         if 'error' in devices_response:
             return devices_response
@@ -1177,89 +1711,84 @@ class NestManager:
         }
     
     @classmethod
-    def _normalize_thermostat(cls, device: dict) -> dict:
+    def _normalize_thermostat(cls, device: dict) -> ThermostatReading:
         """Normalize SDM device traits to a clean thermostat object"""
         traits = device.get('traits', {})
         
         # Extract device name
         device_name = device.get('name', '').split('/')[-1]
-        custom_name = traits.get('sdm.devices.traits.Info', {}).get('customName', '')
+        custom_name = traits.get(_T_INFO, _EMPTY).get('customName', '')
         display_name = custom_name if custom_name else device_name[:8]
         
         # Temperature (SDM reports in Celsius)
-        temp_trait = traits.get('sdm.devices.traits.Temperature', {})
+        temp_trait = traits.get(_T_TEMPERATURE, _EMPTY)
         ambient_temp_c = temp_trait.get('ambientTemperatureCelsius')
-        ambient_temp_f = round((ambient_temp_c * 9/5) + 32, 1) if ambient_temp_c is not None else None
+        ambient_temp_f = _c_to_f(ambient_temp_c)
         
         # Humidity
-        humidity_trait = traits.get('sdm.devices.traits.Humidity', {})
+        humidity_trait = traits.get(_T_HUMIDITY, _EMPTY)
         humidity = humidity_trait.get('ambientHumidityPercent')
         
         # HVAC Mode
-        mode_trait = traits.get('sdm.devices.traits.ThermostatMode', {})
+        mode_trait = traits.get(_T_MODE, _EMPTY)
         hvac_mode = mode_trait.get('mode', 'UNKNOWN')  # HEAT, COOL, HEATCOOL, OFF
         available_modes = mode_trait.get('availableModes', [])
         
         # HVAC Status (what it's actively doing)
-        hvac_trait = traits.get('sdm.devices.traits.ThermostatHvac', {})
+        hvac_trait = traits.get(_T_HVAC, _EMPTY)
         hvac_status = hvac_trait.get('status', 'UNKNOWN')  # HEATING, COOLING, OFF
         
         # Temperature setpoints
-        setpoint_trait = traits.get('sdm.devices.traits.ThermostatTemperatureSetpoint', {})
+        setpoint_trait = traits.get(_T_SETPOINT, _EMPTY)
         heat_setpoint_c = setpoint_trait.get('heatCelsius')
         cool_setpoint_c = setpoint_trait.get('coolCelsius')
-        heat_setpoint_f = round((heat_setpoint_c * 9/5) + 32, 1) if heat_setpoint_c is not None else None
-        cool_setpoint_f = round((cool_setpoint_c * 9/5) + 32, 1) if cool_setpoint_c is not None else None
+        heat_setpoint_f = _c_to_f(heat_setpoint_c)
+        cool_setpoint_f = _c_to_f(cool_setpoint_c)
         
         # Eco mode
-        eco_trait = traits.get('sdm.devices.traits.ThermostatEco', {})
+        eco_trait = traits.get(_T_ECO, _EMPTY)
         eco_mode = eco_trait.get('mode', 'OFF')  # MANUAL_ECO, OFF
         eco_heat_c = eco_trait.get('heatCelsius')
         eco_cool_c = eco_trait.get('coolCelsius')
-        eco_heat_f = round((eco_heat_c * 9/5) + 32, 1) if eco_heat_c is not None else None
-        eco_cool_f = round((eco_cool_c * 9/5) + 32, 1) if eco_cool_c is not None else None
+        eco_heat_f = _c_to_f(eco_heat_c)
+        eco_cool_f = _c_to_f(eco_cool_c)
         
         # Fan
-        fan_trait = traits.get('sdm.devices.traits.Fan', {})
+        fan_trait = traits.get(_T_FAN, _EMPTY)
         fan_timer_mode = fan_trait.get('timerMode', 'OFF')  # ON, OFF
         
         # Connectivity
-        connectivity_trait = traits.get('sdm.devices.traits.Connectivity', {})
+        connectivity_trait = traits.get(_T_CONNECTIVITY, _EMPTY)
         connectivity_status = connectivity_trait.get('status', 'UNKNOWN')  # ONLINE, OFFLINE
         
-        return {
-            'device_id': device_name,
-            'display_name': display_name,
-            'ambient_temperature_f': ambient_temp_f,
-            'ambient_temperature_c': ambient_temp_c,
-            'humidity_percent': humidity,
-            'hvac_mode': hvac_mode,
-            'hvac_status': hvac_status,
-            'available_modes': available_modes,
-            'heat_setpoint_f': heat_setpoint_f,
-            'cool_setpoint_f': cool_setpoint_f,
-            'eco_mode': eco_mode,
-            'eco_heat_f': eco_heat_f,
-            'eco_cool_f': eco_cool_f,
-            'fan_status': fan_timer_mode,
-            'connectivity': connectivity_status,
-            'is_online': connectivity_status == 'ONLINE'
-        }
+        return ThermostatReading(
+            device_id=device_name,
+            display_name=display_name,
+            ambient_temperature_f=ambient_temp_f,
+            ambient_temperature_c=ambient_temp_c,
+            humidity_percent=humidity,
+            hvac_mode=hvac_mode,
+            hvac_status=hvac_status,
+            available_modes=available_modes,
+            heat_setpoint_f=heat_setpoint_f,
+            cool_setpoint_f=cool_setpoint_f,
+            eco_mode=eco_mode,
+            eco_heat_f=eco_heat_f,
+            eco_cool_f=eco_cool_f,
+            fan_status=fan_timer_mode,
+            connectivity=connectivity_status,
+            is_online=connectivity_status == 'ONLINE'
+        )
     
     @classmethod
     def disconnect(cls):
         """Disconnect Nest (clear tokens)"""
-        # Optionally revoke token with Google
+        # Revoke the token with Google in the background - the remote
+        # call is non-essential and the UI shouldn't wait up to 5s for it
         if Config.NEST_ACCESS_TOKEN:
-            try:
-                requests.post(
-                    'https://oauth2.googleapis.com/revoke',
-                    params={'token': Config.NEST_ACCESS_TOKEN},
-                    timeout=5
-                )
-            except Exception as e:
-                logger.warning(f"Could not revoke Nest token: {e}")
-        
+            cls._revoke_task = asyncio.create_task(cls._revoke_token(Config.NEST_ACCESS_TOKEN))
+
+        _invalidate_cached('nest:thermostats')
         Config.NEST_ACCESS_TOKEN = ""
         Config.NEST_REFRESH_TOKEN = ""
         Config.NEST_TOKEN_EXPIRES_AT = 0
@@ -1268,11 +1797,88 @@ class NestManager:
         save_config_to_file()
         logger.info("Nest disconnected")
 
+    @classmethod
+    async def _revoke_token(cls, token: str):
+        """Fire-and-forget revoke; failures are logged, never propagated"""
+        try:
+            await http_client.post(
+                'https://oauth2.googleapis.com/revoke',
+                params={'token': token},
+                timeout=5
+            )
+        except Exception as e:
+            logger.warning(f"Could not revoke Nest token: {e}")
+
 
 # ============================================================================
 # JARVIS AI AGENT - Family Household Assistant
 # ============================================================================
 
+# Weather keywords that make a condition change worth announcing
+_WX_KEYWORDS = ("rain", "storm", "snow", "thunder", "clear", "sunny")
+
+def _weather_mask(description: str) -> int:
+    """Bitmask of significant weather keywords present in a description"""
+    m = 0
+    for i, k in enumerate(_WX_KEYWORDS):
+        if k in description:
+            m |= 1 << i
+    return m
+
+# Greeting per hour of day: a tuple index instead of a branch chain
+_TIME_OF_DAY = (
+    ("night owl",) * 6      # 00-05
+    + ("morning",) * 6      # 06-11
+    + ("afternoon",) * 5    # 12-16
+    + ("evening",) * 4      # 17-20
+    + ("night",) * 3        # 21-23
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _render_jarvis_prompt(weather_tuple, today_tuple, upcoming_tuple,
+                          time_of_day: str, now_str: str, date_str: str) -> str:
+    """Render the briefing prompt from pre-reduced inputs (memoized)"""
+    weather_info = "No weather data available"
+    if weather_tuple:
+        temp, feels, condition, humidity = weather_tuple
+        weather_info = (
+            f"{temp if temp is not None else 'N/A'}°F "
+            f"(feels like {feels if feels is not None else temp}°F), "
+            f"{condition or 'unknown'}, "
+            f"{humidity if humidity is not None else 'N/A'}% humidity"
+        )
+
+    today_str = "No events today"
+    if today_tuple:
+        today_str = "\n".join(f"- {title} at {time_str}" for title, time_str in today_tuple)
+
+    upcoming_str = "No upcoming events"
+    if upcoming_tuple:
+        upcoming_str = "\n".join(f"- {title} on {date}" for title, date in upcoming_tuple)
+
+    return f"""You are Jarvis, the friendly AI assistant for this family's smart home wall clock.
+Your job is to give a brief, warm, casual update about the day. Keep it SHORT (2-3 sentences max).
+Be friendly and use occasional emojis. Address the family warmly.
+
+Current time: {now_str} ({time_of_day})
+Day: {date_str}
+
+Weather: {weather_info}
+
+Today's Events:
+{today_str}
+
+Upcoming Events:
+{upcoming_str}
+
+Give a brief, friendly update. If there's something important coming up soon, mention it!
+If the weather is notable (rain, very hot/cold), mention it casually.
+Keep the tone warm and helpful, like a friendly family assistant.
+Don't list everything - just highlight what's most relevant RIGHT NOW.
+Response should be 2-3 short sentences only."""
+
+
 class JarvisAgent:
     """
     Jarvis - Your family's AI household assistant.
@@ -1282,137 +1888,109 @@ class JarvisAgent:
     
     def __init__(self):
         self.last_weather_condition = None
+        self._last_weather_mask = 0
         self.last_weather_temp = None
         self.last_events_hash = None
         self.last_briefing = None
         self.last_briefing_time = None
         self.ferretbox_url = Config.FERRETBOX_API_URL
         self.enabled = Config.JARVIS_ENABLED
-        
-    def _get_time_of_day(self) -> str:
+        # Circuit breaker: after a timeout, skip FerretBox entirely for a
+        # cooldown instead of letting every briefing request wait it out
+        self._ferretbox_failed_at = None
+        self._circuit_cooldown = 60  # seconds
+        # In-flight generation task shared by concurrent callers
+        self._inflight = None
+        
+    def _get_time_of_day(self, now: Optional[datetime] = None) -> str:
         """Get friendly time of day greeting"""
-        hour = datetime.now().hour
-        if hour < 6:
-            return "night owl"
-        elif hour < 12:
-            return "morning"
-        elif hour < 17:
-            return "afternoon"
-        elif hour < 21:
-            return "evening"
-        else:
-            return "night"
+        return _TIME_OF_DAY[(now or datetime.now()).hour]
     
-    def _hash_events(self, events: list) -> str:
-        """Create a hash of events to detect changes"""
+    def _hash_events(self, events: list):
+        """Create a stable hash of events to detect changes"""
         if not events:
             return ""
-        # Hash based on event titles and dates (not times to avoid spam)
-        event_strs = [f"{e.get('title', '')}_{e.get('date', '')}" for e in events[:10]]
-        return hash(tuple(event_strs))
+        # Hash based on event titles and dates (not times to avoid spam).
+        # zlib.crc32 runs in C and, unlike the built-in hash(), isn't
+        # salted per process, so the digest stays comparable across
+        # restarts; field/record separators keep it unambiguous.
+        h = 0
+        for e in events[:10]:
+            h = zlib.crc32((e.get('title', '') or '').encode(), h)
+            h = zlib.crc32(b'\x1f', h)
+            h = zlib.crc32((e.get('date', '') or '').encode(), h)
+            h = zlib.crc32(b'\x1e', h)
+        return h
     
     def _is_significant_weather_change(self, new_weather: dict) -> bool:
         """Check if weather changed significantly (not just temp fluctuation)"""
         if not new_weather or not self.last_weather_condition:
             return False
-        
+
+        # A keyword starting or stopping (rain beginning, sky clearing)
+        # flips a bit; the old description's mask is cached when state
+        # updates, so only the new description is scanned here
         new_condition = new_weather.get('description', '').lower()
-        old_condition = self.last_weather_condition.lower()
-        
-        # Significant changes: rain starting, snow, storms, clearing up
-        significant_conditions = ['rain', 'storm', 'snow', 'thunder', 'clear', 'sunny']
-        
-        for condition in significant_conditions:
-            # Check if condition started or stopped
-            old_has = condition in old_condition
-            new_has = condition in new_condition
-            if old_has != new_has:
-                logger.info(f"Jarvis: Significant weather change detected: {old_condition} -> {new_condition}")
-                return True
-        
-        return False
-    
-    def _is_event_change(self, events: list) -> bool:
-        """Check if events changed (new event added, etc)"""
-        new_hash = self._hash_events(events)
-        if self.last_events_hash and new_hash != self.last_events_hash:
-            logger.info("Jarvis: Event change detected")
+        if _weather_mask(new_condition) != self._last_weather_mask:
+            logger.info(f"Jarvis: Significant weather change detected: {self.last_weather_condition.lower()} -> {new_condition}")
             return True
         return False
     
-    def _build_prompt(self, weather: dict, today_events: list, upcoming_events: list) -> str:
-        """Build a contextual prompt for Jarvis"""
-        time_of_day = self._get_time_of_day()
-        now = datetime.now()
-        
-        # Format weather info
-        weather_info = "No weather data available"
-        if weather:
-            temp = weather.get('temp', 'N/A')
-            feels = weather.get('feels_like', temp)
-            condition = weather.get('description', 'unknown')
-            humidity = weather.get('humidity', 'N/A')
-            weather_info = f"{temp}°F (feels like {feels}°F), {condition}, {humidity}% humidity"
-        
-        # Format today's events
-        today_str = "No events today"
-        if today_events:
-            events_list = []
-            for e in today_events[:5]:
-                time_str = e.get('time', 'All day')
-                events_list.append(f"- {e.get('title', 'Event')} at {time_str}")
-            today_str = "\n".join(events_list)
-        
-        # Format upcoming events
-        upcoming_str = "No upcoming events"
-        if upcoming_events:
-            events_list = []
-            for e in upcoming_events[:3]:
-                date_str = e.get('date', 'Soon')
-                events_list.append(f"- {e.get('title', 'Event')} on {date_str}")
-            upcoming_str = "\n".join(events_list)
-        
-        prompt = f"""You are Jarvis, the friendly AI assistant for this family's smart home wall clock. 
-Your job is to give a brief, warm, casual update about the day. Keep it SHORT (2-3 sentences max).
-Be friendly and use occasional emojis. Address the family warmly.
-
-Current time: {now.strftime('%I:%M %p')} ({time_of_day})
-Day: {now.strftime('%A, %B %d')}
-
-Weather: {weather_info}
-
-Today's Events:
-{today_str}
-
-Upcoming Events:
-{upcoming_str}
+    def _build_prompt(self, weather: dict, today_events: list, upcoming_events: list,
+                      now: Optional[datetime] = None) -> str:
+        """Build a contextual prompt for Jarvis.
 
-Give a brief, friendly update. If there's something important coming up soon, mention it!
-If the weather is notable (rain, very hot/cold), mention it casually.
-Keep the tone warm and helpful, like a friendly family assistant.
-Don't list everything - just highlight what's most relevant RIGHT NOW.
-Response should be 2-3 short sentences only."""
+        Reduces the inputs to hashable tuples and delegates to a memoized
+        renderer, so back-to-back briefings with identical inputs (same
+        minute, same weather, same events) skip the strftime/f-string work.
+        """
+        now = now or datetime.now()
+        weather = weather or {}
+        weather_tuple = (
+            weather.get('temp'), weather.get('feels_like'),
+            weather.get('description'), weather.get('humidity')
+        ) if weather else None
+        today_tuple = tuple(
+            (e.get('title', 'Event'), e.get('time', 'All day')) for e in today_events[:5]
+        )
+        upcoming_tuple = tuple(
+            (e.get('title', 'Event'), e.get('date', 'Soon')) for e in upcoming_events[:3]
+        )
+        return _render_jarvis_prompt(
+            weather_tuple, today_tuple, upcoming_tuple,
+            self._get_time_of_day(now),
+            now.strftime('%I:%M %p'),
+            now.strftime('%A, %B %d')
+        )
 
-        return prompt
-    
-    def _sync_check_ferretbox(self):
-        """Synchronous FerretBox check (run in thread)"""
-        response = requests.get(f"{self.ferretbox_url}/api/status", timeout=5)
-        return response
-    
     async def check_ferretbox_status(self) -> dict:
         """Check if FerretBox is reachable and get status"""
         try:
-            response = await asyncio.to_thread(self._sync_check_ferretbox)
+            response = await jarvis_http_client.get(f"{self.ferretbox_url}/api/status", timeout=5)
             if response.status_code == 200:
-                return {"online": True, "data": response.json()}
+                return {"online": True, "data": _json_loads(response.content)}
             return {"online": False, "error": f"Status code: {response.status_code}"}
         except Exception as e:
             logger.warning(f"Jarvis: FerretBox not reachable: {e}")
             return {"online": False, "error": str(e)}
     
     async def generate_briefing(self, weather: dict, today_events: list, upcoming_events: list, force: bool = False) -> dict:
-        """Generate a new Jarvis briefing"""
+        """Generate a new Jarvis briefing.
+
+        Single-flight: concurrent callers (a dashboard refresh storm, or
+        force=true from two clients) await the same in-flight generation
+        instead of each launching a FerretBox call. Safe without a lock -
+        there is no await between the check and the task creation.
+        """
+        task = self._inflight
+        if task is None or task.done():
+            task = asyncio.create_task(
+                self._generate_briefing(weather, today_events, upcoming_events, force)
+            )
+            self._inflight = task
+        return await task
+
+    async def _generate_briefing(self, weather: dict, today_events: list, upcoming_events: list, force: bool = False) -> dict:
         if not self.enabled:
             return {"message": None, "source": "disabled"}
         
@@ -1436,15 +2014,20 @@ Response should be 2-3 short sentences only."""
             should_generate = True
             trigger_reason = "weather_change"
         
-        if self._is_event_change(today_events + upcoming_events):
+        # Check for event changes - concatenate and hash once, then reuse
+        # the hash for the state update below
+        new_events_hash = self._hash_events(today_events + upcoming_events)
+        if self.last_events_hash and new_events_hash != self.last_events_hash:
+            logger.info("Jarvis: Event change detected")
             should_generate = True
             trigger_reason = "event_change"
-        
+
         # Update state tracking
         if weather:
             self.last_weather_condition = weather.get('description', '')
+            self._last_weather_mask = _weather_mask(self.last_weather_condition.lower())
             self.last_weather_temp = weather.get('temp', 0)
-        self.last_events_hash = self._hash_events(today_events + upcoming_events)
+        self.last_events_hash = new_events_hash
         
         if not should_generate and self.last_briefing:
             return {
@@ -1453,21 +2036,28 @@ Response should be 2-3 short sentences only."""
                 "generated_at": self.last_briefing_time.isoformat() if self.last_briefing_time else None
             }
         
-        # Try to generate from FerretBox (run in thread to avoid blocking)
+        # Circuit open: FerretBox recently timed out, don't pile on
+        if self._ferretbox_failed_at and time.monotonic() - self._ferretbox_failed_at < self._circuit_cooldown:
+            return self._get_fallback_message(weather, today_events, now)
+
+        # Try to generate from FerretBox (async, so other handlers keep
+        # running while the LLM thinks)
         try:
-            prompt = self._build_prompt(weather, today_events, upcoming_events)
-            
-            def _sync_call():
-                return requests.post(
+            prompt = self._build_prompt(weather, today_events, upcoming_events, now)
+
+            # Bound the tail: a hung FerretBox answers in the fallback's
+            # time, not the client's 300s read timeout. asyncio.timeout
+            # scopes the deadline without wrapping the await in an extra
+            # Task the way wait_for does.
+            async with asyncio.timeout(30):
+                response = await jarvis_http_client.post(
                     f"{self.ferretbox_url}/api/chat",
-                    json={"message": prompt},
-                    timeout=300  # 5 minutes - FerretBox can be slow when busy
+                    json={"message": prompt}
                 )
-            
-            response = await asyncio.to_thread(_sync_call)
-            
+            self._ferretbox_failed_at = None
+
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 message = data.get('response', '').strip()
                 
                 # Clean up the response (remove any system-like prefixes)
@@ -1486,19 +2076,21 @@ Response should be 2-3 short sentences only."""
                 }
             else:
                 logger.error(f"Jarvis: FerretBox returned {response.status_code}")
-                return self._get_fallback_message(weather, today_events)
+                return self._get_fallback_message(weather, today_events, now)
                 
-        except requests.exceptions.Timeout:
-            logger.warning("Jarvis: FerretBox request timed out")
-            return self._get_fallback_message(weather, today_events)
+        except (asyncio.TimeoutError, httpx.TimeoutException):
+            logger.warning("Jarvis: FerretBox request timed out, opening circuit")
+            self._ferretbox_failed_at = time.monotonic()
+            return self._get_fallback_message(weather, today_events, now)
         except Exception as e:
             logger.error(f"Jarvis: Error generating briefing: {e}")
-            return self._get_fallback_message(weather, today_events)
+            return self._get_fallback_message(weather, today_events, now)
     
-    def _get_fallback_message(self, weather: dict, today_events: list) -> dict:
+    def _get_fallback_message(self, weather: dict, today_events: list,
+                              now: Optional[datetime] = None) -> dict:
         """Generate a simple fallback message without AI"""
-        time_of_day = self._get_time_of_day()
-        now = datetime.now()
+        now = now or datetime.now()
+        time_of_day = self._get_time_of_day(now)
         
         parts = [f"Good {time_of_day}, fam! 👋"]
         
@@ -1549,15 +2141,27 @@ jarvis_agent = JarvisAgent()
 # FASTAPI APPLICATION
 # ============================================================================
 
-app = FastAPI(title="Wall Clock API", version="2.0")
+# ORJSONResponse makes every endpoint's response encode through orjson -
+# the dominant cost on the large calendar/dashboard payloads
+if _HAS_ORJSON:
+    from fastapi.responses import ORJSONResponse
+    app = FastAPI(title="Wall Clock API", version="2.0",
+                  default_response_class=ORJSONResponse)
+else:
+    app = FastAPI(title="Wall Clock API", version="2.0")
 
 # Enable CORS for frontend
+# The frontend is served by this same app, so cross-origin access only
+# happens during development. Pinning the origins lets the middleware take
+# its exact-match fast path instead of reflecting every origin, and
+# max_age lets browsers cache preflights for a day.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=Config.FRONTEND_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 # Mount static files for CSS and JS
@@ -1582,9 +2186,18 @@ note_fetcher = StickyNoteFetcher()
 # API ENDPOINTS
 # ============================================================================
 
+# Index page held in memory - the kiosk reloads / constantly and the file
+# only changes on deploy
+try:
+    _INDEX_HTML = Path("frontend/index.html").read_bytes()
+except OSError:
+    _INDEX_HTML = None
+
 @app.get("/")
 async def root():
     """Serve the frontend HTML"""
+    if _INDEX_HTML is not None:
+        return Response(content=_INDEX_HTML, media_type="text/html")
     return FileResponse("frontend/index.html")
 
 @app.get("/api/weather")
@@ -1592,14 +2205,39 @@ async def get_weather():
     """Get current weather data"""
     return await weather_fetcher.fetch_weather()
 
+def _events_etag(events: List[Dict]) -> str:
+    """Weak ETag over the event set - a crc32 of titles and datetimes is
+    far cheaper than serializing the payload it lets us skip"""
+    h = 0
+    for e in events:
+        h = zlib.crc32(e.get('title', '').encode(), h)
+        h = zlib.crc32(e.get('datetime', '').encode(), h)
+    return f'W/"{len(events)}-{h:08x}"'
+
+def _split_events(events: List[Dict]) -> tuple:
+    """Split events into (today, upcoming) buckets in a single pass"""
+    today_events, upcoming_events = [], []
+    for e in events:
+        if e.get('is_today', False):
+            today_events.append(e)
+        elif e.get('is_upcoming', False):
+            upcoming_events.append(e)
+    return today_events, upcoming_events
+
 @app.get("/api/calendar")
-async def get_calendar():
+async def get_calendar(request: Request, response: Response):
     """Get calendar events"""
     events = await calendar_fetcher.fetch_events()
 
+    # ETag from a stable digest of the event set: pollers that already
+    # have this list get an empty 304 instead of a re-serialized payload
+    etag = _events_etag(events)
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304)
+    response.headers['ETag'] = etag
+
     # Separate today and upcoming
-    today_events = [e for e in events if e.get('is_today', False)]
-    upcoming_events = [e for e in events if e.get('is_upcoming', False)]
+    today_events, upcoming_events = _split_events(events)
 
     return {
         'today': today_events,
@@ -1632,14 +2270,16 @@ async def jarvis_status():
     }
 
 @app.get("/api/jarvis/briefing")
-async def jarvis_briefing(force: bool = False):
+async def jarvis_briefing(request: Request = None, response: Response = None, force: bool = False):
     """Get current Jarvis briefing (or generate new one if force=True)"""
-    # Get current data for context
-    weather = await weather_fetcher.fetch_weather()
-    events = await calendar_fetcher.fetch_events()
-    
-    today_events = [e for e in events if e.get('is_today', False)]
-    upcoming_events = [e for e in events if e.get('is_upcoming', False)]
+    # Get current data for context - the two fetches are independent I/O,
+    # so run them concurrently
+    weather, events = await asyncio.gather(
+        weather_fetcher.fetch_weather(),
+        calendar_fetcher.fetch_events()
+    )
+
+    today_events, upcoming_events = _split_events(events)
     
     # Generate or get cached briefing
     briefing = await jarvis_agent.generate_briefing(
@@ -1648,7 +2288,16 @@ async def jarvis_briefing(force: bool = False):
         upcoming_events=upcoming_events,
         force=force
     )
-    
+
+    # A briefing only changes every ~30 minutes; pollers that already
+    # hold this one get an empty 304. The guards keep the internal
+    # jarvis_refresh call (no request context) working.
+    etag = f'W/"{zlib.crc32((briefing.get("generated_at") or "").encode()):08x}"'
+    if request is not None and request.headers.get('if-none-match') == etag:
+        return Response(status_code=304)
+    if response is not None:
+        response.headers['ETag'] = etag
+
     return briefing
 
 @app.post("/api/jarvis/refresh")
@@ -1656,38 +2305,118 @@ async def jarvis_refresh():
     """Force refresh Jarvis briefing"""
     return await jarvis_briefing(force=True)
 
+@app.get("/api/dashboard")
+async def get_dashboard():
+    """One-shot dashboard refresh: weather, calendar, Spotify and Jarvis.
+
+    Replaces four separate round trips from the frontend with a single
+    response; the independent upstream fetches run concurrently and the
+    briefing reuses the weather/events fetched here instead of refetching.
+    """
+    weather, events, spotify = await asyncio.gather(
+        weather_fetcher.fetch_weather(),
+        calendar_fetcher.fetch_events(),
+        SpotifyManager.get_dashboard_bundle(),
+    )
+    today_events, upcoming_events = _split_events(events)
+
+    briefing = await jarvis_agent.generate_briefing(
+        weather=weather,
+        today_events=today_events,
+        upcoming_events=upcoming_events
+    )
+
+    return {
+        'weather': weather,
+        'calendar': {
+            'today': today_events,
+            'upcoming': upcoming_events,
+            'all': events
+        },
+        'spotify': spotify,
+        'jarvis': briefing
+    }
+
 # ============================================================================
 # QUICK ADD EVENTS (Local storage for quick touch-screen event entry)
 # ============================================================================
 
 LOCAL_EVENTS_FILE = Path("/home/admin/ClockNotes/quick_events.json")
 
-def load_local_events():
-    """Load locally stored quick events"""
-    try:
-        if LOCAL_EVENTS_FILE.exists():
-            with open(LOCAL_EVENTS_FILE, 'r') as f:
-                return json.load(f)
-    except Exception as e:
-        logger.warning(f"Error loading local events: {e}")
-    return []
+class QuickEventsStore:
+    """Quick events kept in memory and persisted to quick_events.json.
 
-def save_local_events(events):
-    """Save locally stored quick events"""
-    try:
-        LOCAL_EVENTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(LOCAL_EVENTS_FILE, 'w') as f:
-            json.dump(events, f, indent=2)
-        return True
-    except Exception as e:
-        logger.error(f"Error saving local events: {e}")
-        return False
+    Reads serve straight from memory - the file is only touched on
+    mutation, via a temp file + os.replace so a power loss mid-write
+    can't corrupt it. Each event's datetime is parsed once at load and
+    kept alongside the dict, so the past-events filter doesn't re-run
+    fromisoformat on every entry per request. The lock serializes
+    mutations so concurrent adds can't lose each other's writes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = asyncio.Lock()
+        self._events = None  # list of (datetime, event dict), lazily loaded
+
+    async def _ensure_loaded(self):
+        if self._events is not None:
+            return
+        events = []
+        try:
+            if self.path.exists():
+                async with aiofiles.open(self.path, 'rb') as f:
+                    events = _json_loads(await f.read())
+        except Exception as e:
+            logger.warning(f"Error loading local events: {e}")
+        self._events = [(datetime.fromisoformat(e['datetime']), e) for e in events]
+
+    async def list_current(self) -> list:
+        """Events for today or later, served from memory"""
+        async with self.lock:
+            await self._ensure_loaded()
+            today = datetime.now().date()
+            return [e for dt, e in self._events if dt.date() >= today]
+
+    async def add(self, event_dt: datetime, event: dict) -> bool:
+        """Append an event, dropping past events while we're writing anyway"""
+        async with self.lock:
+            await self._ensure_loaded()
+            today = datetime.now().date()
+            pruned = [(dt, e) for dt, e in self._events if dt.date() >= today]
+            self._events = pruned + [(event_dt, event)]
+            if await self._persist():
+                return True
+            # The caller is told the save failed - roll the append back so
+            # /api/events/local doesn't show an event that isn't on disk
+            self._events = pruned
+            return False
+
+    async def remove(self, event_id: str) -> bool:
+        async with self.lock:
+            await self._ensure_loaded()
+            self._events = [(dt, e) for dt, e in self._events if e.get('id') != event_id]
+            return await self._persist()
+
+    async def _persist(self) -> bool:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix('.json.tmp')
+            async with aiofiles.open(temp_path, 'wb') as f:
+                await f.write(_json_dumps([e for _, e in self._events]))
+            os.replace(temp_path, self.path)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving local events: {e}")
+            return False
+
+quick_events_store = QuickEventsStore(LOCAL_EVENTS_FILE)
 
 @app.post("/api/events/add")
 async def add_quick_event(request: Request):
     """Add a quick event from touch screen"""
     try:
-        data = await request.json()
+        data = _json_loads(await request.body())
         
         title = data.get('title', '').strip()
         date_str = data.get('date', '')  # YYYY-MM-DD format
@@ -1710,30 +2439,26 @@ async def add_quick_event(request: Request):
         except ValueError as e:
             return {'success': False, 'error': f'Invalid date/time format: {e}'}
         
-        # Create event object
+        # Create event object - one datetime.now() and one .date() reused
+        # for the id, flags, and created_at
         now = datetime.now()
+        now_date = now.date()
+        event_day = event_date.date()
         new_event = {
-            'id': f"local_{datetime.now().timestamp()}",
+            'id': f"local_{now.timestamp()}",
             'title': title,
             'datetime': event_date.isoformat(),
             'date': event_date.strftime("%b %d"),
             'time': event_date.strftime("%I:%M %p") if not all_day else "All Day",
-            'is_today': event_date.date() == now.date(),
-            'is_upcoming': event_date.date() > now.date(),
+            'is_today': event_day == now_date,
+            'is_upcoming': event_day > now_date,
             'notes': notes,
             'all_day': all_day,
             'source': 'local',
             'created_at': now.isoformat()
         }
         
-        # Load existing events, add new one, save
-        events = load_local_events()
-        events.append(new_event)
-        
-        # Clean up past events (keep only future/today events)
-        events = [e for e in events if datetime.fromisoformat(e['datetime']).date() >= now.date()]
-        
-        if save_local_events(events):
+        if await quick_events_store.add(event_date, new_event):
             # Clear calendar cache to include new event
             calendar_fetcher.cache = None
             calendar_fetcher.last_fetch = None
@@ -1750,19 +2475,13 @@ async def add_quick_event(request: Request):
 @app.get("/api/events/local")
 async def get_local_events():
     """Get locally stored quick events"""
-    events = load_local_events()
-    # Filter out past events
-    now = datetime.now()
-    events = [e for e in events if datetime.fromisoformat(e['datetime']).date() >= now.date()]
-    return {'events': events}
+    return {'events': await quick_events_store.list_current()}
 
 @app.delete("/api/events/{event_id}")
 async def delete_local_event(event_id: str):
     """Delete a locally stored event"""
     try:
-        events = load_local_events()
-        events = [e for e in events if e.get('id') != event_id]
-        if save_local_events(events):
+        if await quick_events_store.remove(event_id):
             # Clear calendar cache
             calendar_fetcher.cache = None
             calendar_fetcher.last_fetch = None
@@ -1778,7 +2497,7 @@ async def delete_local_event(event_id: str):
 @app.get("/api/spotify/status")
 async def spotify_status():
     """Get Spotify connection status"""
-    return SpotifyManager.get_status()
+    return await SpotifyManager.get_status()
 
 @app.get("/api/spotify/connect")
 async def spotify_connect():
@@ -1797,7 +2516,7 @@ async def spotify_connect():
 async def spotify_manual_callback(request: Request):
     """Handle manual OAuth callback - user pastes the redirect URL"""
     try:
-        data = await request.json()
+        data = _json_loads(await request.body())
         callback_url = data.get('callback_url', '')
         
         if not callback_url:
@@ -1873,7 +2592,7 @@ async def spotify_token():
         return {'error': 'not_connected', 'message': 'Spotify not connected'}
     
     # Ensure token is valid (will refresh if needed)
-    if not SpotifyManager._ensure_valid_token():
+    if not await SpotifyManager._ensure_valid_token():
         return {'error': 'token_expired', 'message': 'Failed to refresh token. Please reconnect.'}
     
     return {
@@ -1881,25 +2600,30 @@ async def spotify_token():
         'expires_at': Config.SPOTIFY_TOKEN_EXPIRES_AT
     }
 
+@app.get("/api/spotify/dashboard")
+async def spotify_dashboard():
+    """Single poll endpoint: status + now-playing + devices in one cycle"""
+    return await SpotifyManager.get_dashboard_bundle()
+
 @app.get("/api/spotify/now-playing")
 async def spotify_now_playing():
     """Get currently playing track"""
-    return SpotifyManager.get_now_playing()
+    return await SpotifyManager.get_now_playing()
 
 @app.get("/api/spotify/devices")
 async def spotify_devices():
     """Get available Spotify devices (including Raspotify)"""
-    return SpotifyManager.get_devices()
+    return await SpotifyManager.get_devices()
 
 @app.post("/api/spotify/play")
 async def spotify_play(request: Request):
     """Start or resume playback on active device"""
     try:
-        data = await request.json() if request.headers.get('content-type') == 'application/json' else {}
+        data = _json_loads(await request.body()) if request.headers.get('content-type') == 'application/json' else {}
     except:
         data = {}
     
-    return SpotifyManager.play(
+    return await SpotifyManager.play(
         device_id=data.get('device_id'),
         uri=data.get('uri'),
         context_uri=data.get('context_uri')
@@ -1908,28 +2632,28 @@ async def spotify_play(request: Request):
 @app.post("/api/spotify/pause")
 async def spotify_pause():
     """Pause playback"""
-    return SpotifyManager.pause()
+    return await SpotifyManager.pause()
 
 @app.post("/api/spotify/next")
 async def spotify_next():
     """Skip to next track"""
-    return SpotifyManager.next_track()
+    return await SpotifyManager.next_track()
 
 @app.post("/api/spotify/previous")
 async def spotify_previous():
     """Skip to previous track"""
-    return SpotifyManager.previous_track()
+    return await SpotifyManager.previous_track()
 
 @app.post("/api/spotify/transfer")
 async def spotify_transfer(request: Request):
     """Transfer playback to a specific device"""
     try:
-        data = await request.json()
+        data = _json_loads(await request.body())
         device_id = data.get('device_id')
         if not device_id:
             return {'error': 'missing_device_id', 'message': 'Device ID required'}
         
-        return SpotifyManager.transfer_playback(device_id)
+        return await SpotifyManager.transfer_playback(device_id)
     except Exception as e:
         return {'error': 'transfer_failed', 'message': str(e)}
 
@@ -1993,108 +2717,147 @@ async def nest_disconnect():
 @app.get("/api/integrations/nest/thermostat")
 async def nest_thermostat():
     """Get thermostat readings"""
-    return NestManager.get_thermostat_data()
+    return await NestManager.get_thermostat_data()
 
 @app.get("/api/integrations/nest/devices")
 async def nest_devices():
     """Get all Nest devices"""
-    return NestManager.get_devices()
+    return await NestManager.get_devices()
 
 # ============================================================================
 # Configuration API
 # ============================================================================
 
 CONFIG_FILE = Path("/home/admin/wallclock/config.json")
+# Create the directory once at import instead of on every save
+CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+# Serialized masked-config payload; GET /api/config is polled by the
+# settings UI and only changes when config actually mutates, so steady
+# state is a single bytes return. save_config_to_file drops the cache.
+_masked_config_cache = None
 
 @app.get("/api/config")
 async def get_config():
     """Get current configuration (with masked secrets)"""
-    try:
-        # Return current config from memory with partially masked secrets
-        weather_config = {
-            'api_key': mask_secret(Config.WEATHER_API_KEY),
-            'city': Config.WEATHER_CITY,
-            'state': Config.WEATHER_STATE,
-            'country': Config.WEATHER_COUNTRY,
-            'units': Config.WEATHER_UNITS
-        }
-        
-        calendar_config = {
-            'update_interval': Config.CALENDAR_UPDATE_INTERVAL,
-            'max_events': Config.MAX_EVENTS_DISPLAY,
-            'accounts': [
-                {
-                    'name': acc.get('name', 'Account'),
-                    'url': acc.get('url', ''),
-                    'username': acc.get('username', ''),
-                    'password': mask_secret(acc.get('password', ''))
-                }
-                for acc in Config.CALDAV_ACCOUNTS
-            ]
-        }
-        
-        spotify_config = {
-            'client_id': mask_secret(Config.SPOTIFY_CLIENT_ID),
-            'client_secret': mask_secret(Config.SPOTIFY_CLIENT_SECRET),
-            'redirect_uri': Config.SPOTIFY_REDIRECT_URI,
-            'connected': Config.SPOTIFY_CONNECTED,
-            'user_id': Config.SPOTIFY_USER_ID
-        }
-        
-        nest_config = {
-            'project_id': mask_secret(Config.NEST_PROJECT_ID),
-            'client_id': mask_secret(Config.NEST_CLIENT_ID),
-            'client_secret': mask_secret(Config.NEST_CLIENT_SECRET),
-            'redirect_uri': Config.NEST_REDIRECT_URI,
-            'connected': Config.NEST_CONNECTED,
-            'last_sync': Config.NEST_LAST_SYNC
-        }
-        
-        return {
-            'weather': weather_config,
-            'calendar': calendar_config,
-            'spotify': spotify_config,
-            'nest': nest_config
-        }
-    except Exception as e:
-        logger.error(f"Error getting config: {e}")
-        return {'error': str(e)}
+    global _masked_config_cache
+    if _masked_config_cache is not None:
+        return Response(content=_masked_config_cache, media_type='application/json')
+    # Build from memory with partially masked secrets. No try/except:
+    # this only reads Config attributes that exist from startup, and an
+    # unexpected failure is better surfaced as a framework 500 than
+    # swallowed into a 200 error payload.
+    weather_config = {
+        'api_key': mask_secret(Config.WEATHER_API_KEY),
+        'city': Config.WEATHER_CITY,
+        'state': Config.WEATHER_STATE,
+        'country': Config.WEATHER_COUNTRY,
+        'units': Config.WEATHER_UNITS
+    }
+    
+    calendar_config = {
+        'update_interval': Config.CALENDAR_UPDATE_INTERVAL,
+        'max_events': Config.MAX_EVENTS_DISPLAY,
+        'accounts': [
+            {
+                'name': acc.get('name', 'Account'),
+                'url': acc.get('url', ''),
+                'username': acc.get('username', ''),
+                'password': mask_secret(acc.get('password', ''))
+            }
+            for acc in Config.CALDAV_ACCOUNTS
+        ]
+    }
+    
+    spotify_config = {
+        'client_id': mask_secret(Config.SPOTIFY_CLIENT_ID),
+        'client_secret': mask_secret(Config.SPOTIFY_CLIENT_SECRET),
+        'redirect_uri': Config.SPOTIFY_REDIRECT_URI,
+        'connected': Config.SPOTIFY_CONNECTED,
+        'user_id': Config.SPOTIFY_USER_ID
+    }
+    
+    nest_config = {
+        'project_id': mask_secret(Config.NEST_PROJECT_ID),
+        'client_id': mask_secret(Config.NEST_CLIENT_ID),
+        'client_secret': mask_secret(Config.NEST_CLIENT_SECRET),
+        'redirect_uri': Config.NEST_REDIRECT_URI,
+        'connected': Config.NEST_CONNECTED,
+        'last_sync': Config.NEST_LAST_SYNC
+    }
+    
+    _masked_config_cache = _json_dumps({
+        'weather': weather_config,
+        'calendar': calendar_config,
+        'spotify': spotify_config,
+        'nest': nest_config
+    })
+    return Response(content=_masked_config_cache, media_type='application/json')
+
+# Prefix the UI uses for masked secrets; slice-compare beats startswith
+# for a short constant prefix (no method lookup, no argument parsing)
+_MASK = '••••'
+
+def _is_masked(v: str) -> bool:
+    return v[:4] == _MASK
+
+# UI-editable scalar config fields: payload key -> Config attribute, plus
+# whether the UI masks the value (masked values round-trip as bullets and
+# must never overwrite the stored secret)
+_CONFIG_FIELD_MAP = {
+    'weather': (
+        ('api_key', 'WEATHER_API_KEY', True),
+        ('city', 'WEATHER_CITY', False),
+        ('state', 'WEATHER_STATE', False),
+        ('country', 'WEATHER_COUNTRY', False),
+        ('units', 'WEATHER_UNITS', False),
+    ),
+    'calendar': (
+        ('update_interval', 'CALENDAR_UPDATE_INTERVAL', False),
+        ('max_events', 'MAX_EVENTS_DISPLAY', False),
+    ),
+    'spotify': (
+        ('client_id', 'SPOTIFY_CLIENT_ID', True),
+        ('client_secret', 'SPOTIFY_CLIENT_SECRET', True),
+        ('redirect_uri', 'SPOTIFY_REDIRECT_URI', False),
+    ),
+    'nest': (
+        ('project_id', 'NEST_PROJECT_ID', True),
+        ('client_id', 'NEST_CLIENT_ID', True),
+        ('client_secret', 'NEST_CLIENT_SECRET', True),
+        ('redirect_uri', 'NEST_REDIRECT_URI', False),
+    ),
+}
 
 @app.post("/api/config")
 async def save_config(request: Request):
     """Save configuration"""
-    global weather_fetcher, calendar_fetcher
-    
     try:
-        data = await request.json()
-        
-        # Update weather config
-        if 'weather' in data:
-            w = data['weather']
-            if w.get('api_key') and not w['api_key'].startswith('••••'):
-                Config.WEATHER_API_KEY = w['api_key']
-            if w.get('city'):
-                Config.WEATHER_CITY = w['city']
-            if w.get('state'):
-                Config.WEATHER_STATE = w['state']
-            if w.get('country'):
-                Config.WEATHER_COUNTRY = w['country']
-            if w.get('units'):
-                Config.WEATHER_UNITS = w['units']
-        
-        # Update calendar config
+        data = _json_loads(await request.body())
+
+        # Scalar fields are table-driven; skip empty values and masked
+        # secrets so the UI can round-trip what GET /api/config returned
+        for section, fields in _CONFIG_FIELD_MAP.items():
+            d = data.get(section)
+            if not d:
+                continue
+            for key, attr, secret in fields:
+                v = d.get(key)
+                if not v or (secret and _is_masked(v)):
+                    continue
+                setattr(Config, attr, v)
+
+        # CalDAV accounts need merge logic the table can't express
         if 'calendar' in data:
             c = data['calendar']
-            if c.get('update_interval'):
-                Config.CALENDAR_UPDATE_INTERVAL = c['update_interval']
-            if c.get('max_events'):
-                Config.MAX_EVENTS_DISPLAY = c['max_events']
-            
             # Update accounts (only if password is not masked)
             if 'accounts' in c:
+                # Index existing accounts once instead of scanning the
+                # list for every submitted account
+                existing_by_user = {a.get('username'): a for a in Config.CALDAV_ACCOUNTS}
                 new_accounts = []
                 for acc in c['accounts']:
-                    if acc.get('password') and not acc['password'].startswith('••••'):
+                    if acc.get('password') and not _is_masked(acc['password']):
                         # New password provided
                         new_accounts.append({
                             'name': acc.get('name', 'Account'),
@@ -2104,11 +2867,7 @@ async def save_config(request: Request):
                         })
                     else:
                         # Try to preserve existing password
-                        existing = next(
-                            (a for a in Config.CALDAV_ACCOUNTS 
-                             if a.get('username') == acc.get('username')),
-                            None
-                        )
+                        existing = existing_by_user.get(acc.get('username'))
                         if existing:
                             new_accounts.append({
                                 'name': acc.get('name', existing.get('name', 'Account')),
@@ -2119,108 +2878,127 @@ async def save_config(request: Request):
                 
                 if new_accounts:
                     Config.CALDAV_ACCOUNTS = new_accounts
+
+        # Persist through the shared debounce: bursts of saves (a user
+        # tweaking fields and re-submitting) collapse into one write.
+        # Config in memory is already updated, so the response doesn't
+        # need to wait for the disk.
+        _mark_config_dirty()
         
-        # Update Spotify config
-        if 'spotify' in data:
-            s = data['spotify']
-            if s.get('client_id') and not s['client_id'].startswith('••••'):
-                Config.SPOTIFY_CLIENT_ID = s['client_id']
-            if s.get('client_secret') and not s['client_secret'].startswith('••••'):
-                Config.SPOTIFY_CLIENT_SECRET = s['client_secret']
-            if s.get('redirect_uri'):
-                Config.SPOTIFY_REDIRECT_URI = s['redirect_uri']
-        
-        # Update Nest config
-        if 'nest' in data:
-            n = data['nest']
-            if n.get('project_id') and not n['project_id'].startswith('••••'):
-                Config.NEST_PROJECT_ID = n['project_id']
-            if n.get('client_id') and not n['client_id'].startswith('••••'):
-                Config.NEST_CLIENT_ID = n['client_id']
-            if n.get('client_secret') and not n['client_secret'].startswith('••••'):
-                Config.NEST_CLIENT_SECRET = n['client_secret']
-            if n.get('redirect_uri'):
-                Config.NEST_REDIRECT_URI = n['redirect_uri']
-        
-        # Save to config file for persistence
-        save_config_to_file()
-        
-        # Reinitialize fetchers with new config
-        weather_fetcher = WeatherFetcher()
-        calendar_fetcher = CalendarFetcher()
-        
-        # Clear caches to force refresh
-        weather_fetcher.cache = None
-        weather_fetcher.last_fetch = None
-        calendar_fetcher.cache = []
-        calendar_fetcher.last_fetch = None
+        # Apply the new config to the existing fetchers in place -
+        # no teardown/rebuild, and caches are cleared to force a refresh
+        weather_fetcher.reload_config()
+        calendar_fetcher.reload_config()
         
+        # Drop memoized masks and the cached GET /api/config payload
+        # immediately - the flush task would only do it after the
+        # debounce window, and the UI refetches right away
+        mask_secret.cache_clear()
+        global _masked_config_cache
+        _masked_config_cache = None
+
         logger.info("Configuration updated successfully")
-        return {'success': True, 'message': 'Configuration saved'}
-        
+        # Serialize here to skip FastAPI's jsonable_encoder walk
+        return Response(content=_json_dumps({'success': True, 'message': 'Configuration saved'}),
+                        media_type='application/json')
+
     except Exception as e:
-        logger.error(f"Error saving config: {e}")
-        return {'success': False, 'error': str(e)}
+        logger.error("Error saving config: %s", e)
+        return Response(content=_json_dumps({'success': False, 'error': str(e)}),
+                        media_type='application/json')
 
+@functools.lru_cache(maxsize=64)
 def mask_secret(secret: str) -> str:
-    """Mask a secret, showing only last 4 characters"""
+    """Mask a secret, showing only last 4 characters
+
+    Memoized: the same handful of Config values are masked on every
+    GET /api/config poll. save_config clears the cache after mutations.
+    """
     if not secret or len(secret) < 8:
         return '••••••••' if secret else ''
     return '••••••••' + secret[-4:]
 
+def _config_snapshot() -> dict:
+    """Current persistable config state as a plain dict"""
+    # Bind once: ~30 attribute reads below, each saved a LOAD_GLOBAL
+    c = Config
+    return {
+        'weather': {
+            'api_key': c.WEATHER_API_KEY,
+            'city': c.WEATHER_CITY,
+            'state': c.WEATHER_STATE,
+            'country': c.WEATHER_COUNTRY,
+            'units': c.WEATHER_UNITS
+        },
+        'calendar': {
+            'update_interval': c.CALENDAR_UPDATE_INTERVAL,
+            'max_events': c.MAX_EVENTS_DISPLAY,
+            'accounts': c.CALDAV_ACCOUNTS
+        },
+        'spotify': {
+            'client_id': c.SPOTIFY_CLIENT_ID,
+            'client_secret': c.SPOTIFY_CLIENT_SECRET,
+            'redirect_uri': c.SPOTIFY_REDIRECT_URI,
+            'access_token': c.SPOTIFY_ACCESS_TOKEN,
+            'refresh_token': c.SPOTIFY_REFRESH_TOKEN,
+            'token_expires_at': c.SPOTIFY_TOKEN_EXPIRES_AT,
+            'user_id': c.SPOTIFY_USER_ID,
+            'connected': c.SPOTIFY_CONNECTED
+        },
+        'nest': {
+            'project_id': c.NEST_PROJECT_ID,
+            'client_id': c.NEST_CLIENT_ID,
+            'client_secret': c.NEST_CLIENT_SECRET,
+            'redirect_uri': c.NEST_REDIRECT_URI,
+            'access_token': c.NEST_ACCESS_TOKEN,
+            'refresh_token': c.NEST_REFRESH_TOKEN,
+            'token_expires_at': c.NEST_TOKEN_EXPIRES_AT,
+            'connected': c.NEST_CONNECTED,
+            'last_sync': c.NEST_LAST_SYNC
+        }
+    }
+
+# Serialized form of the last config written (or loaded) - lets a no-op
+# save skip the disk entirely, which is the common case when the UI
+# re-submits masked values
+_last_config_payload = None
+
 def save_config_to_file():
     """Save current config to file for persistence across restarts"""
+    global _last_config_payload, _masked_config_cache
+    # Config may have mutated in any way that reaches persistence
+    # (UI save, OAuth connect/disconnect, token refresh) - rebuild the
+    # masked GET /api/config payload on next poll
+    _masked_config_cache = None
     try:
-        config_data = {
-            'weather': {
-                'api_key': Config.WEATHER_API_KEY,
-                'city': Config.WEATHER_CITY,
-                'state': Config.WEATHER_STATE,
-                'country': Config.WEATHER_COUNTRY,
-                'units': Config.WEATHER_UNITS
-            },
-            'calendar': {
-                'update_interval': Config.CALENDAR_UPDATE_INTERVAL,
-                'max_events': Config.MAX_EVENTS_DISPLAY,
-                'accounts': Config.CALDAV_ACCOUNTS
-            },
-            'spotify': {
-                'client_id': Config.SPOTIFY_CLIENT_ID,
-                'client_secret': Config.SPOTIFY_CLIENT_SECRET,
-                'redirect_uri': Config.SPOTIFY_REDIRECT_URI,
-                'access_token': Config.SPOTIFY_ACCESS_TOKEN,
-                'refresh_token': Config.SPOTIFY_REFRESH_TOKEN,
-                'token_expires_at': Config.SPOTIFY_TOKEN_EXPIRES_AT,
-                'user_id': Config.SPOTIFY_USER_ID,
-                'connected': Config.SPOTIFY_CONNECTED
-            },
-            'nest': {
-                'project_id': Config.NEST_PROJECT_ID,
-                'client_id': Config.NEST_CLIENT_ID,
-                'client_secret': Config.NEST_CLIENT_SECRET,
-                'redirect_uri': Config.NEST_REDIRECT_URI,
-                'access_token': Config.NEST_ACCESS_TOKEN,
-                'refresh_token': Config.NEST_REFRESH_TOKEN,
-                'token_expires_at': Config.NEST_TOKEN_EXPIRES_AT,
-                'connected': Config.NEST_CONNECTED,
-                'last_sync': Config.NEST_LAST_SYNC
-            }
-        }
-        
-        CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config_data, f, indent=2)
-        
-        logger.info(f"Config saved to {CONFIG_FILE}")
+        payload = _json_dumps(_config_snapshot())
+        if payload == _last_config_payload:
+            return
+
+        # Write to a temp file and rename over the original so a crash
+        # mid-write never leaves a truncated config.json behind
+        temp_path = CONFIG_FILE.with_suffix('.json.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+            if Config.CONFIG_DURABLE:
+                # fdatasync skips the metadata flush fsync would force;
+                # without it a power loss can lose the latest write, which
+                # is acceptable here (tokens are recoverable via re-auth)
+                f.flush()
+                os.fdatasync(f.fileno())
+        os.replace(temp_path, CONFIG_FILE)
+        _last_config_payload = payload
+
+        logger.info("Config saved to %s", CONFIG_FILE)
     except Exception as e:
-        logger.error(f"Failed to save config file: {e}")
+        logger.error("Failed to save config file: %s", e)
 
 def load_config_from_file():
     """Load config from file if it exists"""
     try:
         if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, 'r') as f:
-                data = json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                data = _json_loads(f.read())
             
             if 'weather' in data:
                 w = data['weather']
@@ -2260,18 +3038,18 @@ def load_config_from_file():
                 Config.NEST_CONNECTED = n.get('connected', Config.NEST_CONNECTED)
                 Config.NEST_LAST_SYNC = n.get('last_sync', Config.NEST_LAST_SYNC)
             
-            logger.info(f"Config loaded from {CONFIG_FILE}")
+            # Seed the dedup cache so the first unchanged save after
+            # startup is also skipped
+            global _last_config_payload
+            _last_config_payload = _json_dumps(_config_snapshot())
+
+            logger.info("Config loaded from %s", CONFIG_FILE)
     except Exception as e:
-        logger.error(f"Failed to load config file: {e}")
+        logger.error("Failed to load config file: %s", e)
 
-@app.get("/notes", response_class=HTMLResponse)
-async def notes_editor():
-    """Serve the notes editor page"""
-    note = await note_fetcher.fetch_note()
-    content = note.get('content', '')
-    last_modified = note.get('last_modified', 'Never')
-    
-    html = f'''<!DOCTYPE html>
+# /notes page template, pre-split around its two dynamic fields at import
+# so each request joins byte fragments instead of re-rendering the page
+_NOTES_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -2280,13 +3058,13 @@ async def notes_editor():
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600&display=swap" rel="stylesheet">
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Inter', -apple-system, sans-serif;
             background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%);
             min-height: 100vh;
@@ -2294,9 +3072,9 @@ async def notes_editor():
             justify-content: center;
             align-items: center;
             padding: 20px;
-        }}
+        }
         
-        .editor-container {{
+        .editor-container {
             background: rgba(255, 255, 255, 0.08);
             backdrop-filter: blur(20px);
             border-radius: 24px;
@@ -2305,9 +3083,9 @@ async def notes_editor():
             max-width: 700px;
             box-shadow: 0 25px 50px rgba(0, 0, 0, 0.3);
             border: 1px solid rgba(255, 255, 255, 0.1);
-        }}
+        }
         
-        h1 {{
+        h1 {
             color: #fff;
             font-size: 28px;
             font-weight: 600;
@@ -2315,19 +3093,19 @@ async def notes_editor():
             display: flex;
             align-items: center;
             gap: 12px;
-        }}
+        }
         
-        h1::before {{
+        h1::before {
             content: "📝";
-        }}
+        }
         
-        .subtitle {{
+        .subtitle {
             color: rgba(255, 255, 255, 0.5);
             font-size: 14px;
             margin-bottom: 30px;
-        }}
+        }
         
-        textarea {{
+        textarea {
             width: 100%;
             height: 350px;
             background: rgba(0, 0, 0, 0.3);
@@ -2341,25 +3119,25 @@ async def notes_editor():
             resize: vertical;
             outline: none;
             transition: all 0.3s ease;
-        }}
+        }
         
-        textarea:focus {{
+        textarea:focus {
             border-color: rgba(99, 179, 237, 0.5);
             box-shadow: 0 0 20px rgba(99, 179, 237, 0.2);
-        }}
+        }
         
-        textarea::placeholder {{
+        textarea::placeholder {
             color: rgba(255, 255, 255, 0.3);
-        }}
+        }
         
-        .actions {{
+        .actions {
             display: flex;
             gap: 15px;
             margin-top: 25px;
             flex-wrap: wrap;
-        }}
+        }
         
-        button {{
+        button {
             flex: 1;
             padding: 16px 24px;
             border: none;
@@ -2370,73 +3148,73 @@ async def notes_editor():
             cursor: pointer;
             transition: all 0.3s ease;
             min-width: 140px;
-        }}
+        }
         
-        .save-btn {{
+        .save-btn {
             background: linear-gradient(135deg, #48bb78 0%, #38a169 100%);
             color: white;
-        }}
+        }
         
-        .save-btn:hover {{
+        .save-btn:hover {
             transform: translateY(-2px);
             box-shadow: 0 10px 25px rgba(72, 187, 120, 0.4);
-        }}
+        }
         
-        .back-btn {{
+        .back-btn {
             background: rgba(255, 255, 255, 0.1);
             color: white;
             border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
+        }
         
-        .back-btn:hover {{
+        .back-btn:hover {
             background: rgba(255, 255, 255, 0.15);
-        }}
+        }
         
-        .status {{
+        .status {
             margin-top: 20px;
             padding: 15px;
             border-radius: 12px;
             text-align: center;
             display: none;
-        }}
+        }
         
-        .status.success {{
+        .status.success {
             display: block;
             background: rgba(72, 187, 120, 0.2);
             color: #68d391;
             border: 1px solid rgba(72, 187, 120, 0.3);
-        }}
+        }
         
-        .status.error {{
+        .status.error {
             display: block;
             background: rgba(245, 101, 101, 0.2);
             color: #fc8181;
             border: 1px solid rgba(245, 101, 101, 0.3);
-        }}
+        }
         
-        .meta {{
+        .meta {
             color: rgba(255, 255, 255, 0.4);
             font-size: 12px;
             margin-top: 15px;
-        }}
+        }
         
-        @media (max-width: 500px) {{
-            .editor-container {{
+        @media (max-width: 500px) {
+            .editor-container {
                 padding: 25px;
-            }}
-            h1 {{
+            }
+            h1 {
                 font-size: 22px;
-            }}
-            textarea {{
+            }
+            textarea {
                 height: 280px;
-            }}
-            .actions {{
+            }
+            .actions {
                 flex-direction: column;
-            }}
-            button {{
+            }
+            button {
                 width: 100%;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
@@ -2449,7 +3227,7 @@ async def notes_editor():
                 name="content" 
                 id="noteContent" 
                 placeholder="Write your notes here..."
-            >{content}</textarea>
+            >@content@</textarea>
             
             <div class="actions">
                 <button type="submit" class="save-btn">💾 Save Note</button>
@@ -2460,56 +3238,81 @@ async def notes_editor():
         </form>
         
         <div id="status" class="status"></div>
-        <p class="meta">Last modified: {last_modified}</p>
+        <p class="meta">Last modified: @last_modified@</p>
     </div>
     
     <script>
-        document.getElementById('noteForm').addEventListener('submit', async (e) => {{
+        document.getElementById('noteForm').addEventListener('submit', async (e) => {
             e.preventDefault();
             const status = document.getElementById('status');
             const content = document.getElementById('noteContent').value;
             
-            try {{
+            try {
                 const formData = new FormData();
                 formData.append('content', content);
                 
-                const response = await fetch('/api/notes', {{
+                const response = await fetch('/api/notes', {
                     method: 'POST',
                     body: formData
-                }});
+                });
                 
                 const result = await response.json();
                 
-                if (result.success) {{
+                if (result.success) {
                     status.textContent = '✓ Note saved successfully!';
                     status.className = 'status success';
-                    setTimeout(() => {{ status.className = 'status'; }}, 3000);
-                }} else {{
+                    setTimeout(() => { status.className = 'status'; }, 3000);
+                } else {
                     status.textContent = '✗ Error: ' + result.error;
                     status.className = 'status error';
-                }}
-            }} catch (err) {{
+                }
+            } catch (err) {
                 status.textContent = '✗ Error saving note: ' + err.message;
                 status.className = 'status error';
-            }}
-        }});
+            }
+        });
         
         // Auto-save with Ctrl+S / Cmd+S
-        document.addEventListener('keydown', (e) => {{
-            if ((e.ctrlKey || e.metaKey) && e.key === 's') {{
+        document.addEventListener('keydown', (e) => {
+            if ((e.ctrlKey || e.metaKey) && e.key === 's') {
                 e.preventDefault();
                 document.getElementById('noteForm').dispatchEvent(new Event('submit'));
-            }}
-        }});
+            }
+        });
     </script>
 </body>
 </html>'''
-    return HTMLResponse(content=html)
 
-@app.get("/cust", response_class=HTMLResponse)
-async def customization_page():
-    """Theme customization page"""
-    html = '''<!DOCTYPE html>
+_NOTES_PREFIX, _notes_rest = _NOTES_TEMPLATE.split('@content@', 1)
+_NOTES_MIDDLE, _NOTES_SUFFIX = _notes_rest.split('@last_modified@', 1)
+_NOTES_PREFIX = _NOTES_PREFIX.encode('utf-8')
+_NOTES_MIDDLE = _NOTES_MIDDLE.encode('utf-8')
+_NOTES_SUFFIX = _NOTES_SUFFIX.encode('utf-8')
+del _NOTES_TEMPLATE, _notes_rest
+
+@app.get("/notes", response_class=HTMLResponse)
+async def notes_editor(request: Request):
+    """Serve the notes editor page"""
+    note = await note_fetcher.fetch_note()
+    content = html_escape(note.get('content', ''))
+    last_modified = note.get('last_modified', 'Never')
+    body = b''.join((
+        _NOTES_PREFIX, content.encode('utf-8'),
+        _NOTES_MIDDLE, last_modified.encode('utf-8'),
+        _NOTES_SUFFIX,
+    ))
+    # The body varies with the note, so compress per request (it's a
+    # few KB; level 6 is cheap next to the transfer saved)
+    if 'gzip' in request.headers.get('accept-encoding', ''):
+        return Response(content=gzip.compress(body, compresslevel=6),
+                        media_type='text/html',
+                        headers={'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'})
+    return HTMLResponse(content=body)
+
+# /cust is fully static - the page is assembled once at import (the
+# theme grids are stamped from the descriptor tables below) and the
+# same bytes are handed to every response
+_CUST_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -2597,6 +3400,19 @@ async def customization_page():
             position: absolute;
             inset: 0;
             overflow: hidden;
+            /* Nothing inside a preview can move outside layout or paint,
+               so invalidation from the animating children stops here
+               (inset: 0 gives the fixed size contain: strict needs) */
+            contain: strict;
+        }
+
+        /* Applied by the IntersectionObserver / visibilitychange hooks
+           below; freezes every descendant animation while off-screen */
+        .theme-preview.anim-paused *,
+        .theme-preview.anim-paused *::before,
+        .theme-preview.tab-hidden *,
+        .theme-preview.tab-hidden *::before {
+            animation-play-state: paused !important;
         }
         
         .theme-info {
@@ -2662,7 +3478,48 @@ async def customization_page():
         }
         
         /* ========== THEME PREVIEWS ========== */
-        
+
+        /* Promote the continuously-animated children to their own
+           compositor layers so the cards tick without per-frame paint.
+           Scoped to the moving descendants only - promoting whole cards
+           would cost GPU memory for no gain. */
+        .preview-flowcean .blob,
+        .preview-aurora .wave,
+        .preview-lava .magma,
+        .preview-forest .leaf,
+        .preview-ocean .wave,
+        .preview-minimal .gradient,
+        .preview-candy .bubble,
+        .preview-photos .photo-icon,
+        .preview-stpatricks .clover-p,
+        .preview-easter .egg,
+        .preview-halloween .ghost,
+        .preview-memorial .flag-stripe,
+        .preview-labor .star-p {
+            will-change: transform;
+        }
+        .preview-nebula .cloud,
+        .preview-sunset .glow,
+        .preview-neon .line,
+        .preview-neon .glow,
+        .preview-photos .mini-photo,
+        .preview-christmas .snow,
+        .preview-christmas-eve .star,
+        .preview-newyear .confetti-p,
+        .preview-newyear .gold-burst,
+        .preview-newyears-eve .sparkle-p,
+        .preview-valentine .heart-p,
+        .preview-july4th .firework-p,
+        .preview-thanksgiving .leaf-p {
+            will-change: transform, opacity;
+        }
+
+        /* Stagger is data, not selectors: particles carry their own
+           --d inline and this single rule applies it */
+        .theme-preview [style*="--d"] {
+            animation-delay: var(--d);
+        }
+
         /* Flowcean (Original) */
         .preview-flowcean {
             background: #080a10;
@@ -2670,25 +3527,25 @@ async def customization_page():
         .preview-flowcean .blob {
             position: absolute;
             border-radius: 50%;
-            filter: blur(40px);
-            animation: flowceanMove 8s ease-in-out infinite;
+            animation: driftXY 8s ease-in-out infinite;
+            --dx: 10%; --dy: 10%; --s: 1.1;
         }
         .preview-flowcean .blob-1 {
             width: 60%; height: 60%;
             top: -10%; left: -10%;
-            background: rgba(25, 35, 55, 0.8);
+            background: radial-gradient(circle, rgba(25, 35, 55, 0.8) 0%, rgba(25, 35, 55, 0.3) 55%, transparent 80%);
             animation-delay: 0s;
         }
         .preview-flowcean .blob-2 {
             width: 50%; height: 50%;
             bottom: -10%; right: -10%;
-            background: rgba(35, 28, 50, 0.7);
+            background: radial-gradient(circle, rgba(35, 28, 50, 0.7) 0%, rgba(35, 28, 50, 0.25) 55%, transparent 80%);
             animation-delay: -2s;
         }
         .preview-flowcean .blob-3 {
             width: 40%; height: 40%;
             top: 30%; left: 30%;
-            background: rgba(40, 32, 45, 0.6);
+            background: radial-gradient(circle, rgba(40, 32, 45, 0.6) 0%, rgba(40, 32, 45, 0.2) 55%, transparent 80%);
             animation-delay: -4s;
         }
         
@@ -2707,14 +3564,11 @@ async def customization_page():
                 rgba(138, 43, 226, 0.15) 60%,
                 transparent 100%);
             animation: auroraWave 6s ease-in-out infinite;
-            filter: blur(20px);
         }
         .preview-aurora .wave:nth-child(2) {
-            animation-delay: -2s;
             opacity: 0.7;
         }
         .preview-aurora .wave:nth-child(3) {
-            animation-delay: -4s;
             opacity: 0.5;
         }
         
@@ -2725,24 +3579,23 @@ async def customization_page():
         .preview-nebula .cloud {
             position: absolute;
             border-radius: 50%;
-            filter: blur(30px);
             animation: nebulaFloat 10s ease-in-out infinite;
         }
         .preview-nebula .cloud-1 {
             width: 80%; height: 80%;
             top: -20%; left: -20%;
-            background: radial-gradient(circle, rgba(138, 43, 226, 0.4) 0%, transparent 70%);
+            background: radial-gradient(circle, rgba(138, 43, 226, 0.4) 0%, rgba(138, 43, 226, 0.15) 45%, transparent 85%);
         }
         .preview-nebula .cloud-2 {
             width: 60%; height: 60%;
             bottom: -10%; right: -10%;
-            background: radial-gradient(circle, rgba(255, 0, 128, 0.3) 0%, transparent 70%);
+            background: radial-gradient(circle, rgba(255, 0, 128, 0.3) 0%, rgba(255, 0, 128, 0.1) 45%, transparent 85%);
             animation-delay: -3s;
         }
         .preview-nebula .cloud-3 {
             width: 40%; height: 40%;
             top: 20%; right: 20%;
-            background: radial-gradient(circle, rgba(0, 150, 255, 0.3) 0%, transparent 70%);
+            background: radial-gradient(circle, rgba(0, 150, 255, 0.3) 0%, rgba(0, 150, 255, 0.1) 45%, transparent 85%);
             animation-delay: -6s;
         }
         
@@ -2753,24 +3606,23 @@ async def customization_page():
         .preview-lava .magma {
             position: absolute;
             border-radius: 50%;
-            filter: blur(35px);
             animation: lavaFlow 7s ease-in-out infinite;
         }
         .preview-lava .magma-1 {
             width: 70%; height: 70%;
             bottom: -20%; left: -10%;
-            background: radial-gradient(circle, rgba(255, 100, 0, 0.6) 0%, rgba(255, 50, 0, 0.3) 50%, transparent 70%);
+            background: radial-gradient(circle, rgba(255, 100, 0, 0.6) 0%, rgba(255, 50, 0, 0.3) 50%, transparent 85%);
         }
         .preview-lava .magma-2 {
             width: 50%; height: 50%;
             bottom: 10%; right: 0%;
-            background: radial-gradient(circle, rgba(255, 200, 0, 0.5) 0%, rgba(255, 100, 0, 0.2) 50%, transparent 70%);
+            background: radial-gradient(circle, rgba(255, 200, 0, 0.5) 0%, rgba(255, 100, 0, 0.2) 50%, transparent 85%);
             animation-delay: -2s;
         }
         .preview-lava .magma-3 {
             width: 30%; height: 30%;
             top: 20%; left: 20%;
-            background: radial-gradient(circle, rgba(255, 50, 0, 0.4) 0%, transparent 70%);
+            background: radial-gradient(circle, rgba(255, 50, 0, 0.4) 0%, rgba(255, 50, 0, 0.15) 45%, transparent 85%);
             animation-delay: -4s;
         }
         
@@ -2781,24 +3633,24 @@ async def customization_page():
         .preview-forest .leaf {
             position: absolute;
             border-radius: 50%;
-            filter: blur(40px);
-            animation: forestSway 9s ease-in-out infinite;
+            animation: driftXY 9s ease-in-out infinite;
+            --dx: 3%; --dy: 2%; --r: 2deg;
         }
         .preview-forest .leaf-1 {
             width: 60%; height: 60%;
             top: -10%; left: -10%;
-            background: rgba(34, 139, 34, 0.4);
+            background: radial-gradient(circle, rgba(34, 139, 34, 0.4) 0%, rgba(34, 139, 34, 0.15) 55%, transparent 80%);
         }
         .preview-forest .leaf-2 {
             width: 50%; height: 50%;
             bottom: -10%; right: -10%;
-            background: rgba(0, 100, 0, 0.35);
+            background: radial-gradient(circle, rgba(0, 100, 0, 0.35) 0%, rgba(0, 100, 0, 0.12) 55%, transparent 80%);
             animation-delay: -3s;
         }
         .preview-forest .leaf-3 {
             width: 40%; height: 40%;
             top: 30%; right: 10%;
-            background: rgba(50, 205, 50, 0.25);
+            background: radial-gradient(circle, rgba(50, 205, 50, 0.25) 0%, rgba(50, 205, 50, 0.08) 55%, transparent 80%);
             animation-delay: -6s;
         }
         
@@ -2809,18 +3661,18 @@ async def customization_page():
         .preview-sunset .glow {
             position: absolute;
             border-radius: 50%;
-            filter: blur(50px);
-            animation: sunsetPulse 8s ease-in-out infinite;
+            animation: pulse 8s ease-in-out infinite;
+            --o0: 0.8;
         }
         .preview-sunset .glow-1 {
             width: 100%; height: 60%;
             bottom: -20%; left: 0%;
-            background: radial-gradient(ellipse at bottom, rgba(255, 100, 50, 0.5) 0%, rgba(255, 50, 100, 0.3) 40%, transparent 70%);
+            background: radial-gradient(ellipse at bottom, rgba(255, 100, 50, 0.5) 0%, rgba(255, 50, 100, 0.3) 40%, transparent 85%);
         }
         .preview-sunset .glow-2 {
             width: 60%; height: 40%;
             bottom: 10%; left: 20%;
-            background: radial-gradient(circle, rgba(255, 200, 100, 0.4) 0%, transparent 70%);
+            background: radial-gradient(circle, rgba(255, 200, 100, 0.4) 0%, rgba(255, 200, 100, 0.15) 40%, transparent 85%);
             animation-delay: -2s;
         }
         
@@ -2835,16 +3687,13 @@ async def customization_page():
             background: linear-gradient(180deg, transparent 0%, rgba(0, 100, 200, 0.2) 50%, transparent 100%);
             border-radius: 50%;
             animation: oceanWave 5s ease-in-out infinite;
-            filter: blur(20px);
         }
         .preview-ocean .wave:nth-child(2) {
             top: 30%;
-            animation-delay: -1.5s;
             opacity: 0.7;
         }
         .preview-ocean .wave:nth-child(3) {
             top: 60%;
-            animation-delay: -3s;
             opacity: 0.5;
         }
         
@@ -2859,17 +3708,17 @@ async def customization_page():
             filter: blur(3px);
             animation: neonScan 4s linear infinite;
         }
-        .preview-neon .line:nth-child(1) { top: 20%; width: 80%; left: 10%; animation-delay: 0s; }
-        .preview-neon .line:nth-child(2) { top: 50%; width: 60%; left: 20%; animation-delay: -1s; }
-        .preview-neon .line:nth-child(3) { top: 80%; width: 70%; left: 15%; animation-delay: -2s; }
+        .preview-neon .line:nth-child(1) { top: 20%; width: 80%; left: 10%; }
+        .preview-neon .line:nth-child(2) { top: 50%; width: 60%; left: 20%; }
+        .preview-neon .line:nth-child(3) { top: 80%; width: 70%; left: 15%; }
         .preview-neon .glow {
             position: absolute;
             width: 40%; height: 40%;
             border-radius: 50%;
-            filter: blur(60px);
-            background: rgba(255, 0, 255, 0.2);
+            background: radial-gradient(circle, rgba(255, 0, 255, 0.35) 0%, rgba(255, 0, 255, 0.12) 45%, transparent 75%);
             top: 20%; left: 30%;
-            animation: neonPulse 3s ease-in-out infinite;
+            animation: pulse 3s ease-in-out infinite;
+            --s1: 1.2; --o0: 0.3; --o1: 0.5;
         }
         
         /* Minimal */
@@ -2878,7 +3727,8 @@ async def customization_page():
         }
         .preview-minimal .gradient {
             position: absolute;
-            inset: 0;
+            top: 0; left: 0;
+            width: 200%; height: 200%;
             background: linear-gradient(135deg, rgba(100, 100, 100, 0.1) 0%, transparent 50%, rgba(80, 80, 80, 0.1) 100%);
             animation: minimalShift 12s ease-in-out infinite;
         }
@@ -2890,30 +3740,29 @@ async def customization_page():
         .preview-candy .bubble {
             position: absolute;
             border-radius: 50%;
-            filter: blur(40px);
             animation: candyFloat 8s ease-in-out infinite;
         }
         .preview-candy .bubble-1 {
             width: 50%; height: 50%;
             top: -10%; left: -10%;
-            background: rgba(255, 150, 200, 0.4);
+            background: radial-gradient(circle, rgba(255, 150, 200, 0.4) 0%, rgba(255, 150, 200, 0.15) 50%, transparent 75%);
         }
         .preview-candy .bubble-2 {
             width: 40%; height: 40%;
             top: 20%; right: -5%;
-            background: rgba(150, 200, 255, 0.35);
+            background: radial-gradient(circle, rgba(150, 200, 255, 0.35) 0%, rgba(150, 200, 255, 0.12) 50%, transparent 75%);
             animation-delay: -2s;
         }
         .preview-candy .bubble-3 {
             width: 35%; height: 35%;
             bottom: -5%; left: 30%;
-            background: rgba(200, 255, 150, 0.3);
+            background: radial-gradient(circle, rgba(200, 255, 150, 0.3) 0%, rgba(200, 255, 150, 0.1) 50%, transparent 75%);
             animation-delay: -4s;
         }
         .preview-candy .bubble-4 {
             width: 30%; height: 30%;
             bottom: 20%; right: 20%;
-            background: rgba(255, 200, 100, 0.35);
+            background: radial-gradient(circle, rgba(255, 200, 100, 0.35) 0%, rgba(255, 200, 100, 0.12) 50%, transparent 75%);
             animation-delay: -6s;
         }
         
@@ -2928,7 +3777,8 @@ async def customization_page():
         .preview-photos .photo-icon {
             font-size: 2.5rem;
             margin-bottom: 0.5rem;
-            animation: photoFloat 3s ease-in-out infinite;
+            animation: driftXY 3s ease-in-out infinite;
+            --dy: -5px;
         }
         .preview-photos .photo-grid-mini {
             display: grid;
@@ -2940,25 +3790,22 @@ async def customization_page():
             aspect-ratio: 1;
             background: rgba(255, 255, 255, 0.15);
             border-radius: 4px;
-            animation: photoFade 4s ease-in-out infinite;
-        }
-        .preview-photos .mini-photo:nth-child(2) { animation-delay: -1s; }
-        .preview-photos .mini-photo:nth-child(3) { animation-delay: -2s; }
-        .preview-photos .mini-photo:nth-child(4) { animation-delay: -3s; }
-        
-        @keyframes photoFloat {
-            0%, 100% { transform: translateY(0); }
-            50% { transform: translateY(-5px); }
-        }
-        @keyframes photoFade {
-            0%, 100% { opacity: 0.3; }
-            50% { opacity: 0.8; }
+            animation: pulse 4s ease-in-out infinite;
+            --s1: 1; --o0: 0.3; --o1: 0.8;
         }
         
         /* ========== ANIMATIONS ========== */
-        @keyframes flowceanMove {
-            0%, 100% { transform: translate(0, 0) scale(1); }
-            50% { transform: translate(10%, 10%) scale(1.1); }
+
+        /* Parameterized oscillations: per-class custom properties set
+           the amplitude, collapsing a dozen near-identical keyframe
+           blocks into these two */
+        @keyframes driftXY {
+            0%, 100% { transform: translate(0, 0) rotate(0deg) scale(1); }
+            50% { transform: translate(var(--dx, 0), var(--dy, 0)) rotate(var(--r, 0deg)) scale(var(--s, 1)); }
+        }
+        @keyframes pulse {
+            0%, 100% { transform: scale(var(--s0, 1)); opacity: var(--o0, 1); }
+            50% { transform: scale(var(--s1, 1.1)); opacity: var(--o1, 1); }
         }
         @keyframes auroraWave {
             0%, 100% { transform: translateX(-25%) rotate(-5deg); }
@@ -2973,14 +3820,6 @@ async def customization_page():
             33% { transform: translate(5%, -5%) scale(1.05); }
             66% { transform: translate(-5%, 5%) scale(0.95); }
         }
-        @keyframes forestSway {
-            0%, 100% { transform: translate(0, 0) rotate(0deg); }
-            50% { transform: translate(3%, 2%) rotate(2deg); }
-        }
-        @keyframes sunsetPulse {
-            0%, 100% { transform: scale(1); opacity: 0.8; }
-            50% { transform: scale(1.1); opacity: 1; }
-        }
         @keyframes oceanWave {
             0%, 100% { transform: translateX(-25%) translateY(0); }
             50% { transform: translateX(0%) translateY(-10px); }
@@ -2991,13 +3830,11 @@ async def customization_page():
             90% { opacity: 1; }
             100% { transform: translateX(100%); opacity: 0; }
         }
-        @keyframes neonPulse {
-            0%, 100% { transform: scale(1); opacity: 0.3; }
-            50% { transform: scale(1.2); opacity: 0.5; }
-        }
         @keyframes minimalShift {
-            0%, 100% { background-position: 0% 0%; }
-            50% { background-position: 100% 100%; }
+            /* the layer is 2x the card, so -50% of itself sweeps the
+               full container without touching background-position */
+            0%, 100% { transform: translate(0, 0); }
+            50% { transform: translate(-50%, -50%); }
         }
         @keyframes candyFloat {
             0%, 100% { transform: translate(0, 0) scale(1); }
@@ -3010,6 +3847,10 @@ async def customization_page():
         
         .holiday-card {
             border: 2px solid rgba(255,255,255,0.1);
+            /* Off-screen holiday cards skip style/layout/paint entirely
+               until they scroll near the viewport */
+            content-visibility: auto;
+            contain-intrinsic-size: 280px 200px;
         }
         .holiday-card:hover {
             border-color: rgba(255,215,0,0.5);
@@ -3021,28 +3862,25 @@ async def customization_page():
         }
         .preview-christmas .snow {
             position: absolute;
-            width: 4px; height: 4px;
-            background: white;
-            border-radius: 50%;
+            top: -10%;
+            width: 16px; height: 16px;
+            background: radial-gradient(circle, white 15%, rgba(255,255,255,0.4) 30%, transparent 70%);
             animation: snowFall 3s linear infinite;
-            box-shadow: 0 0 10px rgba(255,255,255,0.8);
         }
-        .preview-christmas .snow:nth-child(1) { left: 20%; animation-delay: 0s; }
-        .preview-christmas .snow:nth-child(2) { left: 50%; animation-delay: -1s; }
-        .preview-christmas .snow:nth-child(3) { left: 80%; animation-delay: -2s; }
+        .preview-christmas .snow:nth-child(1) { left: 20%; }
+        .preview-christmas .snow:nth-child(2) { left: 50%; }
+        .preview-christmas .snow:nth-child(3) { left: 80%; }
         .preview-christmas .glow-red {
             position: absolute;
             width: 60%; height: 60%;
             bottom: -20%; left: -10%;
-            background: radial-gradient(circle, rgba(220, 20, 60, 0.4) 0%, transparent 70%);
-            filter: blur(20px);
+            background: radial-gradient(circle, rgba(220, 20, 60, 0.4) 0%, rgba(220, 20, 60, 0.15) 40%, transparent 85%);
         }
         .preview-christmas .glow-green {
             position: absolute;
             width: 50%; height: 50%;
             top: -10%; right: -10%;
-            background: radial-gradient(circle, rgba(0, 128, 0, 0.35) 0%, transparent 70%);
-            filter: blur(20px);
+            background: radial-gradient(circle, rgba(0, 128, 0, 0.35) 0%, rgba(0, 128, 0, 0.12) 40%, transparent 85%);
         }
         
         /* Christmas Eve */
@@ -3051,21 +3889,19 @@ async def customization_page():
         }
         .preview-christmas-eve .star {
             position: absolute;
-            width: 6px; height: 6px;
-            background: gold;
-            border-radius: 50%;
-            animation: starTwinkle 2s ease-in-out infinite;
-            box-shadow: 0 0 15px rgba(255,215,0,0.8);
+            width: 24px; height: 24px;
+            background: radial-gradient(circle, gold 12%, rgba(255,215,0,0.4) 30%, transparent 70%);
+            animation: pulse 2s ease-in-out infinite;
+            --s1: 0.8; --o1: 0.4;
         }
         .preview-christmas-eve .star:nth-child(1) { top: 20%; left: 30%; }
-        .preview-christmas-eve .star:nth-child(2) { top: 40%; left: 70%; animation-delay: -0.7s; }
-        .preview-christmas-eve .star:nth-child(3) { top: 60%; left: 50%; animation-delay: -1.4s; }
+        .preview-christmas-eve .star:nth-child(2) { top: 40%; left: 70%; }
+        .preview-christmas-eve .star:nth-child(3) { top: 60%; left: 50%; }
         .preview-christmas-eve .glow-gold {
             position: absolute;
             width: 80%; height: 60%;
             bottom: -20%; left: 10%;
-            background: radial-gradient(ellipse, rgba(255, 215, 0, 0.25) 0%, transparent 70%);
-            filter: blur(25px);
+            background: radial-gradient(ellipse, rgba(255, 215, 0, 0.25) 0%, rgba(255, 215, 0, 0.1) 40%, transparent 85%);
         }
         
         /* New Year */
@@ -3074,20 +3910,21 @@ async def customization_page():
         }
         .preview-newyear .confetti-p {
             position: absolute;
+            top: 80%;
             width: 8px; height: 8px;
             background: gold;
             animation: confettiPop 2s ease-out infinite;
         }
         .preview-newyear .confetti-p:nth-child(1) { left: 30%; background: #ff6b6b; }
-        .preview-newyear .confetti-p:nth-child(2) { left: 50%; background: #ffd93d; animation-delay: -0.5s; }
-        .preview-newyear .confetti-p:nth-child(3) { left: 70%; background: #6bcb77; animation-delay: -1s; }
+        .preview-newyear .confetti-p:nth-child(2) { left: 50%; background: #ffd93d; }
+        .preview-newyear .confetti-p:nth-child(3) { left: 70%; background: #6bcb77; }
         .preview-newyear .gold-burst {
             position: absolute;
             width: 70%; height: 70%;
             top: 15%; left: 15%;
-            background: radial-gradient(circle, rgba(255, 215, 0, 0.3) 0%, transparent 60%);
-            filter: blur(20px);
-            animation: burstPulse 2s ease-in-out infinite;
+            background: radial-gradient(circle, rgba(255, 215, 0, 0.3) 0%, rgba(255, 215, 0, 0.12) 35%, transparent 80%);
+            animation: pulse 2s ease-in-out infinite;
+            --s1: 1.2; --o0: 0.3; --o1: 0.5;
         }
         
         /* New Year's Eve */
@@ -3096,21 +3933,19 @@ async def customization_page():
         }
         .preview-newyears-eve .sparkle-p {
             position: absolute;
-            width: 4px; height: 4px;
-            background: white;
-            border-radius: 50%;
-            animation: sparklePop 1.5s ease-in-out infinite;
-            box-shadow: 0 0 10px gold;
+            width: 16px; height: 16px;
+            background: radial-gradient(circle, white 12%, rgba(255,215,0,0.4) 30%, transparent 70%);
+            animation: pulse 1.5s ease-in-out infinite;
+            --s0: 0.5; --s1: 1.2; --o0: 0.3;
         }
         .preview-newyears-eve .sparkle-p:nth-child(1) { top: 30%; left: 25%; }
-        .preview-newyears-eve .sparkle-p:nth-child(2) { top: 50%; left: 60%; animation-delay: -0.5s; }
-        .preview-newyears-eve .sparkle-p:nth-child(3) { top: 40%; left: 80%; animation-delay: -1s; }
+        .preview-newyears-eve .sparkle-p:nth-child(2) { top: 50%; left: 60%; }
+        .preview-newyears-eve .sparkle-p:nth-child(3) { top: 40%; left: 80%; }
         .preview-newyears-eve .champagne-glow {
             position: absolute;
             width: 60%; height: 60%;
             bottom: 0; left: 20%;
-            background: radial-gradient(circle, rgba(218, 165, 32, 0.35) 0%, transparent 70%);
-            filter: blur(25px);
+            background: radial-gradient(circle, rgba(218, 165, 32, 0.35) 0%, rgba(218, 165, 32, 0.12) 40%, transparent 85%);
         }
         
         /* Valentine's */
@@ -3119,19 +3954,19 @@ async def customization_page():
         }
         .preview-valentine .heart-p {
             position: absolute;
-            font-size: 20px;
+            top: 100%;
+            width: 20px; height: 20px;
+            background: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><path d="M12 21S4 15.7 1.5 11C-0.2 7 2 3.5 5.5 3.5c2.6 0 4.5 1.5 5.3 3.1h2.4c.8-1.6 2.7-3.1 5.3-3.1 3.5 0 5.7 3.5 4 7.5C20 15.7 12 21 12 21z" fill="%23ff1493"/></svg>') center/contain no-repeat;
             animation: heartRise 3s ease-in-out infinite;
         }
-        .preview-valentine .heart-p::before { content: '❤'; }
-        .preview-valentine .heart-p:nth-child(1) { left: 25%; animation-delay: 0s; }
-        .preview-valentine .heart-p:nth-child(2) { left: 50%; animation-delay: -1s; }
-        .preview-valentine .heart-p:nth-child(3) { left: 75%; animation-delay: -2s; }
+        .preview-valentine .heart-p:nth-child(1) { left: 25%; }
+        .preview-valentine .heart-p:nth-child(2) { left: 50%; }
+        .preview-valentine .heart-p:nth-child(3) { left: 75%; }
         .preview-valentine .pink-glow {
             position: absolute;
             width: 80%; height: 80%;
             top: 10%; left: 10%;
-            background: radial-gradient(circle, rgba(255, 20, 147, 0.3) 0%, transparent 70%);
-            filter: blur(30px);
+            background: radial-gradient(circle, rgba(255, 20, 147, 0.3) 0%, rgba(255, 20, 147, 0.1) 40%, transparent 85%);
         }
         
         /* St Patrick's */
@@ -3140,19 +3975,19 @@ async def customization_page():
         }
         .preview-stpatricks .clover-p {
             position: absolute;
-            font-size: 18px;
-            animation: cloverDance 4s ease-in-out infinite;
+            width: 18px; height: 18px;
+            background: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><g fill="%2332cd32"><circle cx="12" cy="6.5" r="4.5"/><circle cx="7" cy="13" r="4.5"/><circle cx="17" cy="13" r="4.5"/><path d="M11 14h2l1.5 8h-5z"/></g></svg>') center/contain no-repeat;
+            animation: driftXY 4s ease-in-out infinite;
+            --dy: -10px; --r: 10deg;
         }
-        .preview-stpatricks .clover-p::before { content: '☘️'; }
         .preview-stpatricks .clover-p:nth-child(1) { top: 20%; left: 30%; }
-        .preview-stpatricks .clover-p:nth-child(2) { top: 50%; left: 60%; animation-delay: -1.3s; }
-        .preview-stpatricks .clover-p:nth-child(3) { top: 70%; left: 40%; animation-delay: -2.6s; }
+        .preview-stpatricks .clover-p:nth-child(2) { top: 50%; left: 60%; }
+        .preview-stpatricks .clover-p:nth-child(3) { top: 70%; left: 40%; }
         .preview-stpatricks .green-glow {
             position: absolute;
             width: 70%; height: 70%;
             bottom: -10%; left: 15%;
-            background: radial-gradient(circle, rgba(50, 205, 50, 0.35) 0%, transparent 70%);
-            filter: blur(25px);
+            background: radial-gradient(circle, rgba(50, 205, 50, 0.35) 0%, rgba(50, 205, 50, 0.12) 40%, transparent 85%);
         }
         
         /* Easter */
@@ -3164,23 +3999,22 @@ async def customization_page():
             width: 15px; height: 20px;
             background: linear-gradient(135deg, #ffb6c1, #98fb98, #87ceeb);
             border-radius: 50% 50% 50% 50% / 60% 60% 40% 40%;
-            animation: eggBounce 3s ease-in-out infinite;
+            animation: driftXY 3s ease-in-out infinite;
+            --dy: -8px;
         }
         .preview-easter .egg:nth-child(1) { top: 40%; left: 30%; }
-        .preview-easter .egg:nth-child(2) { top: 50%; left: 60%; animation-delay: -1s; background: linear-gradient(135deg, #dda0dd, #ffd700, #ffb6c1); }
+        .preview-easter .egg:nth-child(2) { top: 50%; left: 60%; background: linear-gradient(135deg, #dda0dd, #ffd700, #ffb6c1); }
         .preview-easter .bunny-glow {
             position: absolute;
             width: 50%; height: 50%;
             top: 10%; right: 10%;
-            background: radial-gradient(circle, rgba(255, 182, 193, 0.3) 0%, transparent 70%);
-            filter: blur(20px);
+            background: radial-gradient(circle, rgba(255, 182, 193, 0.3) 0%, rgba(255, 182, 193, 0.1) 40%, transparent 85%);
         }
         .preview-easter .spring-glow {
             position: absolute;
             width: 60%; height: 50%;
             bottom: -10%; left: 20%;
-            background: radial-gradient(circle, rgba(152, 251, 152, 0.3) 0%, transparent 70%);
-            filter: blur(20px);
+            background: radial-gradient(circle, rgba(152, 251, 152, 0.3) 0%, rgba(152, 251, 152, 0.1) 40%, transparent 85%);
         }
         
         /* 4th of July */
@@ -3189,19 +4023,17 @@ async def customization_page():
         }
         .preview-july4th .firework-p {
             position: absolute;
-            width: 8px; height: 8px;
-            border-radius: 50%;
+            width: 32px; height: 32px;
             animation: fireworkExplode 2s ease-out infinite;
         }
-        .preview-july4th .firework-p:nth-child(1) { top: 30%; left: 25%; background: #ff0000; box-shadow: 0 0 20px #ff0000; }
-        .preview-july4th .firework-p:nth-child(2) { top: 40%; left: 50%; background: #ffffff; box-shadow: 0 0 20px #ffffff; animation-delay: -0.7s; }
-        .preview-july4th .firework-p:nth-child(3) { top: 35%; left: 75%; background: #0000ff; box-shadow: 0 0 20px #0000ff; animation-delay: -1.4s; }
+        .preview-july4th .firework-p:nth-child(1) { top: 30%; left: 25%; background: radial-gradient(circle, #ff0000 12%, rgba(255,0,0,0.4) 30%, transparent 70%); }
+        .preview-july4th .firework-p:nth-child(2) { top: 40%; left: 50%; background: radial-gradient(circle, #ffffff 12%, rgba(255,255,255,0.4) 30%, transparent 70%); }
+        .preview-july4th .firework-p:nth-child(3) { top: 35%; left: 75%; background: radial-gradient(circle, #0000ff 12%, rgba(0,0,255,0.4) 30%, transparent 70%); }
         .preview-july4th .usa-glow {
             position: absolute;
             width: 100%; height: 60%;
             bottom: -10%; left: 0;
-            background: linear-gradient(90deg, rgba(255,0,0,0.2), rgba(255,255,255,0.2), rgba(0,0,255,0.2));
-            filter: blur(30px);
+            background: linear-gradient(90deg, transparent 0%, rgba(255,0,0,0.2) 20%, rgba(255,255,255,0.2) 50%, rgba(0,0,255,0.2) 80%, transparent 100%);
         }
         
         /* Halloween */
@@ -3212,22 +4044,33 @@ async def customization_page():
             position: absolute;
             top: 50%; left: 30%;
             font-size: 30px;
-            animation: pumpkinGlow 2s ease-in-out infinite;
         }
         .preview-halloween .pumpkin::before { content: '🎃'; }
+        /* The glow is a brighter copy rasterized once (static filter)
+           and cross-faded on top - opacity is compositor-only, unlike
+           the old animated brightness() shader */
+        .preview-halloween .pumpkin::after {
+            content: '🎃';
+            position: absolute;
+            top: 0; left: 0;
+            filter: brightness(1.3);
+            opacity: 0;
+            animation: pulse 2s ease-in-out infinite;
+            --s1: 1; --o0: 0;
+        }
         .preview-halloween .ghost {
             position: absolute;
             top: 30%; right: 25%;
             font-size: 25px;
-            animation: ghostFloat 3s ease-in-out infinite;
+            animation: driftXY 3s ease-in-out infinite;
+            --dx: 5px; --dy: -10px;
         }
         .preview-halloween .ghost::before { content: '👻'; }
         .preview-halloween .spooky-glow {
             position: absolute;
             width: 80%; height: 60%;
             bottom: 0; left: 10%;
-            background: radial-gradient(ellipse, rgba(255, 140, 0, 0.3) 0%, rgba(138, 43, 226, 0.2) 50%, transparent 70%);
-            filter: blur(25px);
+            background: radial-gradient(ellipse, rgba(255, 140, 0, 0.3) 0%, rgba(138, 43, 226, 0.2) 50%, transparent 85%);
         }
         
         /* Thanksgiving */
@@ -3236,6 +4079,7 @@ async def customization_page():
         }
         .preview-thanksgiving .leaf-p {
             position: absolute;
+            top: -10%;
             font-size: 20px;
             animation: leafFall 4s ease-in-out infinite;
         }
@@ -3243,14 +4087,13 @@ async def customization_page():
         .preview-thanksgiving .leaf-p:nth-child(2)::before { content: '🍁'; }
         .preview-thanksgiving .leaf-p:nth-child(3)::before { content: '🍂'; }
         .preview-thanksgiving .leaf-p:nth-child(1) { left: 25%; }
-        .preview-thanksgiving .leaf-p:nth-child(2) { left: 55%; animation-delay: -1.3s; }
-        .preview-thanksgiving .leaf-p:nth-child(3) { left: 80%; animation-delay: -2.6s; }
+        .preview-thanksgiving .leaf-p:nth-child(2) { left: 55%; }
+        .preview-thanksgiving .leaf-p:nth-child(3) { left: 80%; }
         .preview-thanksgiving .autumn-glow {
             position: absolute;
             width: 70%; height: 70%;
             bottom: -20%; left: 15%;
-            background: radial-gradient(circle, rgba(210, 105, 30, 0.4) 0%, transparent 70%);
-            filter: blur(25px);
+            background: radial-gradient(circle, rgba(210, 105, 30, 0.4) 0%, rgba(210, 105, 30, 0.15) 40%, transparent 85%);
         }
         
         /* Memorial Day */
@@ -3264,13 +4107,12 @@ async def customization_page():
             animation: flagWave 3s ease-in-out infinite;
         }
         .preview-memorial .flag-stripe:nth-child(1) { top: 30%; background: rgba(178, 34, 52, 0.6); }
-        .preview-memorial .flag-stripe:nth-child(2) { top: 50%; background: rgba(255, 255, 255, 0.4); animation-delay: -0.5s; }
+        .preview-memorial .flag-stripe:nth-child(2) { top: 50%; background: rgba(255, 255, 255, 0.4); }
         .preview-memorial .patriot-glow {
             position: absolute;
             width: 60%; height: 60%;
             bottom: -10%; left: 20%;
-            background: radial-gradient(circle, rgba(0, 40, 104, 0.4) 0%, transparent 70%);
-            filter: blur(25px);
+            background: radial-gradient(circle, rgba(0, 40, 104, 0.4) 0%, rgba(0, 40, 104, 0.15) 40%, transparent 85%);
         }
         
         /* Labor Day */
@@ -3281,71 +4123,44 @@ async def customization_page():
             position: absolute;
             width: 60%; height: 60%;
             top: 20%; left: 20%;
-            background: radial-gradient(circle, rgba(65, 105, 225, 0.35) 0%, transparent 70%);
-            filter: blur(25px);
+            background: radial-gradient(circle, rgba(65, 105, 225, 0.35) 0%, rgba(65, 105, 225, 0.12) 40%, transparent 85%);
         }
         .preview-labor .star-p {
             position: absolute;
-            font-size: 18px;
+            width: 18px; height: 18px;
+            background: url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><polygon points="12 1.5 15.1 8.6 22.5 9.3 16.8 14.2 18.6 21.7 12 17.6 5.4 21.7 7.2 14.2 1.5 9.3 8.9 8.6" fill="%23ffd700"/></svg>') center/contain no-repeat;
             animation: starSpin 4s linear infinite;
         }
-        .preview-labor .star-p::before { content: '⭐'; }
         .preview-labor .star-p:nth-child(2) { top: 25%; left: 60%; }
-        .preview-labor .star-p:nth-child(3) { top: 60%; left: 30%; animation-delay: -2s; }
+        .preview-labor .star-p:nth-child(3) { top: 60%; left: 30%; }
         
         /* Holiday animations */
         @keyframes snowFall {
-            0% { top: -10%; opacity: 0; }
+            /* translate instead of top: stays compositor-only. The card
+               clips overflow, so overshooting the height is harmless. */
+            0% { transform: translateY(0); opacity: 0; }
             10% { opacity: 1; }
-            100% { top: 100%; opacity: 0; }
-        }
-        @keyframes starTwinkle {
-            0%, 100% { opacity: 1; transform: scale(1); }
-            50% { opacity: 0.4; transform: scale(0.8); }
+            100% { transform: translateY(260px); opacity: 0; }
         }
         @keyframes confettiPop {
-            0% { top: 80%; opacity: 0; transform: rotate(0deg); }
+            0% { transform: translateY(0) rotate(0deg); opacity: 0; }
             50% { opacity: 1; }
-            100% { top: 20%; opacity: 0; transform: rotate(360deg); }
-        }
-        @keyframes burstPulse {
-            0%, 100% { transform: scale(1); opacity: 0.3; }
-            50% { transform: scale(1.2); opacity: 0.5; }
-        }
-        @keyframes sparklePop {
-            0%, 100% { transform: scale(0.5); opacity: 0.3; }
-            50% { transform: scale(1.2); opacity: 1; }
+            100% { transform: translateY(-120px) rotate(360deg); opacity: 0; }
         }
         @keyframes heartRise {
-            0% { top: 100%; opacity: 0; }
+            0% { transform: translateY(0); opacity: 0; }
             50% { opacity: 1; }
-            100% { top: -10%; opacity: 0; }
-        }
-        @keyframes cloverDance {
-            0%, 100% { transform: translateY(0) rotate(0deg); }
-            50% { transform: translateY(-10px) rotate(10deg); }
-        }
-        @keyframes eggBounce {
-            0%, 100% { transform: translateY(0); }
-            50% { transform: translateY(-8px); }
+            100% { transform: translateY(-260px); opacity: 0; }
         }
         @keyframes fireworkExplode {
             0% { transform: scale(0.5); opacity: 0; }
             50% { transform: scale(1.5); opacity: 1; }
             100% { transform: scale(2); opacity: 0; }
         }
-        @keyframes pumpkinGlow {
-            0%, 100% { filter: brightness(1); }
-            50% { filter: brightness(1.3); }
-        }
-        @keyframes ghostFloat {
-            0%, 100% { transform: translateY(0) translateX(0); }
-            50% { transform: translateY(-10px) translateX(5px); }
-        }
         @keyframes leafFall {
-            0% { top: -10%; opacity: 0; transform: rotate(0deg) translateX(0); }
+            0% { transform: translate(0, 0) rotate(0deg); opacity: 0; }
             50% { opacity: 1; }
-            100% { top: 100%; opacity: 0; transform: rotate(360deg) translateX(30px); }
+            100% { transform: translate(30px, 260px) rotate(360deg); opacity: 0; }
         }
         @keyframes flagWave {
             0%, 100% { transform: skewX(0deg); }
@@ -3356,6 +4171,38 @@ async def customization_page():
             100% { transform: rotate(360deg); }
         }
         
+        /* On pointer devices only the hovered card animates, so the grid
+           at rest is static composited quads. Touch devices keep their
+           animations and rely on the IntersectionObserver pausing. */
+        @media (hover: hover) {
+            .theme-card:not(:hover) .theme-preview,
+            .theme-card:not(:hover) .theme-preview *,
+            .theme-card:not(:hover) .theme-preview *::before {
+                animation-play-state: paused !important;
+            }
+        }
+
+        /* The blurred drift layers are pure ambiance - quantizing their
+           timing into steps collapses a full-refresh-rate animation (4x
+           the frames on a 240Hz panel) into ~20 composites per cycle.
+           Scoped to unhovered cards so the one being inspected stays
+           smooth; mainly matters on touch, where hover never pauses. */
+        .theme-card:not(:hover) .blob,
+        .theme-card:not(:hover) .cloud,
+        .theme-card:not(:hover) .magma {
+            animation-timing-function: steps(20, end);
+        }
+
+        /* Reduced-motion users get fully static previews */
+        @media (prefers-reduced-motion: reduce) {
+            .theme-preview,
+            .theme-preview *,
+            .theme-preview *::before,
+            .theme-preview *::after {
+                animation: none !important;
+            }
+        }
+
         @media (max-width: 600px) {
             body { padding: 20px 15px; }
             .themes-grid { gap: 15px; }
@@ -3377,162 +4224,7 @@ async def customization_page():
         </div>
         
         <div class="themes-grid" id="themesGrid">
-            <!-- Flowcean -->
-            <div class="theme-card" data-theme="flowcean">
-                <div class="theme-preview preview-flowcean">
-                    <div class="blob blob-1"></div>
-                    <div class="blob blob-2"></div>
-                    <div class="blob blob-3"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">Flowcean</div>
-                    <div class="theme-desc">Organic flowing shapes</div>
-                </div>
-                <div class="theme-badge">Active</div>
-            </div>
-            
-            <!-- Aurora -->
-            <div class="theme-card" data-theme="aurora">
-                <div class="theme-preview preview-aurora">
-                    <div class="wave"></div>
-                    <div class="wave"></div>
-                    <div class="wave"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">Aurora</div>
-                    <div class="theme-desc">Northern lights waves</div>
-                </div>
-                <div class="theme-badge">Active</div>
-            </div>
-            
-            <!-- Nebula -->
-            <div class="theme-card" data-theme="nebula">
-                <div class="theme-preview preview-nebula">
-                    <div class="cloud cloud-1"></div>
-                    <div class="cloud cloud-2"></div>
-                    <div class="cloud cloud-3"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">Nebula</div>
-                    <div class="theme-desc">Cosmic cloud swirls</div>
-                </div>
-                <div class="theme-badge">Active</div>
-            </div>
-            
-            <!-- Lava -->
-            <div class="theme-card" data-theme="lava">
-                <div class="theme-preview preview-lava">
-                    <div class="magma magma-1"></div>
-                    <div class="magma magma-2"></div>
-                    <div class="magma magma-3"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">Lava</div>
-                    <div class="theme-desc">Molten fire flows</div>
-                </div>
-                <div class="theme-badge">Active</div>
-            </div>
-            
-            <!-- Forest -->
-            <div class="theme-card" data-theme="forest">
-                <div class="theme-preview preview-forest">
-                    <div class="leaf leaf-1"></div>
-                    <div class="leaf leaf-2"></div>
-                    <div class="leaf leaf-3"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">Forest</div>
-                    <div class="theme-desc">Peaceful nature greens</div>
-                </div>
-                <div class="theme-badge">Active</div>
-            </div>
-            
-            <!-- Sunset -->
-            <div class="theme-card" data-theme="sunset">
-                <div class="theme-preview preview-sunset">
-                    <div class="glow glow-1"></div>
-                    <div class="glow glow-2"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">Sunset</div>
-                    <div class="theme-desc">Warm golden hour glow</div>
-                </div>
-                <div class="theme-badge">Active</div>
-            </div>
-            
-            <!-- Ocean -->
-            <div class="theme-card" data-theme="ocean">
-                <div class="theme-preview preview-ocean">
-                    <div class="wave"></div>
-                    <div class="wave"></div>
-                    <div class="wave"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">Ocean</div>
-                    <div class="theme-desc">Deep sea waves</div>
-                </div>
-                <div class="theme-badge">Active</div>
-            </div>
-            
-            <!-- Neon -->
-            <div class="theme-card" data-theme="neon">
-                <div class="theme-preview preview-neon">
-                    <div class="line"></div>
-                    <div class="line"></div>
-                    <div class="line"></div>
-                    <div class="glow"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">Neon</div>
-                    <div class="theme-desc">Cyberpunk glow lines</div>
-                </div>
-                <div class="theme-badge">Active</div>
-            </div>
-            
-            <!-- Minimal -->
-            <div class="theme-card" data-theme="minimal">
-                <div class="theme-preview preview-minimal">
-                    <div class="gradient"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">Minimal</div>
-                    <div class="theme-desc">Clean subtle gradients</div>
-                </div>
-                <div class="theme-badge">Active</div>
-            </div>
-            
-            <!-- Candy -->
-            <div class="theme-card" data-theme="candy">
-                <div class="theme-preview preview-candy">
-                    <div class="bubble bubble-1"></div>
-                    <div class="bubble bubble-2"></div>
-                    <div class="bubble bubble-3"></div>
-                    <div class="bubble bubble-4"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">Candy</div>
-                    <div class="theme-desc">Playful pastel bubbles</div>
-                </div>
-                <div class="theme-badge">Active</div>
-            </div>
-            
-            <!-- Photos -->
-            <div class="theme-card" data-theme="photos">
-                <div class="theme-preview preview-photos">
-                    <div class="photo-icon">🖼️</div>
-                    <div class="photo-grid-mini">
-                        <div class="mini-photo"></div>
-                        <div class="mini-photo"></div>
-                        <div class="mini-photo"></div>
-                        <div class="mini-photo"></div>
-                    </div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">Photos</div>
-                    <div class="theme-desc">Your photo slideshow</div>
-                </div>
-                <div class="theme-badge">Active</div>
-            </div>
+__THEMES_GRID__
         </div>
         
         <h2 style="text-align: center; margin: 50px 0 30px; color: rgba(255,255,255,0.7); font-size: 1.5rem;">
@@ -3540,171 +4232,7 @@ async def customization_page():
         </h2>
         
         <div class="themes-grid" id="holidayGrid">
-            <!-- Christmas -->
-            <div class="theme-card holiday-card" data-holiday="christmas">
-                <div class="theme-preview preview-christmas">
-                    <div class="snow"></div>
-                    <div class="snow"></div>
-                    <div class="snow"></div>
-                    <div class="glow-red"></div>
-                    <div class="glow-green"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">🎄 Christmas</div>
-                    <div class="theme-desc">Dec 25 • Winter wonderland</div>
-                </div>
-            </div>
-            
-            <!-- Christmas Eve -->
-            <div class="theme-card holiday-card" data-holiday="christmas-eve">
-                <div class="theme-preview preview-christmas-eve">
-                    <div class="star"></div>
-                    <div class="star"></div>
-                    <div class="star"></div>
-                    <div class="glow-gold"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">✨ Christmas Eve</div>
-                    <div class="theme-desc">Dec 24 • Magical anticipation</div>
-                </div>
-            </div>
-            
-            <!-- New Year's Day -->
-            <div class="theme-card holiday-card" data-holiday="newyear">
-                <div class="theme-preview preview-newyear">
-                    <div class="confetti-p"></div>
-                    <div class="confetti-p"></div>
-                    <div class="confetti-p"></div>
-                    <div class="gold-burst"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">🎉 New Year's Day</div>
-                    <div class="theme-desc">Jan 1 • Celebration & joy</div>
-                </div>
-            </div>
-            
-            <!-- New Year's Eve -->
-            <div class="theme-card holiday-card" data-holiday="newyears-eve">
-                <div class="theme-preview preview-newyears-eve">
-                    <div class="sparkle-p"></div>
-                    <div class="sparkle-p"></div>
-                    <div class="sparkle-p"></div>
-                    <div class="champagne-glow"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">🥂 New Year's Eve</div>
-                    <div class="theme-desc">Dec 31 • Glamour night</div>
-                </div>
-            </div>
-            
-            <!-- Valentine's Day -->
-            <div class="theme-card holiday-card" data-holiday="valentine">
-                <div class="theme-preview preview-valentine">
-                    <div class="heart-p"></div>
-                    <div class="heart-p"></div>
-                    <div class="heart-p"></div>
-                    <div class="pink-glow"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">💕 Valentine's Day</div>
-                    <div class="theme-desc">Feb 14 • Romance & love</div>
-                </div>
-            </div>
-            
-            <!-- St. Patrick's Day -->
-            <div class="theme-card holiday-card" data-holiday="stpatricks">
-                <div class="theme-preview preview-stpatricks">
-                    <div class="clover-p"></div>
-                    <div class="clover-p"></div>
-                    <div class="clover-p"></div>
-                    <div class="green-glow"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">☘️ St. Patrick's Day</div>
-                    <div class="theme-desc">Mar 17 • Irish luck</div>
-                </div>
-            </div>
-            
-            <!-- Easter -->
-            <div class="theme-card holiday-card" data-holiday="easter">
-                <div class="theme-preview preview-easter">
-                    <div class="egg"></div>
-                    <div class="egg"></div>
-                    <div class="bunny-glow"></div>
-                    <div class="spring-glow"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">🐰 Easter</div>
-                    <div class="theme-desc">Varies • Spring renewal</div>
-                </div>
-            </div>
-            
-            <!-- 4th of July -->
-            <div class="theme-card holiday-card" data-holiday="july4th">
-                <div class="theme-preview preview-july4th">
-                    <div class="firework-p"></div>
-                    <div class="firework-p"></div>
-                    <div class="firework-p"></div>
-                    <div class="usa-glow"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">🇺🇸 4th of July</div>
-                    <div class="theme-desc">Jul 4 • Patriotic celebration</div>
-                </div>
-            </div>
-            
-            <!-- Halloween -->
-            <div class="theme-card holiday-card" data-holiday="halloween">
-                <div class="theme-preview preview-halloween">
-                    <div class="pumpkin"></div>
-                    <div class="ghost"></div>
-                    <div class="spooky-glow"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">🎃 Halloween</div>
-                    <div class="theme-desc">Oct 31 • Spooky vibes</div>
-                </div>
-            </div>
-            
-            <!-- Thanksgiving -->
-            <div class="theme-card holiday-card" data-holiday="thanksgiving">
-                <div class="theme-preview preview-thanksgiving">
-                    <div class="leaf-p"></div>
-                    <div class="leaf-p"></div>
-                    <div class="leaf-p"></div>
-                    <div class="autumn-glow"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">🦃 Thanksgiving</div>
-                    <div class="theme-desc">4th Thu Nov • Gratitude</div>
-                </div>
-            </div>
-            
-            <!-- Memorial Day -->
-            <div class="theme-card holiday-card" data-holiday="memorial">
-                <div class="theme-preview preview-memorial">
-                    <div class="flag-stripe"></div>
-                    <div class="flag-stripe"></div>
-                    <div class="patriot-glow"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">🎖️ Memorial Day</div>
-                    <div class="theme-desc">Last Mon May • Honor</div>
-                </div>
-            </div>
-            
-            <!-- Labor Day -->
-            <div class="theme-card holiday-card" data-holiday="labor">
-                <div class="theme-preview preview-labor">
-                    <div class="worker-glow"></div>
-                    <div class="star-p"></div>
-                    <div class="star-p"></div>
-                </div>
-                <div class="theme-info">
-                    <div class="theme-name">💪 Labor Day</div>
-                    <div class="theme-desc">1st Mon Sep • Workers</div>
-                </div>
-            </div>
+__HOLIDAY_GRID__
         </div>
         
         <p style="text-align: center; color: rgba(255,255,255,0.4); margin: 20px 0 40px; font-size: 0.9rem;">
@@ -3769,10 +4297,129 @@ async def customization_page():
                 window.location.href = '/?preview_holiday=' + holiday;
             });
         });
+
+        // Pause preview animations while their card is off-screen (and
+        // while the tab is hidden) - only the visible cards tick
+        const previewObserver = new IntersectionObserver(entries => {
+            entries.forEach(entry => {
+                entry.target.classList.toggle('anim-paused', !entry.isIntersecting);
+            });
+        }, { rootMargin: '100px' });
+        document.querySelectorAll('.theme-preview').forEach(p => previewObserver.observe(p));
+
+        document.addEventListener('visibilitychange', () => {
+            document.querySelectorAll('.theme-preview').forEach(p => {
+                p.classList.toggle('tab-hidden', document.hidden);
+            });
+        });
     </script>
 </body>
 </html>'''
-    return HTMLResponse(content=html)
+
+# The two grids used to be 20+ hand-written, near-identical card blocks;
+# they are stamped from these descriptors instead.  A child spec is a
+# CSS class, a (class, delay) pair - the delay lands in the inline --d
+# custom property the stylesheet maps to animation-delay - or a raw
+# '<...' HTML snippet for the odd nested preview.
+_THEMES = (
+    ('flowcean', 'Flowcean', 'Organic flowing shapes',
+     ('blob blob-1', 'blob blob-2', 'blob blob-3')),
+    ('aurora', 'Aurora', 'Northern lights waves',
+     ('wave', ('wave', '-2s'), ('wave', '-4s'))),
+    ('nebula', 'Nebula', 'Cosmic cloud swirls',
+     ('cloud cloud-1', 'cloud cloud-2', 'cloud cloud-3')),
+    ('lava', 'Lava', 'Molten fire flows',
+     ('magma magma-1', 'magma magma-2', 'magma magma-3')),
+    ('forest', 'Forest', 'Peaceful nature greens',
+     ('leaf leaf-1', 'leaf leaf-2', 'leaf leaf-3')),
+    ('sunset', 'Sunset', 'Warm golden hour glow',
+     ('glow glow-1', 'glow glow-2')),
+    ('ocean', 'Ocean', 'Deep sea waves',
+     ('wave', ('wave', '-1.5s'), ('wave', '-3s'))),
+    ('neon', 'Neon', 'Cyberpunk glow lines',
+     ('line', ('line', '-1s'), ('line', '-2s'), 'glow')),
+    ('minimal', 'Minimal', 'Clean subtle gradients',
+     ('gradient',)),
+    ('candy', 'Candy', 'Playful pastel bubbles',
+     ('bubble bubble-1', 'bubble bubble-2', 'bubble bubble-3', 'bubble bubble-4')),
+    ('photos', 'Photos', 'Your photo slideshow',
+     ('<div class="photo-icon">🖼️</div>',
+      '<div class="photo-grid-mini">'
+      '<div class="mini-photo"></div>'
+      '<div class="mini-photo" style="--d:-1s"></div>'
+      '<div class="mini-photo" style="--d:-2s"></div>'
+      '<div class="mini-photo" style="--d:-3s"></div>'
+      '</div>')),
+)
+
+_HOLIDAY_THEMES = (
+    ('christmas', '🎄 Christmas', 'Dec 25 • Winter wonderland',
+     ('snow', ('snow', '-1s'), ('snow', '-2s'), 'glow-red', 'glow-green')),
+    ('christmas-eve', '✨ Christmas Eve', 'Dec 24 • Magical anticipation',
+     ('star', ('star', '-0.7s'), ('star', '-1.4s'), 'glow-gold')),
+    ('newyear', '🎉 New Year\'s Day', 'Jan 1 • Celebration & joy',
+     ('confetti-p', ('confetti-p', '-0.5s'), ('confetti-p', '-1s'), 'gold-burst')),
+    ('newyears-eve', '🥂 New Year\'s Eve', 'Dec 31 • Glamour night',
+     ('sparkle-p', ('sparkle-p', '-0.5s'), ('sparkle-p', '-1s'), 'champagne-glow')),
+    ('valentine', '💕 Valentine\'s Day', 'Feb 14 • Romance & love',
+     ('heart-p', ('heart-p', '-1s'), ('heart-p', '-2s'), 'pink-glow')),
+    ('stpatricks', '☘️ St. Patrick\'s Day', 'Mar 17 • Irish luck',
+     ('clover-p', ('clover-p', '-1.3s'), ('clover-p', '-2.6s'), 'green-glow')),
+    ('easter', '🐰 Easter', 'Varies • Spring renewal',
+     ('egg', ('egg', '-1s'), 'bunny-glow', 'spring-glow')),
+    ('july4th', '🇺🇸 4th of July', 'Jul 4 • Patriotic celebration',
+     ('firework-p', ('firework-p', '-0.7s'), ('firework-p', '-1.4s'), 'usa-glow')),
+    ('halloween', '🎃 Halloween', 'Oct 31 • Spooky vibes',
+     ('pumpkin', 'ghost', 'spooky-glow')),
+    ('thanksgiving', '🦃 Thanksgiving', '4th Thu Nov • Gratitude',
+     ('leaf-p', ('leaf-p', '-1.3s'), ('leaf-p', '-2.6s'), 'autumn-glow')),
+    ('memorial', '🎖️ Memorial Day', 'Last Mon May • Honor',
+     ('flag-stripe', ('flag-stripe', '-0.5s'), 'patriot-glow')),
+    ('labor', '💪 Labor Day', '1st Mon Sep • Workers',
+     ('worker-glow', 'star-p', ('star-p', '-2s'))),
+)
+
+def _preview_children(specs):
+    parts = []
+    for spec in specs:
+        if isinstance(spec, tuple):
+            parts.append(f'<div class="{spec[0]}" style="--d:{spec[1]}"></div>')
+        elif spec.startswith('<'):
+            parts.append(spec)
+        else:
+            parts.append(f'<div class="{spec}"></div>')
+    return ''.join(parts)
+
+def _theme_card(theme_id, name, desc, children, holiday=False):
+    card_cls = 'theme-card holiday-card' if holiday else 'theme-card'
+    attr = 'data-holiday' if holiday else 'data-theme'
+    badge = '' if holiday else '<div class="theme-badge">Active</div>'
+    return (
+        f'<div class="{card_cls}" {attr}="{theme_id}">'
+        f'<div class="theme-preview preview-{theme_id}">{_preview_children(children)}</div>'
+        f'<div class="theme-info"><div class="theme-name">{name}</div>'
+        f'<div class="theme-desc">{desc}</div></div>{badge}</div>'
+    )
+
+_CUST_HTML = (
+    _CUST_TEMPLATE
+    .replace('__THEMES_GRID__',
+             '\n'.join(_theme_card(*t) for t in _THEMES))
+    .replace('__HOLIDAY_GRID__',
+             '\n'.join(_theme_card(*t, holiday=True) for t in _HOLIDAY_THEMES))
+).encode('utf-8')
+
+# Compressed once at import; ~5x fewer bytes on the wire for clients
+# that accept gzip (all of them, in practice)
+_CUST_GZ = gzip.compress(_CUST_HTML, compresslevel=6)
+
+@app.get("/cust", response_class=HTMLResponse)
+async def customization_page(request: Request):
+    """Theme customization page"""
+    if 'gzip' in request.headers.get('accept-encoding', ''):
+        return Response(content=_CUST_GZ, media_type='text/html',
+                        headers={'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'})
+    return HTMLResponse(content=_CUST_HTML)
 
 @app.get("/api/time")
 async def get_time():
@@ -4001,8 +4648,7 @@ async def websocket_endpoint(websocket: WebSocket):
         # Send initial Jarvis briefing
         initial_weather = await weather_fetcher.fetch_weather()
         initial_events = await calendar_fetcher.fetch_events()
-        initial_today = [e for e in initial_events if e.get('is_today', False)]
-        initial_upcoming = [e for e in initial_events if e.get('is_upcoming', False)]
+        initial_today, initial_upcoming = _split_events(initial_events)
         
         jarvis_briefing = await jarvis_agent.generate_briefing(
             weather=initial_weather,
@@ -4044,8 +4690,7 @@ async def websocket_endpoint(websocket: WebSocket):
             upcoming_events = []
             if now.minute % 5 == 0:
                 events_data = await calendar_fetcher.fetch_events()
-                today_events = [e for e in events_data if e.get('is_today', False)]
-                upcoming_events = [e for e in events_data if e.get('is_upcoming', False)]
+                today_events, upcoming_events = _split_events(events_data)
 
                 await websocket.send_json({
                     'type': 'calendar',
@@ -4067,8 +4712,7 @@ async def websocket_endpoint(websocket: WebSocket):
                 weather_data = await weather_fetcher.fetch_weather()
             if events_data is None:
                 events_data = await calendar_fetcher.fetch_events()
-                today_events = [e for e in events_data if e.get('is_today', False)]
-                upcoming_events = [e for e in events_data if e.get('is_upcoming', False)]
+                today_events, upcoming_events = _split_events(events_data)
             
             jarvis_briefing = await jarvis_agent.generate_briefing(
                 weather=weather_data,
@@ -4841,7 +5485,7 @@ async def homehub_devices():
 async def homehub_permit_join(request: Request):
     """Enable/disable device pairing mode"""
     try:
-        data = await request.json()
+        data = _json_loads(await request.body())
         duration = data.get('duration', 120)
         
         success = homehub_manager.permit_join(duration)
@@ -4859,7 +5503,7 @@ async def homehub_permit_join(request: Request):
 async def homehub_device_command(device_id: str, request: Request):
     """Send command to a device"""
     try:
-        command = await request.json()
+        command = _json_loads(await request.body())
         success = homehub_manager.send_device_command(device_id, command)
         
         if success:
@@ -4909,7 +5553,7 @@ async def homehub_remove_device(device_id: str, force: bool = True):
 async def homehub_rename_device(device_id: str, request: Request):
     """Rename a device"""
     try:
-        data = await request.json()
+        data = _json_loads(await request.body())
         new_name = data.get('name', '')
         
         if not new_name:
@@ -4939,7 +5583,7 @@ async def homehub_get_settings():
 async def homehub_save_settings(request: Request):
     """Save Home Hub settings"""
     try:
-        new_settings = await request.json()
+        new_settings = _json_loads(await request.body())
         homehub_manager.update_settings(new_settings)
         
         # Reconnect MQTT if settings changed
@@ -5016,7 +5660,7 @@ async def get_temp_settings():
 @app.post("/api/homehub/temp-settings")
 async def update_temp_settings(request: Request):
     """Update temperature logging settings"""
-    data = await request.json()
+    data = _json_loads(await request.body())
     
     if 'enabled' in data:
         homehub_manager.settings['temp_logging_enabled'] = bool(data['enabled'])
@@ -6378,7 +7022,7 @@ async def achub_get_config():
 @app.post("/api/achub/config")
 async def achub_update_config(request: Request):
     """Update AC Hub configuration"""
-    data = await request.json()
+    data = _json_loads(await request.body())
     achub_manager.update_config(data)
     return {'success': True, 'config': achub_manager.get_config()}
 
@@ -6418,7 +7062,7 @@ async def achub_history(hours: int = 24):
 @app.post("/api/achub/server-watts")
 async def submit_server_watts(request: Request):
     """Submit a server watts reading"""
-    data = await request.json()
+    data = _json_loads(await request.body())
     watts = data.get('watts')
     source = data.get('source', 'manual')
     
@@ -6472,6 +7116,14 @@ async def startup_event():
     weather_fetcher = WeatherFetcher()
     calendar_fetcher = CalendarFetcher()
 
+    # Refresh saved OAuth tokens now and keep them fresh in the background
+    if SpotifyManager.is_connected():
+        asyncio.create_task(SpotifyManager.refresh_token())
+        SpotifyManager.start_token_refresher()
+    if NestManager.is_connected():
+        asyncio.create_task(NestManager.refresh_token())
+        NestManager.start_token_refresher()
+
     # Pre-fetch data
     await weather_fetcher.fetch_weather()
     await calendar_fetcher.fetch_events()
@@ -6493,6 +7145,20 @@ async def startup_event():
     except Exception as e:
         logger.warning(f"Home Hub: Could not connect: {e}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources on shutdown"""
+    await http_client.aclose()
+    await jarvis_http_client.aclose()
+    # Flush any config changes still inside the debounce window; the
+    # payload dedup makes this a no-op when nothing is pending
+    if _config_flush_task is not None and not _config_flush_task.done():
+        _config_flush_task.cancel()
+    save_config_to_file()
+    # Drain and stop the logging listener thread last so shutdown
+    # messages still make it out
+    _log_listener.stop()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")